@@ -0,0 +1,70 @@
+import asyncio
+from typing import ClassVar, Union
+from functools import partial
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from pyjx.api.client import Client
+
+
+class AsyncClient:
+    """Variante asíncrona de Client con la misma interfaz get/post/put/delete.
+
+    Cada petición se ejecuta en un hilo de un executor propio sobre la sesión compartida de
+    Client, así que reutiliza su pool de conexiones y su configuración, y lanza los mismos
+    ClientError/ServerError.
+
+    Examples:
+        >>> issue = await AsyncClient.get("rest/api/2/issue/PJX-1")
+    """
+    __max_workers: ClassVar = 10
+    __executor: ClassVar[Union[ThreadPoolExecutor, None]] = None
+    __executor_lock: ClassVar = Lock()
+
+    @classmethod
+    def configure(cls, max_workers: int = 10) -> None:
+        """Configura la cantidad máxima de peticiones que pueden estar en curso a la vez.
+
+        Conviene que coincida con `pool_maxsize` de Client.configure_pool para no abrir
+        conexiones fuera del pool.
+
+        Args:
+            max_workers (int): Cantidad de hilos que ejecutan las peticiones.
+        """
+        cls.close()
+        cls.__max_workers = max_workers
+
+    @classmethod
+    def close(cls) -> None:
+        """Detiene los hilos del cliente asíncrono."""
+        with cls.__executor_lock:
+            if cls.__executor is not None:
+                cls.__executor.shutdown(wait=False)
+                cls.__executor = None
+
+    @classmethod
+    async def post(cls, path, **data):
+        return await cls.__run(Client.post, path, **data)
+
+    @classmethod
+    async def get(cls, path, **data):
+        return await cls.__run(Client.get, path, **data)
+
+    @classmethod
+    async def delete(cls, path):
+        return await cls.__run(Client.delete, path)
+
+    @classmethod
+    async def put(cls, path, **data):
+        return await cls.__run(Client.put, path, **data)
+
+    @classmethod
+    async def __run(cls, function, *args, **kwargs):
+        with cls.__executor_lock:
+            if cls.__executor is None:
+                cls.__executor = ThreadPoolExecutor(max_workers=cls.__max_workers, thread_name_prefix="pyjx-async")
+
+            executor = cls.__executor
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(executor, partial(function, *args, **kwargs))
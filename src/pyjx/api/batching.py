@@ -0,0 +1,105 @@
+from typing import Iterable, Iterator
+from urllib.parse import quote_plus
+
+
+def chunk(items: Iterable, size: int) -> Iterator[list]:
+    """Divide una secuencia en listas de como máximo `size` elementos.
+
+    Args:
+        items (Iterable): Los elementos a dividir.
+        size (int): La cantidad máxima de elementos por lista.
+
+    Yields:
+        list: Cada lista de elementos, conservando el orden original.
+
+    Examples:
+        >>> list(chunk(["PJX-1", "PJX-2", "PJX-3"], 2))
+        [["PJX-1", "PJX-2"], ["PJX-3"]]
+    """
+    batch = []
+
+    for item in items:
+        batch.append(item)
+
+        if len(batch) == size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def chunk_keys(keys: Iterable[str], max_count: int, max_length: int) -> Iterator[list[str]]:
+    """Divide claves o IDs de issues en grupos aptos para una cláusula JQL `id in (...)`.
+
+    Cada grupo tiene como máximo `max_count` claves y, una vez codificado para la URL y unido
+    por comas, no supera `max_length` caracteres.
+
+    Args:
+        keys (Iterable[str]): Las claves o IDs de los issues.
+        max_count (int): La cantidad máxima de claves por grupo.
+        max_length (int): La longitud máxima de las claves codificadas de un grupo.
+
+    Yields:
+        list[str]: Cada grupo de claves, conservando el orden original.
+
+    Examples:
+        >>> list(chunk_keys(["PJX-1", "PJX-2", "PJX-3"], max_count=2, max_length=2000))
+        [["PJX-1", "PJX-2"], ["PJX-3"]]
+    """
+    separator_length = len(quote_plus(","))
+    batch = []
+    length = 0
+
+    for key in keys:
+        key_length = len(quote_plus(key)) + (separator_length if batch else 0)
+
+        if batch and (len(batch) == max_count or length + key_length > max_length):
+            yield batch
+            batch = []
+            key_length -= separator_length
+            length = 0
+
+        batch.append(key)
+        length += key_length
+
+    if batch:
+        yield batch
+
+
+def order_by_keys(issues: Iterable, keys_or_ids: Iterable[str]) -> list:
+    """Ordena issues según la lista de claves o IDs con la que fueron solicitados.
+
+    Cada issue aparece una sola vez, en la posición de la primera clave o ID que lo identifica.
+    Las claves que no corresponden a ningún issue se omiten y los issues que no corresponden a
+    ninguna clave (por ejemplo, issues movidos que cambiaron de clave) se agregan al final.
+
+    Args:
+        issues (Iterable): Los issues recuperados, en cualquier orden.
+        keys_or_ids (Iterable[str]): Las claves o IDs en el orden solicitado.
+
+    Returns:
+        list: Los issues en el orden solicitado.
+
+    Examples:
+        >>> order_by_keys(issue_factory.search("id in (PJX-2, PJX-1)"), ["PJX-1", "PJX-2"])
+    """
+    issues = list(issues)
+    index = {}
+
+    for issue in issues:
+        index[str(issue.key()).upper()] = issue
+        index[str(issue.id())] = issue
+
+    ordered = {}
+
+    for key_or_id in keys_or_ids:
+        issue = index.get(str(key_or_id).upper())
+
+        if issue is not None:
+            ordered.setdefault(id(issue), issue)
+
+    for issue in issues:
+        ordered.setdefault(id(issue), issue)
+
+    return list(ordered.values())
@@ -34,7 +34,7 @@ class RequestBodyCreateBuilder:
     """
     def __init__(self, add_project: bool = True) -> None:
         self.__project_added = add_project
-        self.__set_default_fields()
+        self.__set_default_fields(add_project)
 
 
     def __set_default_fields(self, add_project: bool) -> None:
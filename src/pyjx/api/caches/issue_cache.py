@@ -0,0 +1,129 @@
+import time
+from threading import Lock
+from collections import OrderedDict
+
+
+class IssueCache:
+    """Mapa de identidad de issues indexado por clave e ID.
+
+    Conserva la última instancia recuperada de cada issue durante `ttl` segundos. Cuando se supera
+    `max_size`, se descarta el issue usado hace más tiempo (LRU). Es seguro compartirlo entre hilos.
+
+    Examples:
+        >>> cache = IssueCache(ttl=600, max_size=5000)
+        >>> cache.put(issue)
+        >>> cache.get("PJX-1") is issue
+        True
+        >>> cache.stats()
+        {"hits": 1, "misses": 0, "size": 1}
+    """
+
+    def __init__(self, ttl: float = 300, max_size: int = 10000) -> None:
+        """Inicializa el caché.
+
+        Args:
+            ttl (float): Segundos que una instancia se considera vigente. None para no expirar.
+            max_size (int): Cantidad máxima de issues en memoria.
+        """
+        self.__ttl = ttl
+        self.__max_size = max_size
+        self.__entries: OrderedDict = OrderedDict()
+        self.__ids: dict[str, str] = {}
+        self.__lock = Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, key_or_id: str):
+        """Devuelve la instancia vigente de un issue o None si no está en el caché.
+
+        Args:
+            key_or_id (str): La clave o ID del issue.
+
+        Returns:
+            Union[Test, TestSet, TestExecution, TestPlan, None]: La instancia del issue.
+        """
+        with self.__lock:
+            key = self.__resolve(key_or_id)
+            entry = self.__entries.get(key)
+
+            if entry is not None and self.__expired(entry):
+                self.__discard(key)
+                entry = None
+
+            if entry is None:
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+
+            return entry[1]
+
+    def put(self, issue) -> None:
+        """Guarda o reemplaza la instancia de un issue.
+
+        Args:
+            issue (IssueBase): La instancia del issue.
+        """
+        key = str(issue.key()).upper()
+
+        with self.__lock:
+            self.__discard(key)
+            self.__entries[key] = (time.monotonic(), issue)
+            self.__ids[str(issue.id())] = key
+
+            while len(self.__entries) > self.__max_size:
+                oldest_key = next(iter(self.__entries))
+                self.__discard(oldest_key)
+
+    def invalidate(self, key_or_id: str) -> None:
+        """Descarta un issue del caché.
+
+        Args:
+            key_or_id (str): La clave o ID del issue.
+        """
+        with self.__lock:
+            self.__discard(self.__resolve(key_or_id))
+
+    def clear(self) -> None:
+        """Descarta todos los issues del caché."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__ids.clear()
+
+    def hits(self) -> int:
+        """Devuelve la cantidad de lecturas servidas desde memoria."""
+        return self.__hits
+
+    def misses(self) -> int:
+        """Devuelve la cantidad de lecturas que no encontraron el issue en memoria."""
+        return self.__misses
+
+    def stats(self) -> dict:
+        """Devuelve los contadores del caché.
+
+        Returns:
+            dict: Las lecturas con acierto (`hits`), sin acierto (`misses`) y la cantidad de issues (`size`).
+        """
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "size": len(self.__entries)
+            }
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __resolve(self, key_or_id: str) -> str:
+        key_or_id = str(key_or_id)
+        return self.__ids.get(key_or_id, key_or_id.upper())
+
+    def __expired(self, entry: tuple) -> bool:
+        return self.__ttl is not None and time.monotonic() - entry[0] > self.__ttl
+
+    def __discard(self, key: str) -> None:
+        entry = self.__entries.pop(key, None)
+
+        if entry is not None:
+            self.__ids.pop(str(entry[1].id()), None)
@@ -0,0 +1,321 @@
+import os
+import json
+import sqlite3
+from threading import Lock
+from typing import Iterable, Union
+from datetime import datetime, timedelta, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from pyjx.api.client import Client
+
+
+SWEEP_SIZE = 100
+"""Cantidad de claves almacenadas que se verifican por consulta al buscar issues eliminados en Jira."""
+
+
+def project_scope(keys: Iterable[str]) -> str:
+    """Construye la consulta JQL que delimita el almacén a los proyectos de las claves indicadas.
+
+    Args:
+        keys (Iterable[str]): Claves de issues, por ejemplo las de una especificación de ambientación.
+
+    Returns:
+        str: La consulta JQL con los proyectos de las claves.
+
+    Examples:
+        >>> project_scope(["PJX-1", "ABC-7", "PJX-2"])
+        'project in ("ABC", "PJX")'
+    """
+    projects = sorted({str(key).rsplit("-", 1)[0].upper() for key in keys if key})
+
+    if len(projects) == 1:
+        return f'project = "{projects[0]}"'
+
+    return "project in (" + ", ".join(f'"{project}"' for project in projects) + ")"
+
+
+def covers(stored_fields: Union[str, None], fields: Union[list[str], None]) -> bool:
+    """Indica si un issue almacenado con la proyección `stored_fields` (JSON, o None si está completo) tiene `fields`."""
+    if stored_fields is None:
+        return True
+
+    return fields is not None and set(json.loads(stored_fields)).issuperset(fields)
+
+
+class IssueStore:
+    """Almacén en disco (SQLite) del JSON de los issues, junto a `~/.pyjx/general.json`.
+
+    Guarda cada issue por su clave con su fecha `updated` y la proyección de campos con la que se recuperó, de
+    modo que los issues pedidos con una proyección (como `WORKFLOW_FIELDS`) también se reutilizan, pero solo
+    para lecturas que pidan esos mismos campos o menos. `sync` pide a Jira solo los issues
+    modificados desde la última sincronización (`updated >= last_sync`), de modo que una ejecución
+    con el almacén ya poblado solo transfiere lo que cambió. Como Jira no informa de los issues
+    eliminados, cada `sweep_interval` se verifica que las claves almacenadas sigan existiendo. El
+    almacén pertenece a un alcance (`scope`): si cambia, se descarta lo almacenado. Mientras no se
+    sincronice en el proceso actual, el almacén no sirve lecturas para no devolver información
+    desactualizada.
+
+    Examples:
+        >>> store = IssueStore(scope='project = "PJX"')
+        >>> factory = IssueFactory(store=store)
+        >>> store.sync(factory)
+        >>> factory.get("PJX-1")
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        *,
+        scope: str,
+        overlap: timedelta = timedelta(minutes=5),
+        sweep_interval: Union[timedelta, None] = timedelta(hours=24)
+    ) -> None:
+        """Inicializa el almacén y crea la base de datos si no existe.
+
+        Args:
+            path (str, optional): La ruta del archivo SQLite. Por defecto, `~/.pyjx/issues.sqlite3`.
+            scope (str): La consulta JQL que delimita los issues que se sincronizan, por ejemplo la de `project_scope`.
+            overlap (timedelta): Margen que se resta a la última sincronización, porque JQL compara por minuto
+                y Jira indexa las modificaciones con un pequeño retraso.
+            sweep_interval (Union[timedelta, None]): Cada cuánto se buscan los issues eliminados en Jira, que
+                cuesta una consulta por cada `SWEEP_SIZE` issues almacenados. None para no buscarlos nunca.
+        """
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".pyjx", "issues.sqlite3")
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.__scope = scope
+        self.__overlap = overlap
+        self.__sweep_interval = sweep_interval
+        self.__synced = False
+        self.__stale: set[str] = set()
+        self.__lock = Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__connection.executescript("""
+            CREATE TABLE IF NOT EXISTS issues (
+                key TEXT PRIMARY KEY,
+                id TEXT,
+                updated TEXT,
+                json TEXT NOT NULL,
+                fields TEXT
+            );
+            CREATE INDEX IF NOT EXISTS issues_id ON issues (id);
+            CREATE TABLE IF NOT EXISTS meta (
+                name TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+
+        # Los almacenes creados antes de guardar proyecciones solo tienen issues completos
+        if "fields" not in [column[1] for column in self.__connection.execute("PRAGMA table_info(issues)")]:
+            self.__connection.execute("ALTER TABLE issues ADD COLUMN fields TEXT")
+
+    def get(self, key_or_id: str, fields: list[str] = None) -> Union[dict, None]:
+        """Devuelve el JSON almacenado de un issue, o None si no está, no tiene los campos pedidos o el almacén no
+        se ha sincronizado.
+
+        Args:
+            key_or_id (str): La clave o ID del issue.
+            fields (list[str], optional): Los campos que debe tener el issue. Por defecto, todos.
+
+        Returns:
+            Union[dict, None]: El JSON del issue.
+        """
+        if not self.__synced:
+            return None
+
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT json, fields, key FROM issues WHERE key = ? OR id = ?",
+                (str(key_or_id).upper(), str(key_or_id))
+            ).fetchone()
+
+            if row is None or row[2] in self.__stale or not covers(row[1], fields):
+                return None
+
+        return json.loads(row[0])
+
+    def put(self, details: dict, fields: list[str] = None) -> None:
+        """Guarda o reemplaza el JSON de un issue.
+
+        Args:
+            details (dict): El JSON del issue tal como lo devuelve la API de Jira.
+            fields (list[str], optional): La proyección con la que se recuperó. Por defecto, todos los campos.
+        """
+        self.put_many([details], fields)
+
+    def put_many(self, issues: list[dict], fields: list[str] = None) -> None:
+        """Guarda o reemplaza el JSON de varios issues en una sola transacción.
+
+        Un issue completo reemplaza al almacenado. Un issue con proyección se combina con el almacenado: sus
+        campos, más recientes, reemplazan a los anteriores y la proyección resultante es la unión de ambas.
+
+        Args:
+            issues (list[dict]): Los JSON de los issues.
+            fields (list[str], optional): La proyección con la que se recuperaron. Por defecto, todos los campos.
+        """
+        with self.__lock, self.__connection:
+            rows = [self.__row(details, fields) for details in issues]
+            self.__stale.difference_update(row[0] for row in rows)
+            self.__connection.executemany("INSERT OR REPLACE INTO issues (key, id, updated, json, fields) VALUES (?, ?, ?, ?, ?)", rows)
+
+    def __row(self, details: dict, fields: Union[list[str], None]) -> tuple:
+        key = str(details["key"]).upper()
+
+        if fields is not None:
+            stored = self.__connection.execute("SELECT json, fields FROM issues WHERE key = ?", (key,)).fetchone()
+
+            if stored is not None:
+                stored_details = json.loads(stored[0])
+                details = {**stored_details, **details, "fields": {**stored_details.get("fields", {}), **details.get("fields", {})}}
+                fields = None if stored[1] is None else sorted(set(json.loads(stored[1])) | set(fields))
+
+        return (
+            key,
+            str(details.get("id")),
+            details.get("fields", {}).get("updated"),
+            json.dumps(details, default=dict),
+            None if fields is None else json.dumps(sorted(fields))
+        )
+
+    def invalidate(self, key_or_id: str) -> None:
+        """Deja de servir un issue modificado durante la ejecución hasta que se vuelva a guardar.
+
+        El issue se conserva en disco: como Jira actualiza su fecha `updated`, la siguiente sincronización lo
+        reemplaza por su versión actual.
+
+        Args:
+            key_or_id (str): La clave o ID del issue.
+        """
+        with self.__lock:
+            row = self.__connection.execute("SELECT key FROM issues WHERE key = ? OR id = ?", (str(key_or_id).upper(), str(key_or_id))).fetchone()
+            self.__stale.add(row[0] if row is not None else str(key_or_id).upper())
+
+    def delete(self, key_or_id: str) -> None:
+        """Descarta un issue del almacén.
+
+        Args:
+            key_or_id (str): La clave o ID del issue.
+        """
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM issues WHERE key = ? OR id = ?", (str(key_or_id).upper(), str(key_or_id)))
+
+    def last_sync(self) -> Union[datetime, None]:
+        """Devuelve la hora del servidor de Jira en la última sincronización, o None si nunca se ha sincronizado."""
+        return self.__moment("last_sync")
+
+    def last_sweep(self) -> Union[datetime, None]:
+        """Devuelve la hora del servidor de Jira en la última búsqueda de issues eliminados, o None si no se ha hecho."""
+        return self.__moment("last_sweep")
+
+    def __moment(self, name: str) -> Union[datetime, None]:
+        with self.__lock:
+            row = self.__connection.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+
+        if row is None:
+            return None
+
+        # Los almacenes anteriores guardaban la hora local sin zona horaria
+        return datetime.fromisoformat(row[0]).astimezone()
+
+    def sync(self, factory) -> int:
+        """Actualiza los issues modificados en Jira desde la última sincronización.
+
+        La marca de la sincronización es la hora del servidor de Jira (`serverInfo`), no la del equipo, y la
+        consulta JQL la expresa en la zona horaria del usuario de Jira, que es como JQL interpreta las fechas.
+        Si pasó `sweep_interval` desde la última búsqueda, también descarta los issues eliminados en Jira.
+        En la primera sincronización, o si cambió el alcance, no se descarga nada: el almacén se vacía y se
+        llena con los issues que la fábrica recupera durante la ejecución.
+
+        Args:
+            factory (IssueFactory): La fábrica con la que se consulta Jira.
+
+        Returns:
+            int: La cantidad de issues actualizados.
+
+        Examples:
+            >>> store.sync(factory)
+            12
+        """
+        started_at = self.__server_time()
+        updated = 0
+
+        with self.__lock, self.__connection:
+            row = self.__connection.execute("SELECT value FROM meta WHERE name = 'scope'").fetchone()
+
+            if row is None or row[0] != self.__scope:
+                # Lo almacenado con otro alcance no se actualizaría con esta consulta
+                self.__connection.execute("DELETE FROM issues")
+                self.__connection.execute("DELETE FROM meta")
+                self.__connection.execute("INSERT INTO meta (name, value) VALUES ('scope', ?), ('last_sweep', ?)", (self.__scope, started_at.isoformat()))
+
+        last_sync = self.last_sync()
+
+        if last_sync is not None:
+            since = (last_sync - self.__overlap).astimezone(self.__user_time_zone(started_at)).strftime("%Y/%m/%d %H:%M")
+            batch = []
+
+            for issue in factory.search(f'{self.__scope} AND updated >= "{since}"', fields=["*all"], prefetch=True):
+                batch.append(issue.json())
+
+                if len(batch) == 500:
+                    self.put_many(batch)
+                    updated += len(batch)
+                    batch = []
+
+            self.put_many(batch)
+            updated += len(batch)
+
+            if self.__sweep_interval is not None and started_at - self.last_sweep() >= self.__sweep_interval:
+                self.__sweep(started_at)
+
+        with self.__lock, self.__connection:
+            self.__connection.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('last_sync', ?)", (started_at.isoformat(),))
+
+        self.__synced = True
+
+        return updated
+
+    def __server_time(self) -> datetime:
+        return datetime.strptime(Client.get("rest/api/2/serverInfo")["serverTime"], "%Y-%m-%dT%H:%M:%S.%f%z")
+
+    def __user_time_zone(self, server_time: datetime) -> tzinfo:
+        try:
+            return ZoneInfo(Client.get("rest/api/2/myself")["timeZone"])
+        except (KeyError, ValueError, ZoneInfoNotFoundError):
+            return server_time.tzinfo
+
+    def __sweep(self, started_at: datetime) -> None:
+        # Jira no informa de los issues eliminados, así que se verifica que las claves almacenadas sigan
+        # existiendo dentro del alcance; validateQuery=warn evita que una clave inexistente invalide la consulta
+        with self.__lock:
+            keys = [row[0] for row in self.__connection.execute("SELECT key FROM issues")]
+
+        missing = []
+
+        for start in range(0, len(keys), SWEEP_SIZE):
+            chunk = keys[start:start + SWEEP_SIZE]
+            found = set()
+            params = {"jql": f'{self.__scope} AND id in ({",".join(chunk)})', "fields": "issuetype", "validateQuery": "warn", "maxResults": SWEEP_SIZE}
+
+            while True:
+                page = Client.get("rest/api/2/search", params={**params, "startAt": len(found)})
+                found.update(str(issue["key"]).upper() for issue in page["issues"])
+
+                if not page["issues"] or len(found) >= page.get("total", 0):
+                    break
+
+            missing.extend(key for key in chunk if key not in found)
+
+        with self.__lock, self.__connection:
+            self.__connection.executemany("DELETE FROM issues WHERE key = ?", [(key,) for key in missing])
+            self.__connection.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('last_sweep', ?)", (started_at.isoformat(),))
+
+    def close(self) -> None:
+        """Cierra la conexión con la base de datos."""
+        with self.__lock:
+            self.__connection.close()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
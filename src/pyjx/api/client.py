@@ -1,8 +1,14 @@
-from typing import ClassVar, Union
+from typing import ClassVar, Iterator, Union
 from json import JSONDecodeError
-from requests import get, post, put, delete, Response
+from threading import Lock
+from requests import Session, Response, ConnectionError, Timeout
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth, AuthBase
-from errors import ClientError, ServerError
+from pyjx.errors import ClientError, ServerError
+from pyjx.api.retry import RetryPolicy
+from pyjx.api.rate_limit import RateLimiter
+from pyjx.api.recorder import RequestRecorder
+from pyjx.api.streaming import JSONArrayStream, STREAM_CHUNK_SIZE
 
 
 class Client:
@@ -12,6 +18,16 @@ class Client:
         "verify": True,
         "timeout": 10
     }
+    __pool_details: ClassVar = {
+        "pool_connections": 10,
+        "pool_maxsize": 10,
+        "pool_block": False
+    }
+    __session: ClassVar[Union[Session, None]] = None
+    __session_lock: ClassVar = Lock()
+    __retry_policy: ClassVar[RetryPolicy] = RetryPolicy()
+    __rate_limiter: ClassVar[RateLimiter] = RateLimiter()
+    __recorder: ClassVar[Union[RequestRecorder, None]] = None
 
     @classmethod
     def configure_auth(cls, username: str, password: str):
@@ -27,15 +43,133 @@ class Client:
         }
 
     @classmethod
-    def post(cls, path, **data):
-        response = post(
-            cls.__url + path,
-            auth=cls.__auth,
-            **data,
-            **cls.__request_details
-        )
+    def configure_pool(cls, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False):
+        """Configura el pool de conexiones persistentes (keep-alive) del cliente.
 
-        cls.raise_for_status_code_error(response)
+        La sesión actual se cierra y la siguiente petición abre una nueva con la configuración indicada.
+
+        Args:
+            pool_connections (int): Cantidad de hosts distintos cuyo pool se mantiene abierto.
+            pool_maxsize (int): Máximo de conexiones keep-alive que se conservan por host.
+            pool_block (bool): Si es True, nunca se abren más de `pool_maxsize` conexiones simultáneas por host;
+                las peticiones adicionales esperan a que se libere una conexión.
+
+        Examples:
+            >>> Client.configure_pool(pool_maxsize=20, pool_block=True)
+        """
+        cls.close()
+        cls.__pool_details = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block
+        }
+
+    @classmethod
+    def configure_retry(cls, policy: RetryPolicy) -> None:
+        """Configura la política de reintentos ante límites de peticiones (429) y fallos transitorios (5xx).
+
+        Args:
+            policy (RetryPolicy): La política de reintentos. `RetryPolicy(max_retries=0)` desactiva los reintentos.
+
+        Examples:
+            >>> Client.configure_retry(RetryPolicy(max_retries=8, max_backoff=60))
+        """
+        cls.__retry_policy = policy
+
+    @classmethod
+    def retry_stats(cls) -> dict[str, int]:
+        """Devuelve la cantidad de reintentos realizados por método HTTP.
+
+        Examples:
+            >>> Client.retry_stats()
+            {"GET": 3, "POST": 1}
+        """
+        return cls.__retry_policy.stats()
+
+    @classmethod
+    def configure_rate_limit(cls, limiter: RateLimiter) -> None:
+        """Configura el limitador de peticiones (token bucket) compartido por todos los hilos y tareas.
+
+        Cada petición, incluidos sus reintentos, toma un token antes de enviarse.
+
+        Args:
+            limiter (RateLimiter): El limitador. `RateLimiter()` desactiva el límite.
+
+        Examples:
+            >>> Client.configure_rate_limit(RateLimiter(
+            ...     TokenBucket(rate=10, burst=20),
+            ...     {"rest/raven/1.0": TokenBucket(rate=5, burst=5)}
+            ... ))
+        """
+        cls.__rate_limiter = limiter
+
+    @classmethod
+    def rate_limiter(cls) -> RateLimiter:
+        """Devuelve el limitador de peticiones configurado."""
+        return cls.__rate_limiter
+
+    @classmethod
+    def rate_limit_stats(cls) -> dict[str, dict]:
+        """Devuelve, por cubeta, la cantidad de peticiones y los segundos esperados por el límite.
+
+        Examples:
+            >>> Client.rate_limit_stats()
+            {"default": {"requests": 120, "waited": 3.2}}
+        """
+        return cls.__rate_limiter.stats()
+
+    @classmethod
+    def configure_recorder(cls, recorder: Union[RequestRecorder, None]) -> None:
+        """Configura el registro de peticiones de una ejecución simulada.
+
+        Mientras está configurado, las escrituras no se envían a Jira: se registran y se responden en memoria.
+
+        Args:
+            recorder (Union[RequestRecorder, None]): El registro. None vuelve a enviar todas las peticiones.
+
+        Examples:
+            >>> recorder = RequestRecorder()
+            >>> Client.configure_recorder(recorder)
+            >>> recorder.counts()
+            {"GET rest/api/2/issue/{key}": {"sent": 1, "recorded": 0}}
+        """
+        cls.__recorder = recorder
+
+    @classmethod
+    def session(cls) -> Session:
+        """Devuelve la sesión HTTP compartida, creándola en el primer uso.
+
+        Todas las peticiones del cliente (y por lo tanto de IssueFactory, los modelos y las estrategias)
+        reutilizan las conexiones de esta sesión.
+
+        Returns:
+            Session: La sesión con el pool de conexiones configurado.
+        """
+        with cls.__session_lock:
+            if cls.__session is None:
+                adapter = HTTPAdapter(**cls.__pool_details)
+                session = Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls.__session = session
+
+            return cls.__session
+
+    @classmethod
+    def close(cls) -> None:
+        """Cierra la sesión compartida y libera las conexiones del pool.
+
+        Examples:
+            >>> Client.close()
+        """
+        with cls.__session_lock:
+            if cls.__session is not None:
+                cls.__session.close()
+                cls.__session = None
+
+    @classmethod
+    def post(cls, path, **data):
+        response = cls.__send("POST", path, **data)
 
         try:
             json = response.json()
@@ -46,26 +180,40 @@ class Client:
 
     @classmethod
     def get(cls, path, **data):
-        response = get(
-            cls.__url + path,
-            auth=cls.__auth,
-            **data,
-            **cls.__request_details
-        )
-
-        cls.raise_for_status_code_error(response)
+        response = cls.__send("GET", path, **data)
 
         return response.json()
 
     @classmethod
-    def delete(cls, path):
-        response = delete(
-            cls.__url + path,
-            auth=cls.__auth,
-            **cls.__request_details
-        )
+    def stream(cls, path, item_path: str = None, **data) -> Iterator:
+        """Hace un GET y decodifica de forma incremental el arreglo JSON de la respuesta.
 
-        cls.raise_for_status_code_error(response)
+        El cuerpo se lee del socket por fragmentos y cada elemento se entrega en cuanto se decodifica,
+        por lo que el consumo de memoria no depende del tamaño de la respuesta. La petición se envía al
+        pedir el primer elemento y la conexión se libera al terminar de recorrer (o descartar) el iterador.
+
+        Args:
+            path (str): La ruta del recurso.
+            item_path (str, optional): La clave del objeto raíz que contiene el arreglo, por ejemplo "tests".
+                None si la respuesta es el arreglo.
+
+        Yields:
+            Any: Cada elemento del arreglo.
+
+        Examples:
+            >>> for test in Client.stream("rest/raven/1.0/api/testplan/PJX-1/test"):
+            ...     print(test["key"])
+        """
+        response = cls.__send("GET", path, stream=True, **data)
+
+        try:
+            yield from JSONArrayStream(response.iter_content(STREAM_CHUNK_SIZE), item_path)
+        finally:
+            response.close()
+
+    @classmethod
+    def delete(cls, path):
+        response = cls.__send("DELETE", path)
 
         try:
             json = response.json()
@@ -76,14 +224,7 @@ class Client:
 
     @classmethod
     def put(cls, path, **data):
-        response = put(
-            cls.__url + path,
-            auth=cls.__auth,
-            **data,
-            **cls.__request_details
-        )
-
-        cls.raise_for_status_code_error(response)
+        response = cls.__send("PUT", path, **data)
 
         try:
             json = response.json()
@@ -92,6 +233,44 @@ class Client:
 
         return json
 
+    @classmethod
+    def __send(cls, method: str, path: str, **data) -> Response:
+        policy = cls.__retry_policy
+        attempt = 0
+
+        if cls.__recorder is not None and (response := cls.__recorder.intercept(method, path, data)) is not None:
+            return response
+
+        while True:
+            cls.__rate_limiter.acquire(path)
+
+            try:
+                response = cls.session().request(
+                    method,
+                    cls.__url + path,
+                    auth=cls.__auth,
+                    **data,
+                    **cls.__request_details
+                )
+            except (ConnectionError, Timeout) as error:
+                if not policy.should_retry_error(method, error, attempt):
+                    raise
+
+                policy.wait(method, attempt)
+                attempt += 1
+                continue
+
+            if not policy.should_retry(method, response, attempt):
+                break
+
+            response.close()
+            policy.wait(method, attempt, response)
+            attempt += 1
+
+        cls.raise_for_status_code_error(response)
+
+        return response
+
     @staticmethod
     def raise_for_status_code_error(response: Response) -> None:
         if response.status_code >= 400 and response.status_code < 500:
@@ -0,0 +1,158 @@
+import time
+from threading import Condition
+from pyjx.errors import ClientError, ServerError
+
+
+def is_overload(error: Exception) -> bool:
+    """Indica si un error de la API significa que Jira está saturado (429 o 5xx).
+
+    Args:
+        error (Exception): El error lanzado por Client.
+
+    Returns:
+        bool: True si el error debe reducir la concurrencia.
+    """
+    if isinstance(error, ServerError):
+        return True
+
+    response = getattr(error, "response", None)
+
+    return isinstance(error, ClientError) and response is not None and response.status_code == 429
+
+
+class AdaptiveLimit:
+    """Límite de concurrencia adaptativo con AIMD (aumento aditivo, disminución multiplicativa).
+
+    Cada petición completada con una latencia estable suma `increase / limit` al límite, es decir,
+    aproximadamente `increase` por cada ventana completa de peticiones. Un 429, un 5xx o una latencia
+    mayor a `latency_tolerance` veces la latencia media multiplica el límite por `decrease`. La latencia
+    media se lleva por operación, porque un bulk de 50 issues y un enlace tardan órdenes de magnitud
+    distintos y compararlos entre sí confundiría una operación lenta con saturación. Como
+    Client reintenta los 429 esperando lo que indica `Retry-After`, esos reintentos se perciben aquí
+    como picos de latencia. Solo se reduce una vez por cada ronda de peticiones en vuelo, para que una
+    misma ráfaga de errores no colapse el límite. Es seguro compartirlo entre hilos.
+
+    Examples:
+        >>> limit = AdaptiveLimit(initial=8, max_limit=32)
+        >>> limit.run(Client.get, "rest/api/2/issue/PJX-1", operation="get")
+        >>> limit.stats()
+        {"limit": 8.125, "in_flight": 0, "increases": 1, "decreases": 0, "latency": {"get": 0.21}}
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 1,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2
+    ) -> None:
+        """Inicializa el límite.
+
+        Args:
+            initial (int): Límite inicial de peticiones simultáneas.
+            min_limit (int): Límite mínimo.
+            max_limit (int): Límite máximo.
+            increase (float): Aumento del límite por cada ventana de peticiones estables.
+            decrease (float): Factor por el que se multiplica el límite ante saturación.
+            latency_tolerance (float): Cuántas veces la latencia media se considera un pico.
+            smoothing (float): Peso de cada muestra en la media móvil exponencial de la latencia de cada operación.
+        """
+        self.__min_limit = min_limit
+        self.__max_limit = max_limit
+        self.__limit = float(min(max(initial, min_limit), max_limit))
+        self.__increase = increase
+        self.__decrease = decrease
+        self.__latency_tolerance = latency_tolerance
+        self.__smoothing = smoothing
+        self.__latencies: dict[str, float] = {}
+        self.__in_flight = 0
+        self.__increases = 0
+        self.__decreases = 0
+        self.__decreased_at = 0.0
+        self.__condition = Condition()
+
+    def limit(self) -> int:
+        """Devuelve el límite actual de peticiones simultáneas."""
+        return int(self.__limit)
+
+    def max_limit(self) -> int:
+        """Devuelve el límite máximo de peticiones simultáneas."""
+        return self.__max_limit
+
+    def acquire(self) -> float:
+        """Espera a que haya lugar bajo el límite y ocupa uno.
+
+        Returns:
+            float: El instante (time.monotonic) en que comenzó la petición.
+        """
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__in_flight < int(self.__limit))
+            self.__in_flight += 1
+
+        return time.monotonic()
+
+    def release(self, started_at: float, overloaded: bool = False, operation: str = "default") -> None:
+        """Libera el lugar de una petición y ajusta el límite según su resultado.
+
+        Args:
+            started_at (float): El valor devuelto por `acquire`.
+            overloaded (bool): True si la petición falló por saturación (429/5xx).
+            operation (str): La operación cuya latencia media se compara y actualiza, por ejemplo "bulk_create".
+        """
+        latency = time.monotonic() - started_at
+
+        with self.__condition:
+            self.__in_flight -= 1
+            average = self.__latencies.get(operation)
+            spike = average is not None and latency > average * self.__latency_tolerance
+
+            if overloaded or spike:
+                if started_at >= self.__decreased_at:
+                    self.__limit = max(self.__min_limit, self.__limit * self.__decrease)
+                    self.__decreased_at = time.monotonic()
+                    self.__decreases += 1
+            else:
+                self.__limit = min(self.__max_limit, self.__limit + self.__increase / self.__limit)
+                self.__increases += 1
+
+            if not overloaded:
+                self.__latencies[operation] = latency if average is None else (1 - self.__smoothing) * average + self.__smoothing * latency
+
+            self.__condition.notify_all()
+
+    def run(self, function, *args, operation: str = "default", **kwargs):
+        """Ejecuta `function` bajo el límite y ajusta el límite según su latencia y su resultado.
+
+        La latencia se compara con la media de las ejecuciones anteriores de la misma `operation`. Los errores
+        se propagan después de registrarse.
+        """
+        started_at = self.acquire()
+
+        try:
+            result = function(*args, **kwargs)
+        except Exception as error:
+            self.release(started_at, overloaded=is_overload(error), operation=operation)
+            raise
+
+        self.release(started_at, operation=operation)
+
+        return result
+
+    def stats(self) -> dict:
+        """Devuelve las métricas del límite.
+
+        Returns:
+            dict: El límite actual (`limit`), las peticiones en vuelo (`in_flight`), la cantidad de aumentos
+                (`increases`) y reducciones (`decreases`), y la latencia media en segundos de cada operación (`latency`).
+        """
+        with self.__condition:
+            return {
+                "limit": self.__limit,
+                "in_flight": self.__in_flight,
+                "increases": self.__increases,
+                "decreases": self.__decreases,
+                "latency": dict(self.__latencies)
+            }
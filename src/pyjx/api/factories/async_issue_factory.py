@@ -0,0 +1,302 @@
+import asyncio
+from threading import Lock
+from typing import Union
+from weakref import WeakKeyDictionary
+from json import dumps
+from datetime import datetime
+from pyjx.models.test import Test
+from pyjx.models.test_set import TestSet
+from pyjx.models.test_execution import TestExecution
+from pyjx.models.test_plan import TestPlan
+from pyjx.api.async_client import AsyncClient
+from pyjx.api.batching import chunk, chunk_keys, order_by_keys
+from pyjx.api.factories.issue_factory import (
+    IssueFactory,
+    BulkResult,
+    projection,
+    issue_params,
+    search_params,
+    bulk_create_result,
+    bulk_create_error_response,
+    bulk_error_message,
+    unloaded_error,
+    link_error,
+    MAX_KEYS_PER_SEARCH,
+    MAX_KEYS_LENGTH_PER_SEARCH,
+    BULK_CREATE_LIMIT
+)
+from pyjx.errors import ClientError, ServerError
+from pyjx.observers.base_report_observer import BaseReportObserver
+
+
+class AsyncIssueFactory:
+    """Variante asíncrona de IssueFactory.
+
+    Las operaciones en lote reparten sus peticiones de forma concurrente, limitadas por un semáforo
+    de `concurrency` peticiones simultáneas en cada event loop. Los issues devueltos son los mismos modelos que crea
+    IssueFactory, por lo que sus métodos siguen siendo síncronos.
+
+    Métodos:
+        create(details): Crea una nueva instancia de un issue de Jira.
+        bulk_create(details): Crea múltiples nuevas instancias de Issues de Jira.
+        clone(issue_key, details): Clona una instancia de un issue de Jira.
+        bulk_clone(data): Clona múltiples instancias de issues de Jira.
+        get(key_or_id, fields, expand): Obtiene una instancia de un issue de Jira por su clave o ID.
+        bulk_get(keys_or_ids, fields, expand): Obtiene múltiples instancias de issues de Jira por sus claves o IDs.
+
+    Examples:
+        >>> factory = AsyncIssueFactory(concurrency=20)
+        >>> tests = await factory.bulk_get(["PJX-1", "PJX-2"])
+    """
+
+    def __init__(self, factory: IssueFactory = None, concurrency: int = 10) -> None:
+        """Inicializa la fábrica asíncrona.
+
+        Args:
+            factory (IssueFactory, optional): La fábrica síncrona con la que se construyen los modelos.
+            concurrency (int): Máximo de peticiones simultáneas en las operaciones en lote.
+        """
+        self.__client = AsyncClient
+        self.__factory = factory or IssueFactory()
+        self.__concurrency = concurrency
+        self.__semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+        self.__semaphores_lock = Lock()
+        self.__observers: list[BaseReportObserver] = []
+
+    def register_observer(self, observer: BaseReportObserver) -> None:
+        self.__observers.append(observer)
+
+    def __notify_observers(self, issue, message):
+        for observer in self.__observers:
+            observer.update(issue, message, str(datetime.now()))
+
+    def __semaphore(self) -> asyncio.Semaphore:
+        # Un semáforo queda ligado al event loop en el que se usa, así que cada loop (por ejemplo, cada
+        # `asyncio.run`) tiene el suyo y la fábrica puede reutilizarse entre loops
+        loop = asyncio.get_running_loop()
+
+        with self.__semaphores_lock:
+            if (semaphore := self.__semaphores.get(loop)) is None:
+                semaphore = self.__semaphores[loop] = asyncio.Semaphore(self.__concurrency)
+
+        return semaphore
+
+    async def __bounded(self, coroutine):
+        async with self.__semaphore():
+            return await coroutine
+
+    async def __gather(self, coroutines) -> list:
+        return await asyncio.gather(*[self.__bounded(coroutine) for coroutine in coroutines])
+
+    async def create(self, details: dict) -> Union[Test, TestSet, TestExecution, TestPlan]:
+        """Crea una nueva instancia de un issue de Jira.
+
+        Args:
+            details (dict): Un diccionario con los detalles del issue a crear.
+
+        Returns:
+            Union[Test, TestSet, TestExecution, TestPlan]: La instancia del issue creado.
+        """
+        response = await self.__client.post("rest/api/2/issue", json=details)
+        issue = await self.get(response["key"])
+
+        self.__notify_observers(issue, f"{issue.issuetype()} creado con key {str(issue)}")
+
+        return issue
+
+    async def bulk_create(self, details: dict) -> BulkResult:
+        """Crea múltiples nuevas instancias de Issues de Jira.
+
+        Los issues se envían en lotes de BULK_CREATE_LIMIT de forma concurrente. Los elementos que Jira
+        rechaza se omiten del resultado y quedan disponibles en su `errors()`.
+
+        Args:
+            details (dict): Un diccionario que contiene listas de detalles para cada Issue.
+
+        Returns:
+            BulkResult: Lista de instancias de Issues creadas, en el orden de `issueUpdates`, con los errores de los
+                elementos rechazados.
+        """
+        created, errors = await self.__bulk_create(details["issueUpdates"])
+
+        return BulkResult([issue for index, issue in created], errors)
+
+    async def __bulk_create(self, issue_updates: list[dict]) -> tuple[list[tuple[int, Union[Test, TestSet, TestExecution, TestPlan]]], list[dict]]:
+        async def create_batch(number: int, batch: list[dict]) -> tuple[list, list]:
+            try:
+                response = await self.__client.post("rest/api/2/issue/bulk", json={"issueUpdates": batch})
+            except (ClientError, ServerError) as error:
+                response = bulk_create_error_response(error, len(batch))
+
+            return bulk_create_result(response, number * BULK_CREATE_LIMIT, len(batch))
+
+        results = await self.__gather([create_batch(number, batch) for number, batch in enumerate(chunk(issue_updates, BULK_CREATE_LIMIT))])
+        created_keys = [pair for created, errors in results for pair in created]
+        bulk_errors = [error for created, errors in results for error in errors]
+
+        created, unloaded = await self.__load_created(created_keys)
+        bulk_errors = sorted(bulk_errors + unloaded, key=lambda error: error["index"])
+
+        for index, issue in created:
+            self.__notify_observers(issue, f"{issue.issuetype()} creado en lote con key {str(issue)}")
+
+        for error in bulk_errors:
+            self.__notify_observers(None, f"Error al crear en lote el elemento {error['index']}: {bulk_error_message(error)}")
+
+        return created, bulk_errors
+
+    async def __load_created(self, created_keys: list[tuple[int, str]]) -> tuple[list[tuple[int, Union[Test, TestSet, TestExecution, TestPlan]]], list[dict]]:
+        issues = {issue.key(): issue for issue in await self.bulk_get([key for index, key in created_keys])}
+
+        async def load(index: int, key: str) -> tuple:
+            if key in issues:
+                return (index, issues[key]), None
+
+            try:
+                return (index, await self.get(key)), None
+            except (ClientError, ServerError) as error:
+                return None, unloaded_error(index, key, error)
+
+        results = await self.__gather([load(index, key) for index, key in created_keys])
+
+        return [pair for pair, error in results if pair is not None], [error for pair, error in results if error is not None]
+
+    async def clone(self, issue_key: str, details: dict) -> Union[Test, TestSet, TestExecution, TestPlan]:
+        """Clona una instancia de un issue de Jira.
+
+        Si el enlace "Duplicate" con el original falla, el clon se devuelve igualmente y el error se notifica a los
+        observadores.
+
+        Args:
+            issue_key (str): La clave de la instancia del issue a clonar.
+            details (dict): Detalles para el nuevo issue clonado.
+
+        Returns:
+            Union[Test, TestSet, TestExecution, TestPlan]: La instancia del issue clonado.
+        """
+        response_new_issue = await self.__client.post("rest/api/2/issue", json=details)
+        new_issue = await self.get(response_new_issue["key"])
+
+        self.__notify_link_errors([await self.__link(issue_key, new_issue.key())])
+
+        self.__notify_observers(new_issue, f"{new_issue.issuetype()} clonado de {issue_key} con key {str(new_issue)}")
+
+        return new_issue
+
+    async def bulk_clone(self, data: dict[str, dict]) -> BulkResult:
+        """Clona múltiples instancias de issues de Jira.
+
+        Los enlaces "Duplicate" entre cada original y su clon se crean de forma concurrente. Un clon o un enlace
+        fallido no detiene la operación: quedan disponibles en `errors()` y `link_errors()` del resultado.
+
+        Args:
+            data (dict): Un diccionario que mapea las claves de los issues a sus respectivos detalles.
+
+        Returns:
+            BulkResult: Lista de instancias de issues clonados, con los errores de los clones y de los enlaces.
+        """
+        source_keys = list(data.keys())
+        created, errors = await self.__bulk_create(list(data.values()))
+
+        link_errors = self.__notify_link_errors(await self.__gather([self.__link(source_keys[index], new_issue.key()) for index, new_issue in created]))
+
+        for index, new_issue in created:
+            self.__notify_observers(new_issue, f"{new_issue.issuetype()} clonado de {source_keys[index]} con key {str(new_issue)}")
+
+        return BulkResult([new_issue for index, new_issue in created], errors, link_errors)
+
+    async def get(self, key_or_id: str, fields: list[str] = None, expand: list[str] = None) -> Union[Test, TestSet, TestExecution, TestPlan]:
+        """Obtiene una instancia de un issue de Jira por su clave o ID.
+
+        Comparte el caché de issues y la proyección por defecto de la fábrica síncrona.
+
+        Args:
+            key_or_id (str): La clave o ID del issue a recuperar.
+            fields (list[str], optional): Los campos a recuperar. Por defecto, la proyección de la fábrica.
+            expand (list[str], optional): Las secciones a expandir del issue.
+
+        Returns:
+            Union[Test, TestSet, TestExecution, TestPlan]: La instancia del issue recuperado.
+
+        Examples:
+            >>> await factory.get("PJX-1", fields=["summary"])
+        """
+        cache = self.__factory.cache()
+        fields = projection(self.__factory.default_fields() if fields is None else fields)
+
+        if expand is None and (issue := cache.get(key_or_id)) is not None and issue.has_fields(fields):
+            return issue
+
+        response = await self.__client.get(f"rest/api/2/issue/{key_or_id}", params=issue_params(fields, expand))
+        issue = self.__factory.build(response, fields)
+
+        if expand is None:
+            cache.put(issue)
+
+        return issue
+
+    async def bulk_get(self, keys_or_ids: list[str], fields: list[str] = None, expand: list[str] = None) -> list[Union[Test, TestSet, TestExecution, TestPlan]]:
+        """Obtiene múltiples instancias de issues de Jira por sus claves o IDs.
+
+        Las listas grandes se dividen en varias búsquedas que se ejecutan de forma concurrente y, en cada
+        búsqueda, las páginas posteriores a la primera también se piden a la vez. El resultado conserva
+        el orden de `keys_or_ids`.
+
+        Args:
+            keys_or_ids (list): Lista de claves o IDs de los issues a recuperar.
+            fields (list[str], optional): Los campos a recuperar de cada issue. Por defecto, la proyección de la fábrica.
+            expand (list[str], optional): Las secciones a expandir de cada issue.
+
+        Returns:
+            list: Lista de instancias de issues recuperados.
+        """
+        keys_or_ids = list(dict.fromkeys(keys_or_ids))
+        fields = self.__factory.default_fields() if fields is None else fields
+        batches = chunk_keys(keys_or_ids, MAX_KEYS_PER_SEARCH, MAX_KEYS_LENGTH_PER_SEARCH)
+        searches = [self.__search_pages(search_params(f"id in ({','.join(batch)})", fields, expand)) for batch in batches]
+        pages = [page for batch_pages in await asyncio.gather(*searches) for page in batch_pages]
+        issues = [self.__factory.build(details, projection(fields)) for page in pages for details in page["issues"]]
+
+        return order_by_keys(issues, keys_or_ids)
+
+    async def __search_pages(self, params: dict, page_size: int = 50) -> list[dict]:
+        async def fetch_page(start_at: int) -> dict:
+            request = self.__client.get("rest/api/2/search", params={**params, "startAt": start_at, "maxResults": page_size})
+            return await self.__bounded(request)
+
+        first_page = await fetch_page(0)
+        page_length = len(first_page["issues"])
+
+        if page_length == 0:
+            return [first_page]
+
+        starts = range(page_length, first_page.get("total", 0), page_length)
+        next_pages = await asyncio.gather(*[fetch_page(start_at) for start_at in starts])
+
+        return [first_page, *next_pages]
+
+    def __notify_link_errors(self, results: list) -> list[dict]:
+        link_errors = [error for error in results if error is not None]
+
+        for error in link_errors:
+            self.__notify_observers(None, f"Error al enlazar {error['outward']} con {error['inward']}: {bulk_error_message(error)}")
+
+        return link_errors
+
+    async def __link(self, issue_key: str, new_issue_key: str) -> Union[dict, None]:
+        issue_link_data = {
+            "type": {"name": "Duplicate"},
+            "inwardIssue": {"key": issue_key},
+            "outwardIssue": {"key": new_issue_key}
+        }
+        headers = {
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+        }
+
+        try:
+            await self.__client.post("rest/api/2/issueLink", data=dumps(issue_link_data), headers=headers)
+        except (ClientError, ServerError) as error:
+            return link_error(issue_key, new_issue_key, error)
+
+        return None
@@ -1,13 +1,307 @@
-from typing import Union
+from typing import Iterable, Iterator, Union
 from json import dumps
 from datetime import datetime
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 from pyjx.models.test import Test
 from pyjx.models.test_set import TestSet
 from pyjx.models.test_execution import TestExecution
 from pyjx.models.test_plan import TestPlan
+from pyjx.models.compact import compact_details
 from pyjx.api.client import Client
+from pyjx.api.batching import chunk, chunk_keys, order_by_keys
+from pyjx.api.concurrency import AdaptiveLimit
+from pyjx.api.caches.issue_cache import IssueCache
+from pyjx.api.caches.issue_store import IssueStore
+from pyjx.api.journal import OperationJournal
+from pyjx.errors import ClientError, ServerError
 from pyjx.observers.base_report_observer import BaseReportObserver
 
+
+def search_params(jql: str, fields: list[str] = None, expand: list[str] = None) -> dict:
+    """Construye los parámetros de `rest/api/2/search` con la proyección de campos solicitada.
+
+    El campo `issuetype` siempre se incluye porque es necesario para construir el modelo del issue.
+    Sin proyección se pide `*all` de forma explícita: a diferencia de `rest/api/2/issue/{key}`, la búsqueda
+    solo devuelve los campos navegables por defecto, y el issue se marcaría como completo sin serlo.
+
+    Args:
+        jql (str): La consulta JQL.
+        fields (list[str], optional): Los campos a devolver. Si es None, se piden todos los campos.
+        expand (list[str], optional): Las secciones a expandir, por ejemplo "changelog".
+
+    Returns:
+        dict: Los parámetros de la petición.
+
+    Examples:
+        >>> search_params("id in (PJX-1)", fields=["summary"])
+        {"jql": "id in (PJX-1)", "fields": "issuetype,summary"}
+        >>> search_params("id in (PJX-1)")
+        {"jql": "id in (PJX-1)", "fields": "*all"}
+    """
+    return {
+        "jql": jql,
+        "fields": "*all",
+        **issue_params(fields, expand)
+    }
+
+
+def issue_params(fields: list[str] = None, expand: list[str] = None) -> dict:
+    """Construye los parámetros de proyección de `rest/api/2/issue/{key}`.
+
+    Args:
+        fields (list[str], optional): Los campos a devolver. Si es None, Jira devuelve todos los campos.
+        expand (list[str], optional): Las secciones a expandir, por ejemplo "changelog".
+
+    Returns:
+        dict: Los parámetros de la petición.
+
+    Examples:
+        >>> issue_params(fields=["summary"])
+        {"fields": "issuetype,summary"}
+    """
+    params = {}
+
+    if fields is not None:
+        params["fields"] = ",".join(dict.fromkeys(["issuetype", *fields]))
+
+    if expand is not None:
+        params["expand"] = ",".join(expand)
+
+    return params
+
+
+ALL_FIELDS = ["*all"]
+"""Proyección que pide el issue completo (sin proyección), aunque la fábrica tenga una proyección por defecto."""
+
+WORKFLOW_FIELDS = ["summary", "issuetype"]
+"""Proyección mínima de los flujos de trabajo: además de la clave y el ID, solo usan el resumen y el tipo."""
+
+
+def projection(fields: Union[list[str], None]) -> Union[list[str], None]:
+    """Normaliza una proyección de campos.
+
+    Args:
+        fields (list[str], optional): Los campos solicitados.
+
+    Returns:
+        Union[list[str], None]: Los campos que tendrá el issue (siempre con `issuetype`), o None si tendrá todos.
+
+    Examples:
+        >>> projection(["summary"])
+        ["issuetype", "summary"]
+        >>> projection(ALL_FIELDS)
+        None
+    """
+    if fields is None or any(field in ("*all", "*navigable") for field in fields):
+        return None
+
+    return list(dict.fromkeys(["issuetype", *fields]))
+
+
+MAX_KEYS_PER_SEARCH = 200
+"""Cantidad máxima de claves en una sola cláusula `id in (...)`."""
+
+MAX_KEYS_LENGTH_PER_SEARCH = 6000
+"""Longitud máxima, codificada para la URL, de las claves de una sola búsqueda."""
+
+
+BULK_CREATE_LIMIT = 50
+"""Cantidad máxima de issues que Jira acepta en una sola petición a `rest/api/2/issue/bulk`."""
+
+
+def bulk_create_result(response: dict, offset: int, size: int) -> tuple[list[tuple[int, str]], list[dict]]:
+    """Interpreta la respuesta de `rest/api/2/issue/bulk` para un lote de issues.
+
+    Jira crea los elementos válidos del lote y reporta los inválidos en `errors` con su posición
+    (`failedElementNumber`) dentro del lote.
+
+    Args:
+        response (dict): El JSON de la respuesta.
+        offset (int): La posición del primer elemento del lote dentro de la lista completa.
+        size (int): La cantidad de elementos del lote.
+
+    Returns:
+        tuple: Una lista de (posición, clave) de los issues creados y una lista con los errores de cada
+            elemento fallido (`index`, `status` y `errors` con los `elementErrors` de Jira).
+
+    Examples:
+        >>> bulk_create_result({"issues": [{"key": "PJX-5"}], "errors": []}, offset=50, size=1)
+        ([(50, "PJX-5")], [])
+    """
+    failed = {error["failedElementNumber"]: error for error in response.get("errors", [])}
+    successful_indexes = [index for index in range(size) if index not in failed]
+
+    created = [(offset + index, issue["key"]) for index, issue in zip(successful_indexes, response.get("issues", []))]
+    errors = [
+        {
+            "index": offset + index,
+            "status": error.get("status"),
+            "errors": error.get("elementErrors", {})
+        }
+        for index, error in sorted(failed.items())
+    ]
+
+    return created, errors
+
+
+def bulk_create_error_response(error: Union[ClientError, ServerError], size: int) -> dict:
+    """Obtiene la respuesta de un lote que Jira rechazó por completo o que falló en el servidor.
+
+    Si el cuerpo del error no indica qué elementos fallaron, todos los elementos del lote se reportan con el error.
+
+    Args:
+        error (Union[ClientError, ServerError]): El error de la petición.
+        size (int): La cantidad de elementos del lote.
+
+    Returns:
+        dict: Una respuesta con la forma de `rest/api/2/issue/bulk`.
+    """
+    try:
+        response = error.response.json()
+    except ValueError:
+        response = {}
+
+    if isinstance(response, dict) and response.get("errors"):
+        return response
+
+    return {
+        "issues": [],
+        "errors": [
+            {
+                "status": error.status_code,
+                "elementErrors": {"errorMessages": [error.message]},
+                "failedElementNumber": index
+            }
+            for index in range(size)
+        ]
+    }
+
+
+def link_error(inward_key: str, outward_key: str, error: Union[ClientError, ServerError]) -> dict:
+    """Describe un enlace "Duplicate" que Jira rechazó.
+
+    Args:
+        inward_key (str): La clave del issue original.
+        outward_key (str): La clave del clon.
+        error (Union[ClientError, ServerError]): El error de la petición.
+
+    Returns:
+        dict: El error con las claves del enlace (`inward`, `outward`), el `status` y los `errors` de Jira.
+    """
+    try:
+        response = error.response.json()
+    except ValueError:
+        response = {}
+
+    if not isinstance(response, dict) or not (response.get("errorMessages") or response.get("errors")):
+        response = {"errorMessages": [error.message]}
+
+    return {
+        "inward": inward_key,
+        "outward": outward_key,
+        "status": error.status_code,
+        "errors": response
+    }
+
+
+def unloaded_error(index: int, key: str, error: Union[ClientError, ServerError]) -> dict:
+    """Describe un issue que Jira creó pero que no pudo recuperarse después de crearlo.
+
+    Args:
+        index (int): La posición del elemento en la operación en lote.
+        key (str): La clave del issue creado.
+        error (Union[ClientError, ServerError]): El error al recuperarlo.
+
+    Returns:
+        dict: El error con la posición (`index`), la clave (`key`), el `status` y los `errors`.
+    """
+    return {
+        "index": index,
+        "key": key,
+        "status": error.status_code,
+        "errors": {"errorMessages": [f"El issue {key} fue creado, pero no pudo recuperarse: {error.message}"]}
+    }
+
+
+def bulk_error_message(error: dict) -> str:
+    """Resume en una línea los mensajes de error de un elemento de un lote."""
+    element_errors = error.get("errors", {})
+    messages = [*element_errors.get("errorMessages", []), *[f"{field}: {message}" for field, message in element_errors.get("errors", {}).items()]]
+
+    return "; ".join(messages)
+
+
+class BulkResult(list):
+    """Los issues de una operación en lote, junto con los errores de esa misma operación.
+
+    Es la lista de issues, por lo que el código que solo los recorre no cambia. Los errores viajan con el resultado
+    y no en la fábrica, así que las operaciones en lote que se ejecutan a la vez no se pisan sus errores.
+
+    Examples:
+        >>> clones = issue_factory.bulk_clone({"PJX-1": {...}, "PJX-2": {...}})
+        >>> [clone.key() for clone in clones]
+        ["PJX-11"]
+        >>> clones.errors()
+        [{"index": 1, "status": 400, "errors": {"errorMessages": [], "errors": {"summary": "Field required"}}}]
+    """
+
+    def __init__(self, issues: Iterable = (), errors: list[dict] = None, link_errors: list[dict] = None) -> None:
+        """Construye el resultado.
+
+        Args:
+            issues (Iterable): Los issues creados o clonados.
+            errors (list[dict], optional): Un error por elemento fallido, con su posición (`index`), el `status` HTTP y
+                los `errors` reportados por Jira.
+            link_errors (list[dict], optional): Un error por enlace "Duplicate" fallido. Ver `link_error`.
+        """
+        super().__init__(issues)
+        self.__errors = list(errors or [])
+        self.__link_errors = list(link_errors or [])
+
+    def errors(self) -> list[dict]:
+        """Devuelve los errores por elemento de la operación."""
+        return list(self.__errors)
+
+    def link_errors(self) -> list[dict]:
+        """Devuelve los enlaces "Duplicate" que fallaron en la clonación."""
+        return list(self.__link_errors)
+
+
+class TestProxyLoader:
+    """Carga en lote los campos de los Tests perezosos de una misma colección.
+
+    El primer acceso a un campo no cargado de cualquiera de los Tests carga todos los que siguen
+    pendientes con una sola llamada a `bulk_get`.
+    """
+
+    def __init__(self, factory) -> None:
+        self.__factory = factory
+        self.__proxies = []
+        self.__lock = Lock()
+
+    def add(self, proxy) -> None:
+        self.__proxies.append(proxy)
+        proxy.set_loader(self)
+
+    def __call__(self, proxy) -> None:
+        with self.__lock:
+            pending = [pending_proxy for pending_proxy in self.__proxies if pending_proxy.is_partial()]
+            self.__proxies = []
+
+            if not pending:
+                return
+
+            loaded = {issue.key(): issue for issue in self.__factory.bulk_get([pending_proxy.key() for pending_proxy in pending], fields=ALL_FIELDS)}
+
+            for pending_proxy in pending:
+                if (issue := loaded.get(pending_proxy.key())) is not None:
+                    pending_proxy.load(issue.json())
+                    self.__factory.cache().put(pending_proxy)
+                else:
+                    pending_proxy.set_loader(None)
+
+
 class IssueFactory:
     """Clase de fábrica para la creación  gestión de instancias de Test.
 
@@ -18,40 +312,103 @@ class IssueFactory:
         __issue_types (dict): Un diccionario que mapea los tipos de issues a sus respectivas clases.
 
     Métodos:
-        create(details): Crea una nueva instancia de un issue de Jira.
-        bulk_create(details): Crea múltiples nuevas instancias de Issues de Jira.
+        create(details, ref): Crea una nueva instancia de un issue de Jira.
+        bulk_create(details, refs): Crea múltiples nuevas instancias de Issues de Jira.
         clone(issue_key, details): Clona una instancia de un issue de Jira.
         bulk_clone(data): Clona múltiples instancias de issues de Jira.
+        build(details): Construye la instancia del modelo que corresponde al JSON de un issue.
         get(key_or_id): Obtiene una instancia de un issue de Jira por su clave o ID.
-        bulk_get(keys_or_ids): Obtiene múltiples instancias de issues de Jira por sus claves o IDs.
+        bulk_get(keys_or_ids, fields, expand): Obtiene múltiples instancias de issues de Jira por sus claves o IDs.
+        concurrency_limit(): Devuelve el límite adaptativo de concurrencia de las operaciones en lote.
+        cache(): Devuelve el caché de issues de la fábrica.
+        invalidate(issue_or_key): Descarta un issue del caché.
+        search(jql, fields, expand, page_size, prefetch): Recorre de forma perezosa todos los issues de una consulta JQL.
+        proxies(tests): Construye Tests perezosos a partir de una respuesta de membresía de Xray.
         get_tests_from_test_repository(test_repository_id): Obtiene los tests asociados a un Test Repository.
         get_issues_from_summary(summary, type_issue): Obtiene los issues según el summary  el tipo de issue.
         get_issues_from_summaries(summaries, type_issue): Obtiene los issues según los summaries  el tipo de issue.
     """
     __issue_types = {
         "Test": Test,
-        "Test Execution": TestSet,
-        "Test Plan": TestSet,
+        "Test Execution": TestExecution,
+        "Test Plan": TestPlan,
         "Test Set": TestSet
     }
 
-    def __init__(self) -> None:
-        """Inicializa la TestFactory con un cliente API."""
+    def __init__(
+        self,
+        concurrency: int = 8,
+        cache: IssueCache = None,
+        store: IssueStore = None,
+        limit: AdaptiveLimit = None,
+        default_fields: list[str] = None,
+        membership_ttl: float = None,
+        compact: bool = False,
+        journal: OperationJournal = None
+    ) -> None:
+        """Inicializa la TestFactory con un cliente API.
+
+        Args:
+            concurrency (int): Límite inicial de peticiones simultáneas en las operaciones en lote.
+            cache (IssueCache, optional): El caché de issues. Por defecto, uno nuevo con la configuración de IssueCache;
+                `IssueCache(max_size=0)` lo desactiva.
+            store (IssueStore, optional): El almacén en disco que se consulta antes de pedir los issues a Jira.
+            limit (AdaptiveLimit, optional): El límite adaptativo de concurrencia de las operaciones en lote.
+                Por defecto, uno que parte de `concurrency` y puede crecer hasta cuatro veces ese valor.
+            default_fields (list[str], optional): La proyección de `get`, `bulk_get` y `search` cuando no se indica
+                una. Los campos que falten se cargan al usarlos. Por defecto, todos los campos.
+            membership_ttl (float, optional): Segundos tras los que los Test Sets, Test Executions y Test Plans vuelven
+                a pedir a Xray sus tests. Por defecto, la membresía se conserva hasta llamar a su `refresh()`.
+            compact (bool): Si es True, los issues se construyen con `compact_details`: solo los campos de la proyección
+                con valor y el tipo, estado, prioridad y resolución compartidos entre issues. Con `WORKFLOW_FIELDS`,
+                un Test compacto ocupa alrededor de 1.2 KB frente a unos 6.7 KB de un Test con el JSON completo
+                (ver `utests/test_compact_models.py`).
+            journal (OperationJournal, optional): El journal donde se registran las creaciones con referencia, las
+                clonaciones y los enlaces completados. Las operaciones que ya figuran en él no se repiten.
+        """
         self.__client = Client
+        self.__limit = limit if limit is not None else AdaptiveLimit(initial=concurrency, max_limit=concurrency * 4)
+        self.__cache = cache if cache is not None else IssueCache()
+        self.__store = store
         self.__observers: list[BaseReportObserver] = []
+        self.__default_fields = default_fields
+        self.__membership_ttl = membership_ttl
+        self.__compact = compact
+        self.__journal = journal
 
     def register_observer(self, observer: BaseReportObserver) -> None:
         self.__observers.append(observer)
 
+    def build(self, details: dict, fields: list[str] = None) -> Union[Test, TestSet, TestExecution, TestPlan]:
+        """Construye la instancia del modelo que corresponde al JSON de un issue.
+
+        Args:
+            details (dict): El JSON del issue tal como lo devuelve la API de Jira.
+            fields (list[str], optional): La proyección con la que se recuperó el issue. None si tiene todos los campos.
+
+        Returns:
+            Union[Test, TestSet, TestExecution, TestPlan]: La instancia del issue.
+
+        Examples:
+            >>> issue_factory.build({"key": "PJX-1", "fields": {"issuetype": {"name": "Test"}}})
+        """
+        Issue = self.__issue_types[details["fields"]["issuetype"]["name"]]
+        issue = Issue(self.model_details(details, fields), self)
+        issue.set_projection(projection(fields))
+
+        return issue
+
     def __notify_observers(self, issue, message):
         for observer in self.__observers:
             observer.update(issue, message, str(datetime.now()))
 
-    def create(self, details: dict) -> Union[Test, TestSet, TestExecution, TestPlan]:
+    def create(self, details: dict, ref: str = None) -> Union[Test, TestSet, TestExecution, TestPlan]:
         """Crea una nueva instancia de un issue de Jira.
 
         Args:
             details (dict): Un diccionario con los detalles del issue a crear.
+            ref (str, optional): Una referencia estable de la creación. Si el journal ya tiene un issue creado con
+                ella, se devuelve ese issue en lugar de crear otro.
 
         Returns:
             Union[Test, TestSet, TestExecution, TestPlan]: La instancia del issue creado.
@@ -64,21 +421,34 @@ class IssueFactory:
                 }
             })
         """
+        if (key := self.__journaled(ref)) is not None:
+            return self.get(key)
+
         response = self.__client.post("rest/api/2/issue", json=details)
+        self.__record_created(ref, response["key"])
         issue = self.get(response["key"])
 
         self.__notify_observers(issue, f"{issue.issuetype()} creado con key {str(issue)}")
 
         return issue
 
-    def bulk_create(self, details: dict) -> list[Union[Test, TestSet, TestExecution, TestPlan]]:
+    def bulk_create(self, details: dict, refs: list[str] = None) -> BulkResult:
         """Crea múltiples nuevas instancias de Issues de Jira.
 
+        Los issues se envían en lotes de BULK_CREATE_LIMIT que se despachan de forma concurrente. Los
+        elementos que Jira rechaza no detienen la operación: se omiten del resultado y quedan disponibles
+        en su `errors()`. Los issues creados se recuperan con búsquedas en lote.
+
+        Con un journal, cada lote registra sus issues en cuanto Jira los crea, y los elementos cuya referencia ya
+        figura en el journal no se vuelven a crear.
+
         Args:
             details (dict): Un diccionario que contiene listas de detalles para cada Issue.
+            refs (list[str], optional): Una referencia estable por elemento de `issueUpdates`.
 
         Returns:
-            list: Lista de instancias de Issues creadas.
+            BulkResult: Lista de instancias de Issues creadas, en el orden de `issueUpdates`, con los errores de los
+                elementos rechazados.
         
         Examples:
             >>> issue_factory.bulk_create({
@@ -96,21 +466,73 @@ class IssueFactory:
                 ]
             })
         """
-        def __create_issue(data: dict) -> Test:
-            issue = self.get(data["key"])
+        created, errors = self.__bulk_create(details["issueUpdates"], refs)
 
-            self.__notify_observers(issue, f"{issue.issuetype()} creado en lote con key {str(issue)}")
+        return BulkResult([issue for index, issue in created], errors)
 
-            return issue
+    def __bulk_create(self, issue_updates: list[dict], refs: list[str] = None) -> tuple[list[tuple[int, Union[Test, TestSet, TestExecution, TestPlan]]], list[dict]]:
+        refs = refs if refs is not None else [None] * len(issue_updates)
+        journaled = [(index, key) for index, ref in enumerate(refs) if (key := self.__journaled(ref)) is not None]
+        done = {index for index, key in journaled}
 
-        response = self.__client.post("rest/api/2/issue/bulk", json=details)
-        issues = list(map(__create_issue, response["issues"]))
+        def create_batch(indexes: list[int]) -> tuple[list, list]:
+            batch = [issue_updates[index] for index in indexes]
 
-        return issues
+            try:
+                response = self.__limit.run(self.__client.post, "rest/api/2/issue/bulk", json={"issueUpdates": batch}, operation="bulk_create")
+            except (ClientError, ServerError) as error:
+                response = bulk_create_error_response(error, len(batch))
+
+            created, errors = bulk_create_result(response, 0, len(batch))
+            created = [(indexes[position], key) for position, key in created]
+
+            for index, key in created:
+                self.__record_created(refs[index], key)
+
+            return created, [{**error, "index": indexes[error["index"]]} for error in errors]
+
+        pending = [index for index in range(len(issue_updates)) if index not in done]
+        results = self.__fan_out(create_batch, chunk(pending, BULK_CREATE_LIMIT))
+        new_keys = [pair for created, errors in results for pair in created]
+        created_keys = sorted(journaled + new_keys)
+        bulk_errors = [error for created, errors in results for error in errors]
+
+        created, unloaded = self.__load_created(created_keys)
+        bulk_errors = sorted(bulk_errors + unloaded, key=lambda error: error["index"])
+
+        for index, issue in created:
+            if index not in done:
+                self.__notify_observers(issue, f"{issue.issuetype()} creado en lote con key {str(issue)}")
+
+        for error in bulk_errors:
+            self.__notify_observers(None, f"Error al crear en lote el elemento {error['index']}: {bulk_error_message(error)}")
+
+        return created, bulk_errors
+
+    def __load_created(self, created_keys: list[tuple[int, str]]) -> tuple[list[tuple[int, Union[Test, TestSet, TestExecution, TestPlan]]], list[dict]]:
+        # El índice de búsqueda de Jira puede no tener aún los issues recién creados: los que no devuelve la
+        # búsqueda se piden uno a uno, y los que tampoco así se encuentran se reportan como error
+        issues = {issue.key(): issue for issue in self.bulk_get([key for index, key in created_keys])}
+        created, errors = [], []
+
+        for index, key in created_keys:
+            if key not in issues:
+                try:
+                    issues[key] = self.get(key)
+                except (ClientError, ServerError) as error:
+                    errors.append(unloaded_error(index, key, error))
+                    continue
+
+            created.append((index, issues[key]))
+
+        return created, errors
 
     def clone(self, issue_key: str, details: dict) -> Union[Test, TestSet, TestExecution, TestPlan]:
         """Clona una instancia de un issue de Jira.
 
+        Si el enlace "Duplicate" con el original falla, el clon se devuelve igualmente y el error se notifica a los
+        observadores.
+
         Args:
             issue_key (str): La clave de la instancia del issue a clonar.
             details (dict): Detalles para el nuevo issue clonado.
@@ -125,33 +547,32 @@ class IssueFactory:
                 }
             })
         """
-        response_new_issue = self.__client.post("rest/api/2/issue", json=details)
-        new_issue = self.get(response_new_issue["key"])
+        ref = f"clone:{issue_key}"
 
-        issue_link_data = {
-            "type": {"name": "Duplicate"},
-            "inwardIssue": {"key": issue_key},
-            "outwardIssue": {"key": new_issue.key()}
-        }
-        headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-        }
+        if (new_issue_key := self.__journaled(ref)) is None:
+            new_issue_key = self.__client.post("rest/api/2/issue", json=details)["key"]
+            self.__record_created(ref, new_issue_key)
 
-        self.__client.post("rest/api/2/issueLink", data=dumps(issue_link_data), headers=headers)
+        new_issue = self.get(new_issue_key)
+
+        self.__link_duplicates([(issue_key, new_issue.key())])
 
         self.__notify_observers(new_issue, f"{new_issue.issuetype()} clonado de {issue_key} con key {str(new_issue)}")
 
         return new_issue
 
-    def bulk_clone(self, data: dict[str, dict]) -> list[Union[Test, TestSet, TestExecution, TestPlan]]:
+    def bulk_clone(self, data: dict[str, dict]) -> BulkResult:
         """Clona múltiples instancias de issues de Jira.
 
+        Los clones se crean en lote y los enlaces "Duplicate" entre cada original y su clon se crean de forma
+        concurrente, bajo el límite adaptativo de concurrencia. Un clon o un enlace fallido no detiene la
+        operación: quedan disponibles en `errors()` y `link_errors()` del resultado.
+
         Args:
             data (dict): Un diccionario que mapea las claves de los issues a sus respectivos detalles.
 
         Returns:
-            list: Lista de instancias de issues clonados.
+            BulkResult: Lista de instancias de issues clonados, con los errores de los clones y de los enlaces.
         
         Examples:
             >>> issue_factory.bulk_clone({
@@ -167,62 +588,327 @@ class IssueFactory:
                 }
             })
         """
-        issue_details = [details for key, details in data.items()]
-        
-        new_issues = self.bulk_create({"issueUpdates": issue_details})
+        source_keys = list(data.keys())
+        created, errors = self.__bulk_create(list(data.values()), [f"clone:{issue_key}" for issue_key in source_keys])
+
+        link_errors = self.__link_duplicates([(source_keys[index], new_issue.key()) for index, new_issue in created])
 
-        for index, (key, content) in enumerate(data.items()):
+        for index, new_issue in created:
+            self.__notify_observers(new_issue, f"{new_issue.issuetype()} clonado de {source_keys[index]} con key {str(new_issue)}")
+
+        return BulkResult([issue for index, issue in created], errors, link_errors)
+
+    def __link_duplicates(self, pairs: list[tuple[str, str]]) -> list[dict]:
+        headers = {
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+        }
+
+        def link(pair: tuple[str, str]) -> Union[dict, None]:
+            issue_key, new_issue_key = pair
             issue_link_data = {
                 "type": {"name": "Duplicate"},
-                "inwardIssue": {"key": key},
-                "outwardIssue": {"key": new_issues[index].key()}
+                "inwardIssue": {"key": issue_key},
+                "outwardIssue": {"key": new_issue_key}
             }
-            headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-            }
-            self.__client.post("rest/api/2/issueLink", data=dumps(issue_link_data), headers=headers)
 
-            self.__notify_observers(new_issues[index], f"{new_issues[index].issuetype()} clonado de {key} con key {str(new_issues[index])}")
+            try:
+                self.__limit.run(self.__client.post, "rest/api/2/issueLink", data=dumps(issue_link_data), headers=headers, operation="link")
+            except (ClientError, ServerError) as error:
+                return link_error(issue_key, new_issue_key, error)
+
+            if self.__journal is not None:
+                self.__journal.record("link", inward=issue_key, outward=new_issue_key)
+
+            return None
 
-        return new_issues
+        if self.__journal is not None:
+            pairs = [pair for pair in pairs if not self.__journal.linked(*pair)]
 
-    def get(self, key_or_id: str) -> Union[Test, TestSet, TestExecution, TestPlan]:
+        link_errors = [error for error in self.__fan_out(link, pairs) if error is not None]
+
+        for error in link_errors:
+            self.__notify_observers(None, f"Error al enlazar {error['outward']} con {error['inward']}: {bulk_error_message(error)}")
+
+        return link_errors
+
+    def get(self, key_or_id: str, fields: list[str] = None, expand: list[str] = None) -> Union[Test, TestSet, TestExecution, TestPlan]:
         """Obtiene una instancia de un issue de Jira por su clave o ID.
 
         Args:
             key_or_id (str): La clave o ID del issue a recuperar.
+            fields (list[str], optional): Los campos a recuperar. Por defecto, la proyección de la fábrica.
+            expand (list[str], optional): Las secciones a expandir del issue.
 
         Returns:
             Union[Test, TestSet, TestExecution, TestPlan]: La instancia del issue recuperado.
         
         Examples:
             >>> issue_factory.get("PJX-1")
+            >>> issue_factory.get("PJX-1", fields=["summary"])
         """
-        response = self.__client.get(f"rest/api/2/issue/{key_or_id}")
-        Issue = self.__issue_types[response["fields"]["issuetype"]["name"]]
+        fields = projection(self.__default_fields if fields is None else fields)
+
+        if expand is None:
+            found, missing = self.__lookup([key_or_id], fields)
+
+            if found:
+                return found[0]
+
+        response = self.__client.get(f"rest/api/2/issue/{key_or_id}", params=issue_params(fields, expand))
+        issue = self.build(response, fields)
+
+        if expand is None:
+            self.__cache.put(issue)
 
-        return Issue(response, self)
+        if self.__store is not None and expand is None:
+            self.__store.put(response, fields)
 
-    def bulk_get(self, keys_or_ids: list[str]) -> list[Union[Test, TestSet, TestExecution, TestPlan]]:
+        return issue
+
+    def bulk_get(self, keys_or_ids: list[str], fields: list[str] = None, expand: list[str] = None) -> list[Union[Test, TestSet, TestExecution, TestPlan]]:
         """Obtiene múltiples instancias de issues de Jira por sus claves o IDs.
 
+        Los issues se construyen directamente con el resultado de la búsqueda, sin volver a pedir cada uno,
+        y los que ya están en el caché (con los campos solicitados) o en el almacén en disco no se vuelven a pedir
+        cuando no se expanden secciones. Las listas grandes se dividen en varias búsquedas (por cantidad de claves y por longitud de la URL)
+        que se ejecutan de forma concurrente; el resultado conserva el orden de `keys_or_ids`.
+
         Args:
             keys_or_ids (list): Lista de claves o IDs de los issues a recuperar.
+            fields (list[str], optional): Los campos a recuperar de cada issue. Por defecto, la proyección de la fábrica.
+            expand (list[str], optional): Las secciones a expandir de cada issue.
 
         Returns:
             list: Lista de instancias de issues recuperados.
         
         Examples:
             >>> issue_factory.bulk_get(["PJX-1", "PJX-2"])
+            >>> issue_factory.bulk_get(["PJX-1", "PJX-2"], fields=["summary", "labels"])
         """
-        params = {
-            "jql": f"id in ({','.join(keys_or_ids)})"
-        }
+        keys_or_ids = list(dict.fromkeys(keys_or_ids))
+        fields = projection(self.__default_fields if fields is None else fields)
+        cached, missing = [], keys_or_ids
+
+        if expand is None:
+            cached, missing = self.__lookup(keys_or_ids, fields)
+
+        batches = chunk_keys(missing, MAX_KEYS_PER_SEARCH, MAX_KEYS_LENGTH_PER_SEARCH)
+
+        def search_batch(batch: list[str]) -> list:
+            return self.__limit.run(lambda: list(self.search(f"id in ({','.join(batch)})", fields or ALL_FIELDS, expand)), operation="bulk_get")
+
+        issues = [issue for batch_issues in self.__fan_out(search_batch, batches) for issue in batch_issues]
+
+        if expand is None and self.__store is not None:
+            self.__store.put_many([issue.json() for issue in issues], fields)
+
+        return order_by_keys(cached + issues, keys_or_ids)
+
+    def journal(self) -> Union[OperationJournal, None]:
+        """Devuelve el journal de operaciones de la fábrica, o None si no tiene."""
+        return self.__journal
+
+    def __journaled(self, ref: Union[str, None]) -> Union[str, None]:
+        if ref is None or self.__journal is None:
+            return None
+
+        return self.__journal.created(ref)
+
+    def __record_created(self, ref: Union[str, None], key: str) -> None:
+        if ref is not None and self.__journal is not None:
+            self.__journal.record("create", ref=ref, key=key)
+
+    def __lookup(self, keys_or_ids: list[str], fields: list[str] = None) -> tuple[list, list[str]]:
+        found, missing = [], []
+
+        for key_or_id in keys_or_ids:
+            issue = self.__cache.get(key_or_id)
+
+            if issue is not None and not issue.has_fields(fields):
+                issue = None
+
+            if issue is None and self.__store is not None and (details := self.__store.get(key_or_id, fields)) is not None:
+                issue = self.build(details, fields)
+                self.__cache.put(issue)
+
+            if issue is None:
+                missing.append(key_or_id)
+            else:
+                found.append(issue)
+
+        return found, missing
+
+    def model_details(self, details: dict, fields: list[str] = None) -> dict:
+        """Devuelve el JSON de un issue tal como lo guardan los modelos de la fábrica.
+
+        Si la fábrica es compacta, el JSON se reduce con `compact_details`; si no, se devuelve sin cambios. Los
+        modelos lo usan también al cargar sus campos con `load`, para no perder la compactación.
+
+        Args:
+            details (dict): El JSON del issue tal como lo devuelve la API de Jira.
+            fields (list[str], optional): La proyección con la que se recuperó el issue. None si tiene todos los campos.
+
+        Returns:
+            dict: El JSON que guarda el modelo.
+        """
+        if self.__compact:
+            return compact_details(details, projection(fields))
+
+        return details
 
-        response = self.__client.get("rest/api/2/search", params=params)
+    def default_fields(self) -> Union[list[str], None]:
+        """Devuelve la proyección de `get`, `bulk_get` y `search` cuando no se indica una, o None si son todos los campos."""
+        return self.__default_fields
 
-        return [self.get(details["key"]) for details in response["issues"]]
+    def membership_ttl(self) -> Union[float, None]:
+        """Devuelve los segundos que los modelos contenedores conservan su membresía, o None si no expira."""
+        return self.__membership_ttl
+
+    def concurrency_limit(self) -> AdaptiveLimit:
+        """Devuelve el límite adaptativo de concurrencia de las operaciones en lote.
+
+        Returns:
+            AdaptiveLimit: El límite, cuyo valor actual y contadores se consultan con `stats()`.
+
+        Examples:
+            >>> issue_factory.concurrency_limit().stats()
+            {"limit": 11.4, "in_flight": 0, "increases": 40, "decreases": 1, "latency": 0.32}
+        """
+        return self.__limit
+
+    def cache(self) -> IssueCache:
+        """Devuelve el caché de issues de la fábrica.
+
+        Returns:
+            IssueCache: El caché, con sus contadores de aciertos y fallos.
+
+        Examples:
+            >>> issue_factory.cache().stats()
+            {"hits": 10, "misses": 2, "size": 2}
+        """
+        return self.__cache
+
+    def invalidate(self, issue_or_key) -> None:
+        """Descarta un issue del caché (y deja de leerlo del almacén en disco) para que la siguiente lectura lo pida a Jira.
+
+        Args:
+            issue_or_key (Union[IssueBase, str]): El issue o su clave o ID.
+
+        Examples:
+            >>> issue_factory.invalidate("PJX-1")
+        """
+        key = issue_or_key if isinstance(issue_or_key, str) else issue_or_key.key()
+        self.__cache.invalidate(key)
+
+        if self.__store is not None:
+            self.__store.invalidate(key)
+
+    def search(self, jql: str, fields: list[str] = None, expand: list[str] = None, page_size: int = 50, prefetch: bool = False) -> Iterator[Union[Test, TestSet, TestExecution, TestPlan]]:
+        """Recorre de forma perezosa todos los issues de una consulta JQL.
+
+        Las páginas se piden con `startAt`/`maxResults` a medida que se consumen, por lo que
+        solo una página (dos si `prefetch` está activo) se mantiene en memoria.
+
+        Args:
+            jql (str): La consulta JQL.
+            fields (list[str], optional): Los campos a recuperar de cada issue. Por defecto, la proyección de la fábrica.
+            expand (list[str], optional): Las secciones a expandir de cada issue.
+            page_size (int): La cantidad de issues que se piden por página.
+            prefetch (bool): Si es True, la siguiente página se pide en segundo plano mientras se consume la actual.
+
+        Yields:
+            Union[Test, TestSet, TestExecution, TestPlan]: Cada issue encontrado, en el orden de Jira.
+
+        Examples:
+            >>> for test in issue_factory.search('project = "PJX" AND issuetype = "Test"', prefetch=True):
+            ...     print(test.key())
+        """
+        fields = projection(self.__default_fields if fields is None else fields)
+        params = search_params(jql, fields, expand)
+
+        for page in self.__search_pages(params, page_size, prefetch):
+            for details in page["issues"]:
+                issue = self.build(details, fields)
+
+                if expand is None:
+                    self.__cache.put(issue)
+
+                yield issue
+
+    def __fan_out(self, function, items) -> list:
+        items = list(items)
+
+        if len(items) <= 1:
+            return [function(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(self.__limit.max_limit(), len(items)), thread_name_prefix="pyjx-factory") as executor:
+            return list(executor.map(function, items))
+
+    def __search_pages(self, params: dict, page_size: int, prefetch: bool) -> Iterator[dict]:
+        def fetch_page(start_at: int) -> dict:
+            return self.__client.get("rest/api/2/search", params={**params, "startAt": start_at, "maxResults": page_size})
+
+        def next_start_at(page: dict, start_at: int) -> Union[int, None]:
+            start_at += len(page["issues"])
+            has_more = len(page["issues"]) > 0 and start_at < page.get("total", 0)
+            return start_at if has_more else None
+
+        if not prefetch:
+            start_at = 0
+            while start_at is not None:
+                page = fetch_page(start_at)
+                start_at = next_start_at(page, start_at)
+                yield page
+            return
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyjx-search") as executor:
+            start_at = 0
+            future = executor.submit(fetch_page, start_at)
+            while future is not None:
+                page = future.result()
+                start_at = next_start_at(page, start_at)
+                future = executor.submit(fetch_page, start_at) if start_at is not None else None
+                yield page
+
+    def proxies(self, tests: Iterable[dict], issuetype: str = "Test") -> list[Test]:
+        """Construye Tests perezosos a partir de una respuesta de membresía de Xray.
+
+        Cada Test solo contiene su clave e ID, por lo que las operaciones que solo usan la clave no consultan
+        `rest/api/2`. El primer acceso a cualquier otro campo carga, con un solo `bulk_get`, los campos de todos
+        los Tests de la colección que aún no se cargaron. Los Tests que ya están en el caché se reutilizan.
+
+        Args:
+            tests (Iterable[dict]): Los tests tal como los devuelve Xray, con al menos `key` (y normalmente `id`).
+                Puede ser el iterador de `Client.stream`: los tests se construyen a medida que se decodifican.
+            issuetype (str): El tipo de issue de los elementos de la membresía.
+
+        Returns:
+            list[Test]: Los Tests, en el orden de `tests`.
+
+        Examples:
+            >>> tests = issue_factory.proxies([{"id": 10001, "key": "PJX-1"}, {"id": 10002, "key": "PJX-2"}])
+            >>> tests[0].key()
+            "PJX-1"
+            >>> tests[0].summary()  # carga PJX-1 y PJX-2 en una sola búsqueda
+            "This is a summary"
+        """
+        loader = TestProxyLoader(self)
+        proxies = []
+
+        for test in tests:
+            proxy = self.__cache.get(test["key"])
+
+            if proxy is None:
+                proxy = self.build({"id": test.get("id"), "key": test["key"], "fields": {"issuetype": {"name": issuetype}}}, fields=[])
+                loader.add(proxy)
+
+                if test.get("id") is not None:
+                    self.__cache.put(proxy)
+
+            proxies.append(proxy)
+
+        return proxies
 
     def get_tests_from_test_repository(self, test_repository_id: str) -> list[Test]:
         """Obtiene los tests asociados a un Test Repository.
@@ -246,11 +932,7 @@ class IssueFactory:
                 }
             ]
         """
-        response_json = self.__client.get(f"rest/raven/1.0/api/testrepository/PJX/folders/{str(test_repository_id)}/tests")
-        keys = [test_info["key"] for test_info in response_json["tests"]]
-        tests_from_tr = self.bulk_get(keys)
-
-        return tests_from_tr
+        return self.proxies(self.__client.stream(f"rest/raven/1.0/api/testrepository/PJX/folders/{str(test_repository_id)}/tests", item_path="tests"))
 
     def get_issues_from_summary(self, summary: str, type_issue: str) -> list[Union[Test, TestSet, TestExecution, TestPlan]]:
         """Obtiene los issues segun el summary  el tipo de issue.
@@ -277,12 +959,8 @@ class IssueFactory:
                 }
             ]
         """
-        params = {
-            "jql": f'project = "PJX" AND summary ~ "{summary}" AND issuetype = "{type_issue}"'
-        }
-        response = self.__client.get("rest/api/2/search", params=params)
-        keys = [test_info["key"] for test_info in response["issues"]]
-        issues = self.bulk_get(keys)
+        jql = f'project = "PJX" AND summary ~ "{summary}" AND issuetype = "{type_issue}"'
+        issues = list(self.search(jql))
 
         return issues
     
@@ -312,13 +990,7 @@ class IssueFactory:
             ]
         """
         jql_query = " OR ".join([f'summary ~ "{summary}"' for summary in summaries])
-        params = {
-            "jql": f'{jql_query} AND issuetype = "{type_issue}"'
-        }
-
-        response = self.__client.get("rest/api/2/search", params=params)
-        keys = [test_info["key"] for test_info in response["issues"]]
-
-        issues = self.bulk_get(keys)
+        jql = f'({jql_query}) AND issuetype = "{type_issue}"'
+        issues = list(self.search(jql))
 
         return issues
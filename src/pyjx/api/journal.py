@@ -0,0 +1,159 @@
+import os
+import json
+import hashlib
+from datetime import datetime
+from threading import Lock
+
+
+JOURNAL_FILE = "pyjx.env.journal.jsonl"
+"""Nombre del journal de operaciones que se escribe en la ruta de invocación."""
+
+
+def spec_digest(content: dict) -> str:
+    """Calcula un identificador estable de una especificación de ambientación a partir de su contenido.
+
+    Las credenciales (`auth`) no forman parte del identificador, de modo que cambiarlas no impide reanudar.
+
+    Args:
+        content (dict): La especificación.
+
+    Returns:
+        str: Los primeros 12 caracteres hexadecimales del SHA-256 del JSON canónico de la especificación.
+
+    Examples:
+        >>> spec_digest({"plan": "PJX-1", "tests": {"add": {"keys": ["PJX-10"]}}})
+        "3f1c0e9a2b7d"
+    """
+    canonical = json.dumps({name: value for name, value in content.items() if name != "auth"}, sort_keys=True, ensure_ascii=False)
+
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+class OperationJournal:
+    """Registro append-only (JSONL) de las escrituras completadas en Jira.
+
+    Cada línea es una operación terminada: un issue creado (`create`, identificado por una referencia estable
+    que elige quien lo crea), un enlace (`link`) o issues agregados a un contenedor (`add`). Cada ejecución
+    empieza con una línea `start`; al reanudar se cargan las operaciones desde la última `start`, de modo
+    que las escrituras ya hechas se omiten en lugar de repetirse. Si se indica la especificación, la línea
+    `start` la registra y solo se reanuda una ejecución de esa misma especificación. Cada línea se sincroniza a disco al
+    escribirse, así que una interrupción solo puede perder la línea en curso, que se ignora al leer.
+
+    Examples:
+        >>> journal = OperationJournal("/tmp/pyjx.env.journal.jsonl")
+        >>> journal.record("create", ref="set", key="PJX-10")
+        >>> OperationJournal("/tmp/pyjx.env.journal.jsonl", resume=True).created("set")
+        "PJX-10"
+    """
+
+    def __init__(self, path: str, resume: bool = False, spec: str = None) -> None:
+        """Abre el journal.
+
+        Args:
+            path (str): La ruta del archivo JSONL.
+            resume (bool): Si es True, carga las operaciones de la última ejecución para omitirlas. Si es False,
+                empieza una ejecución nueva.
+            spec (str, optional): El identificador de la especificación (`spec_digest`) que se ambienta.
+
+        Raises:
+            ValueError: Si se reanuda una ejecución de otra especificación.
+        """
+        self.__path = path
+        self.__entries: list[dict] = []
+        self.__created: dict[str, str] = {}
+        self.__links: set[tuple[str, str]] = set()
+        self.__added: dict[str, set[str]] = {}
+        self.__lock = Lock()
+
+        if resume:
+            last_run = self.__last_run()
+
+            if spec is not None and last_run and last_run[0].get("spec") != spec:
+                raise ValueError(f"El journal {path} es de otra especificación; no se puede reanudar. Ejecute sin --resume para empezar de nuevo.")
+
+            for entry in last_run:
+                self.__index(entry)
+
+        self.__file = open(path, mode="a", encoding="utf-8")
+
+        if self.__file.tell() > 0 and not self.__ends_with_newline():
+            # Cierra la línea incompleta para que no se mezcle con la siguiente
+            self.__file.write("\n")
+
+        self.record("resume" if resume else "start", **({} if spec is None else {"spec": spec}))
+
+    def record(self, operation: str, **data) -> None:
+        """Agrega una operación completada al journal y la sincroniza a disco.
+
+        Args:
+            operation (str): "create", "link", "add" o una marca de la ejecución.
+            **data: Los datos de la operación, por ejemplo `ref` y `key` de un issue creado.
+        """
+        entry = {"op": operation, **data, "at": datetime.now().isoformat()}
+
+        with self.__lock:
+            self.__file.write(json.dumps(entry) + "\n")
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__index(entry)
+
+    def created(self, ref: str) -> str:
+        """Devuelve la clave del issue creado con la referencia indicada, o None si no se creó."""
+        with self.__lock:
+            return self.__created.get(ref)
+
+    def linked(self, inward: str, outward: str) -> bool:
+        """Indica si ya se enlazaron los dos issues."""
+        with self.__lock:
+            return (inward, outward) in self.__links
+
+    def added(self, container: str) -> set[str]:
+        """Devuelve las claves de los issues que ya se agregaron al contenedor."""
+        with self.__lock:
+            return set(self.__added.get(container, set()))
+
+    def entries(self) -> list[dict]:
+        """Devuelve las operaciones de la ejecución actual, incluidas las cargadas al reanudar."""
+        with self.__lock:
+            return list(self.__entries)
+
+    def close(self) -> None:
+        """Cierra el archivo del journal."""
+        with self.__lock:
+            self.__file.close()
+
+    def __last_run(self) -> list[dict]:
+        if not os.path.exists(self.__path):
+            return []
+
+        entries = []
+
+        with open(self.__path, mode="r", encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # La última línea puede estar incompleta si la ejecución se interrumpió al escribirla
+                    continue
+
+                if entry.get("op") == "start":
+                    entries = []
+
+                entries.append(entry)
+
+        return entries
+
+    def __ends_with_newline(self) -> bool:
+        with open(self.__path, mode="rb") as journal_file:
+            journal_file.seek(-1, os.SEEK_END)
+            return journal_file.read(1) == b"\n"
+
+    def __index(self, entry: dict) -> None:
+        self.__entries.append(entry)
+
+        if entry["op"] == "create":
+            self.__created[entry["ref"]] = entry["key"]
+        elif entry["op"] == "link":
+            self.__links.add((entry["inward"], entry["outward"]))
+        elif entry["op"] == "add":
+            self.__added.setdefault(entry["container"], set()).update(entry["keys"])
@@ -0,0 +1,135 @@
+import time
+from threading import Lock
+from typing import Union
+
+
+class TokenBucket:
+    """Cubeta de tokens: permite ráfagas de hasta `burst` peticiones y un ritmo sostenido de `rate` por segundo.
+
+    Es segura entre hilos. Las tareas de asyncio la comparten a través de AsyncClient, que ejecuta
+    cada petición en su pool de hilos, por lo que la espera nunca bloquea el event loop.
+
+    Examples:
+        >>> bucket = TokenBucket(rate=10, burst=20)
+        >>> bucket.acquire()
+        0.0
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Inicializa la cubeta llena.
+
+        Args:
+            rate (float): Tokens que se reponen por segundo.
+            burst (int): Capacidad máxima de la cubeta.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.__rate = rate
+        self.__burst = burst
+        self.__tokens = float(burst)
+        self.__updated_at = time.monotonic()
+        self.__lock = Lock()
+
+    def rate(self) -> float:
+        return self.__rate
+
+    def burst(self) -> int:
+        return self.__burst
+
+    def try_acquire(self) -> float:
+        """Toma un token si hay uno disponible.
+
+        Returns:
+            float: 0 si se tomó el token; si no, los segundos que faltan para que haya uno.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.__burst, self.__tokens + (now - self.__updated_at) * self.__rate)
+            self.__updated_at = now
+
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return 0.0
+
+            return (1 - self.__tokens) / self.__rate
+
+    def acquire(self) -> float:
+        """Toma un token, esperando lo necesario si la cubeta está vacía.
+
+        Returns:
+            float: Los segundos que se esperó.
+        """
+        waited = 0.0
+
+        while (delay := self.try_acquire()) > 0:
+            time.sleep(delay)
+            waited += delay
+
+        return waited
+
+
+class RateLimiter:
+    """Limitador de peticiones de Client con cubetas por prefijo de ruta.
+
+    Cada petición toma un token de la cubeta cuyo prefijo coincide con su ruta (por ejemplo
+    `rest/raven/1.0` para Xray) o, si ninguno coincide, de la cubeta por defecto.
+
+    Examples:
+        >>> Client.configure_rate_limit(RateLimiter(
+        ...     TokenBucket(rate=10, burst=20),
+        ...     {"rest/raven/1.0": TokenBucket(rate=5, burst=5)}
+        ... ))
+        >>> Client.rate_limit_stats()
+        {"default": {"requests": 120, "waited": 3.2}, "rest/raven/1.0": {"requests": 40, "waited": 1.5}}
+    """
+
+    DEFAULT = "default"
+
+    def __init__(self, default: TokenBucket = None, buckets_by_prefix: dict[str, TokenBucket] = None) -> None:
+        """Inicializa el limitador.
+
+        Args:
+            default (TokenBucket, optional): La cubeta de las rutas sin prefijo configurado. None para no limitarlas.
+            buckets_by_prefix (dict, optional): Las cubetas por prefijo de ruta.
+        """
+        self.__default = default
+        self.__buckets = sorted((buckets_by_prefix or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.__stats: dict[str, dict] = {}
+        self.__lock = Lock()
+
+    def bucket(self, path: str) -> tuple[str, Union[TokenBucket, None]]:
+        """Devuelve el nombre y la cubeta que corresponden a una ruta."""
+        path = path.lstrip("/")
+
+        for prefix, bucket in self.__buckets:
+            if path.startswith(prefix.lstrip("/")):
+                return prefix, bucket
+
+        return self.DEFAULT, self.__default
+
+    def acquire(self, path: str) -> float:
+        """Toma un token para una petición a `path`, esperando si es necesario.
+
+        Returns:
+            float: Los segundos que se esperó.
+        """
+        name, bucket = self.bucket(path)
+        waited = bucket.acquire() if bucket is not None else 0.0
+
+        with self.__lock:
+            stats = self.__stats.setdefault(name, {"requests": 0, "waited": 0.0})
+            stats["requests"] += 1
+            stats["waited"] += waited
+
+        return waited
+
+    def stats(self) -> dict[str, dict]:
+        """Devuelve, por cubeta, la cantidad de peticiones y los segundos de espera acumulados."""
+        with self.__lock:
+            return {name: dict(stats) for name, stats in self.__stats.items()}
+
+    def rate(self, path: str) -> Union[float, None]:
+        """Devuelve el ritmo sostenido (peticiones por segundo) para una ruta, o None si no está limitada."""
+        bucket = self.bucket(path)[1]
+        return bucket.rate() if bucket is not None else None
@@ -0,0 +1,230 @@
+import re
+from json import dumps, loads
+from threading import Lock
+from typing import Union
+from requests import Response
+from pyjx.api.rate_limit import RateLimiter
+
+
+PLANNED_KEY_PREFIX = "PLANNED-"
+"""Prefijo de las claves de los issues que se crearían en una ejecución simulada."""
+
+_planned_key = re.compile(rf"{PLANNED_KEY_PREFIX}\d+")
+_issue_key = re.compile(rf"\b(?:[A-Z][A-Z0-9]*-\d+|{PLANNED_KEY_PREFIX}\d+)\b")
+_number = re.compile(r"(?<!api/)(?<=/)\d+(?=/|$)")
+
+
+def endpoint(method: str, path: str) -> str:
+    """Agrupa una petición por su endpoint, reemplazando claves e IDs por marcadores.
+
+    Args:
+        method (str): El método HTTP.
+        path (str): La ruta de la petición, sin parámetros.
+
+    Returns:
+        str: El método y la ruta normalizada.
+
+    Examples:
+        >>> endpoint("GET", "rest/raven/1.0/api/testset/PJX-5/test")
+        "GET rest/raven/1.0/api/testset/{key}/test"
+    """
+    path = _issue_key.sub("{key}", path.lstrip("/"))
+    path = _number.sub("{id}", path)
+
+    return f"{method} {path}"
+
+
+def recorded_response(payload) -> Response:
+    """Construye una respuesta 200 en memoria con el JSON indicado (o vacía si es None)."""
+    response = Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.encoding = "utf-8"
+    response._content = b"" if payload is None else dumps(payload).encode("utf-8")
+    response._content_consumed = True
+
+    return response
+
+
+class RequestRecorder:
+    """Registra las peticiones de Client para simular una ejecución sin modificar Jira.
+
+    Las lecturas (GET) se envían a Jira, salvo las de issues que solo existen en la simulación. Las
+    escrituras (POST, PUT y DELETE) no se envían: se registran y se responden en memoria. Los issues
+    creados reciben claves `PLANNED-n` y se pueden leer, buscar con `id in (...)` y usar como contenedores
+    vacíos, por lo que los factories, modelos y estrategias funcionan sin cambios.
+
+    Examples:
+        >>> recorder = RequestRecorder()
+        >>> Client.configure_recorder(recorder)
+        >>> IssueFactory().create(RequestBodyCreateBuilder().add_summary("").add_issue_type("Test Set").build()).key()
+        "PLANNED-1"
+        >>> recorder.counts()
+        {"POST rest/api/2/issue": {"sent": 0, "recorded": 1}, "GET rest/api/2/issue/{key}": {"sent": 0, "recorded": 1}}
+    """
+
+    def __init__(self) -> None:
+        self.__requests: list[dict] = []
+        self.__planned: dict[str, dict] = {}
+        self.__lock = Lock()
+
+    def intercept(self, method: str, path: str, data: dict) -> Union[Response, None]:
+        """Registra una petición y, si no debe enviarse, devuelve su respuesta simulada.
+
+        Args:
+            method (str): El método HTTP.
+            path (str): La ruta de la petición.
+            data (dict): Los argumentos de la petición (`json`, `data`, `params`, ...).
+
+        Returns:
+            Union[Response, None]: La respuesta simulada, o None si la petición se debe enviar a Jira.
+        """
+        payload = self.__simulate(method, path.lstrip("/"), data)
+        simulated = payload is not False
+
+        with self.__lock:
+            self.__requests.append({
+                "method": method,
+                "path": path,
+                "body": data["json"] if data.get("json") is not None else self.__body(data.get("data")),
+                "params": dict(data.get("params") or {}),
+                "sent": not simulated
+            })
+
+        return recorded_response(payload) if simulated else None
+
+    def requests(self) -> list[dict]:
+        """Devuelve las peticiones registradas, en orden, con `method`, `path`, `body`, `params` y si se enviaron (`sent`)."""
+        with self.__lock:
+            return list(self.__requests)
+
+    def mutations(self) -> list[dict]:
+        """Devuelve las escrituras registradas (que no se enviaron a Jira)."""
+        return [request for request in self.requests() if request["method"] != "GET"]
+
+    def planned_issues(self) -> dict[str, dict]:
+        """Devuelve los issues que se crearían, indexados por su clave simulada."""
+        with self.__lock:
+            return dict(self.__planned)
+
+    def fetched_keys(self) -> list[str]:
+        """Devuelve las claves de los issues que se leyeron de Jira, individualmente o con `id in (...)`."""
+        keys = []
+
+        for request in self.requests():
+            if not request["sent"]:
+                continue
+
+            if (match := re.fullmatch(r"rest/api/2/issue/([^/]+)", request["path"].lstrip("/"))):
+                keys.append(match.group(1))
+            elif "id in (" in (jql := request["params"].get("jql", "")):
+                keys += [key.strip() for key in self.__jql_keys(jql)]
+
+        return list(dict.fromkeys(keys))
+
+    def counts(self) -> dict[str, dict]:
+        """Devuelve, por endpoint, las peticiones enviadas (`sent`) y las simuladas (`recorded`)."""
+        counts: dict[str, dict] = {}
+
+        for request in self.requests():
+            stats = counts.setdefault(endpoint(request["method"], request["path"]), {"sent": 0, "recorded": 0})
+            stats["sent" if request["sent"] else "recorded"] += 1
+
+        return counts
+
+    def estimate(self, limiter: RateLimiter) -> dict[str, dict]:
+        """Estima, por cubeta del limitador, el tiempo mínimo que tomarían las peticiones registradas.
+
+        La estimación solo considera el límite: cada cubeta entrega `burst` peticiones de inmediato y el resto
+        a su ritmo sostenido. Las cubetas se consumen en paralelo, por lo que el tiempo total estimado es el
+        de la cubeta más lenta.
+
+        Args:
+            limiter (RateLimiter): El limitador con el que se ejecutaría el flujo.
+
+        Returns:
+            dict[str, dict]: Por cubeta, las peticiones (`requests`), el ritmo (`rate`, None si no está
+                limitada) y los segundos estimados (`seconds`).
+
+        Examples:
+            >>> recorder.estimate(RateLimiter(TokenBucket(rate=10, burst=20)))
+            {"default": {"requests": 220, "rate": 10, "seconds": 20.0}}
+        """
+        estimate: dict[str, dict] = {}
+
+        for request in self.requests():
+            name, bucket = limiter.bucket(request["path"])
+            stats = estimate.setdefault(name, {"requests": 0, "rate": bucket.rate() if bucket else None, "burst": bucket.burst() if bucket else None})
+            stats["requests"] += 1
+
+        for stats in estimate.values():
+            burst = stats.pop("burst")
+            stats["seconds"] = max(0, stats["requests"] - burst) / stats["rate"] if stats["rate"] else 0.0
+
+        return estimate
+
+    def __simulate(self, method: str, path: str, data: dict):
+        if method != "GET":
+            return self.__mutation(method, path, data)
+
+        if not _planned_key.search(path) and not self.__searches_planned(path, data):
+            return False
+
+        if (match := re.fullmatch(rf"rest/api/2/issue/({PLANNED_KEY_PREFIX}\d+)", path)):
+            return self.__planned_issue(match.group(1))
+
+        if path == "rest/api/2/search":
+            return self.__planned_search(data.get("params", {}))
+
+        # Los contenedores creados en la simulación no tienen miembros en Jira
+        return []
+
+    def __mutation(self, method: str, path: str, data: dict):
+        body = data.get("json") or self.__body(data.get("data")) or {}
+
+        if method == "POST" and path == "rest/api/2/issue":
+            return self.__plan_issue(body)
+
+        if method == "POST" and path == "rest/api/2/issue/bulk":
+            return {"issues": [self.__plan_issue(issue) for issue in body.get("issueUpdates", [])], "errors": []}
+
+        return None
+
+    def __plan_issue(self, body: dict) -> dict:
+        with self.__lock:
+            key = f"{PLANNED_KEY_PREFIX}{len(self.__planned) + 1}"
+            self.__planned[key] = body
+
+        return {"id": key, "key": key, "self": ""}
+
+    def __planned_issue(self, key: str) -> dict:
+        fields = {"issuetype": {"name": "Test"}, **self.planned_issues().get(key, {}).get("fields", {})}
+
+        return {"id": key, "key": key, "fields": fields}
+
+    def __searches_planned(self, path: str, data: dict) -> bool:
+        jql = data.get("params", {}).get("jql", "") if path == "rest/api/2/search" else ""
+
+        return "id in (" in jql and all(_planned_key.fullmatch(key.strip()) for key in self.__jql_keys(jql))
+
+    def __planned_search(self, params: dict) -> dict:
+        keys = self.__jql_keys(params["jql"])
+        start_at = params.get("startAt", 0)
+        max_results = params.get("maxResults", 50)
+
+        return {
+            "startAt": start_at,
+            "total": len(keys),
+            "issues": [self.__planned_issue(key.strip()) for key in keys[start_at:start_at + max_results]]
+        }
+
+    @staticmethod
+    def __body(data):
+        try:
+            return loads(data) if isinstance(data, (str, bytes)) else data
+        except ValueError:
+            return data
+
+    @staticmethod
+    def __jql_keys(jql: str) -> list[str]:
+        return jql[jql.index("id in (") + len("id in ("):jql.index(")", jql.index("id in ("))].split(",")
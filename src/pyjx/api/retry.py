@@ -0,0 +1,150 @@
+import time
+import random
+from threading import Lock
+from typing import Union
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from requests import Response, ConnectionError, Timeout
+
+
+IDEMPOTENT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+"""Estados que se reintentan en métodos idempotentes: límite de peticiones y fallos transitorios del servidor."""
+
+NON_IDEMPOTENT_RETRY_STATUSES = frozenset({429})
+"""Estados que se reintentan en POST: solo el límite de peticiones, porque Jira rechazó la petición sin procesarla."""
+
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+"""Métodos que se reintentan ante errores de conexión o de tiempo de espera, porque repetirlos no duplica cambios."""
+
+
+class RetryPolicy:
+    """Política de reintentos con backoff exponencial y jitter para Client.
+
+    Respeta el encabezado `Retry-After` de Jira Cloud cuando está presente. Los estados que se
+    reintentan se configuran por método HTTP: por defecto GET, PUT y DELETE se reintentan ante
+    429/502/503/504 y POST solo ante 429, para no duplicar issues. Los errores de conexión y de
+    tiempo de espera solo se reintentan en los métodos idempotentes, con el mismo backoff y el mismo
+    máximo de reintentos.
+
+    Examples:
+        >>> Client.configure_retry(RetryPolicy(max_retries=8, backoff_factor=1))
+        >>> Client.retry_stats()
+        {"GET": 3, "POST": 1}
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        statuses_by_method: dict[str, set[int]] = None,
+        error_methods: set[str] = IDEMPOTENT_METHODS
+    ) -> None:
+        """Inicializa la política.
+
+        Args:
+            max_retries (int): Cantidad máxima de reintentos por petición.
+            backoff_factor (float): Segundos de espera antes del primer reintento; se duplica en cada intento.
+            max_backoff (float): Espera máxima entre intentos, incluso si `Retry-After` pide más.
+            jitter (bool): Si es True, la espera se elige al azar entre 0 y el backoff calculado.
+            statuses_by_method (dict, optional): Los estados HTTP que se reintentan para cada método.
+            error_methods (set[str]): Los métodos que se reintentan ante errores de conexión o de tiempo de espera.
+        """
+        self.__max_retries = max_retries
+        self.__backoff_factor = backoff_factor
+        self.__max_backoff = max_backoff
+        self.__jitter = jitter
+        self.__statuses_by_method = {
+            "GET": IDEMPOTENT_RETRY_STATUSES,
+            "PUT": IDEMPOTENT_RETRY_STATUSES,
+            "DELETE": IDEMPOTENT_RETRY_STATUSES,
+            "POST": NON_IDEMPOTENT_RETRY_STATUSES,
+            **(statuses_by_method or {})
+        }
+        self.__error_methods = frozenset(method.upper() for method in error_methods)
+        self.__retries: dict[str, int] = {}
+        self.__lock = Lock()
+
+    def should_retry(self, method: str, response: Response, attempt: int) -> bool:
+        """Indica si la respuesta de un intento debe reintentarse.
+
+        Args:
+            method (str): El método HTTP de la petición.
+            response (Response): La respuesta recibida.
+            attempt (int): La cantidad de reintentos ya realizados para la petición.
+
+        Returns:
+            bool: True si la petición debe repetirse.
+        """
+        statuses = self.__statuses_by_method.get(method.upper(), frozenset())
+        return attempt < self.__max_retries and response.status_code in statuses
+
+    def should_retry_error(self, method: str, error: Exception, attempt: int) -> bool:
+        """Indica si un intento que no obtuvo respuesta debe reintentarse.
+
+        Args:
+            method (str): El método HTTP de la petición.
+            error (Exception): El error lanzado por requests.
+            attempt (int): La cantidad de reintentos ya realizados para la petición.
+
+        Returns:
+            bool: True si el error es de conexión o de tiempo de espera y el método es idempotente.
+        """
+        return attempt < self.__max_retries and isinstance(error, (ConnectionError, Timeout)) and method.upper() in self.__error_methods
+
+    def delay(self, attempt: int, response: Response = None) -> float:
+        """Calcula los segundos de espera antes del siguiente intento.
+
+        Args:
+            attempt (int): La cantidad de reintentos ya realizados para la petición.
+            response (Response, optional): La respuesta que provocó el reintento.
+
+        Returns:
+            float: Los segundos de espera.
+        """
+        retry_after = self.__retry_after(response)
+
+        if retry_after is not None:
+            return min(retry_after, self.__max_backoff)
+
+        backoff = min(self.__backoff_factor * (2 ** attempt), self.__max_backoff)
+
+        return random.uniform(0, backoff) if self.__jitter else backoff
+
+    def wait(self, method: str, attempt: int, response: Response = None) -> None:
+        """Registra un reintento y espera lo indicado por `delay`."""
+        with self.__lock:
+            self.__retries[method.upper()] = self.__retries.get(method.upper(), 0) + 1
+
+        time.sleep(self.delay(attempt, response))
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve la cantidad de reintentos realizados por método HTTP."""
+        with self.__lock:
+            return dict(self.__retries)
+
+    def reset_stats(self) -> None:
+        """Reinicia los contadores de reintentos."""
+        with self.__lock:
+            self.__retries.clear()
+
+    @staticmethod
+    def __retry_after(response: Union[Response, None]) -> Union[float, None]:
+        if response is None or not (value := response.headers.get("Retry-After")):
+            return None
+
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+
+        return max((date - datetime.now(timezone.utc)).total_seconds(), 0)
@@ -0,0 +1,148 @@
+import codecs
+from json import JSONDecoder, JSONDecodeError
+from typing import Iterable, Iterator, Union
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+"""Bytes que se leen del socket en cada paso al decodificar una respuesta en streaming."""
+
+_decoder = JSONDecoder()
+
+
+class JSONArrayStream:
+    """Decodifica de forma incremental los elementos de un arreglo JSON a partir de fragmentos de texto.
+
+    Solo mantiene en memoria el fragmento pendiente y el elemento actual, por lo que el consumo de
+    memoria no depende del tamaño total de la respuesta. El arreglo puede ser la raíz del documento o
+    el valor de una clave de un objeto raíz (por ejemplo `{"total": 2, "tests": [...]}`).
+
+    Examples:
+        >>> list(JSONArrayStream(['[{"key": "PJ', 'X-1"}, {"key": "PJX-2"}]']))
+        [{"key": "PJX-1"}, {"key": "PJX-2"}]
+        >>> list(JSONArrayStream(['{"total": 1, "tests": [{"key": "PJX-1"}]}'], item_path="tests"))
+        [{"key": "PJX-1"}]
+    """
+
+    def __init__(self, chunks: Iterable[Union[str, bytes]], item_path: str = None) -> None:
+        """Inicializa el decodificador.
+
+        Args:
+            chunks (Iterable[Union[str, bytes]]): Los fragmentos del documento. Los bytes se decodifican como UTF-8.
+            item_path (str, optional): La clave del objeto raíz que contiene el arreglo. None si la raíz es el arreglo.
+        """
+        self.__chunks = iter(chunks)
+        self.__item_path = item_path
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__buffer = ""
+        self.__position = 0
+        self.__exhausted = False
+
+    def __iter__(self) -> Iterator:
+        if self.__item_path is None:
+            self.__expect("[")
+        else:
+            self.__enter_item_path()
+
+        if self.__peek() == "]":
+            self.__position += 1
+            return
+
+        while True:
+            yield self.__value()
+
+            separator = self.__peek()
+            self.__position += 1
+
+            if separator == "]":
+                return
+
+            if separator != ",":
+                raise self.__error(f"se esperaba ',' o ']' y se encontró {separator!r}")
+
+    def __enter_item_path(self) -> None:
+        self.__expect("{")
+
+        if self.__peek() == "}":
+            raise self.__error(f"no se encontró la clave {self.__item_path!r}")
+
+        while True:
+            key = self.__value()
+            self.__expect(":")
+
+            if key == self.__item_path:
+                self.__expect("[")
+                return
+
+            self.__value()
+            separator = self.__peek()
+            self.__position += 1
+
+            if separator == "}":
+                raise self.__error(f"no se encontró la clave {self.__item_path!r}")
+
+            if separator != ",":
+                raise self.__error(f"se esperaba ',' o '}}' y se encontró {separator!r}")
+
+    def __value(self):
+        self.__peek()
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.__buffer, self.__position)
+            except JSONDecodeError:
+                if not self.__read():
+                    raise
+
+                continue
+
+            # Un número o literal al final del fragmento puede continuar en el siguiente
+            if end == len(self.__buffer) and not self.__exhausted and self.__read():
+                continue
+
+            self.__position = end
+            self.__compact()
+
+            return value
+
+    def __peek(self) -> str:
+        while True:
+            while self.__position < len(self.__buffer) and self.__buffer[self.__position].isspace():
+                self.__position += 1
+
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+
+            if not self.__read():
+                raise self.__error("fin inesperado del documento")
+
+    def __expect(self, character: str) -> None:
+        found = self.__peek()
+
+        if found != character:
+            raise self.__error(f"se esperaba {character!r} y se encontró {found!r}")
+
+        self.__position += 1
+
+    def __read(self) -> bool:
+        if self.__exhausted:
+            return False
+
+        for chunk in self.__chunks:
+            text = self.__text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+
+            if text:
+                self.__buffer += text
+                return True
+
+        self.__buffer += self.__text_decoder.decode(b"", final=True)
+        self.__exhausted = True
+
+        return False
+
+    def __compact(self) -> None:
+        if self.__position > STREAM_CHUNK_SIZE:
+            self.__buffer = self.__buffer[self.__position:]
+            self.__position = 0
+
+    def __error(self, message: str) -> ValueError:
+        return ValueError(f"JSON inválido en la respuesta: {message}")
@@ -6,7 +6,7 @@ class ClientError(HTTPError):
         self.status_code = response.status_code
         self.reason = response.reason
         self.message = f"Client Error: {self.reason}. Status {self.status_code}. Message: {response.text}. For more information visit https://developer.mozilla.org/es/docs/Web/HTTP/Status/{self.status_code}"
-        super().__init__(self.message)
+        super().__init__(self.message, response=response)
 
     def __str__(self):
         return self.message
@@ -17,7 +17,7 @@ class ServerError(HTTPError):
         self.status_code = response.status_code
         self.reason = response.reason
         self.message = f"Server Error: {self.reason}. Status {self.status_code}. Message: {response.text}. For more information visit https://developer.mozilla.org/es/docs/Web/HTTP/Status/{self.status_code}"
-        super().__init__(self.message)
+        super().__init__(self.message, response=response)
     
     def __str__(self):
         return self.message
@@ -0,0 +1,69 @@
+import sys
+from threading import Lock
+from types import MappingProxyType
+
+
+NAMED_FIELDS = ("issuetype", "status", "priority", "resolution")
+"""Campos de Jira con un conjunto pequeño de valores de los que solo se conserva el nombre."""
+
+_named_values: dict[tuple[str, str], MappingProxyType] = {}
+_named_values_lock = Lock()
+
+
+def named_value(field: str, name: str) -> MappingProxyType:
+    """Devuelve el valor compartido (inmutable) de un campo con nombre, por ejemplo el tipo "Test".
+
+    Todos los issues compactos con el mismo valor comparten la misma instancia y el mismo nombre internado.
+
+    Args:
+        field (str): El nombre del campo, por ejemplo "issuetype".
+        name (str): El nombre del valor, por ejemplo "Test".
+
+    Returns:
+        MappingProxyType: Un mapeo de solo lectura con la forma `{"name": name}`.
+    """
+    key = (field, name)
+
+    if (value := _named_values.get(key)) is None:
+        with _named_values_lock:
+            value = _named_values.setdefault(key, MappingProxyType({"name": sys.intern(name)}))
+
+    return value
+
+
+def compact_details(details: dict, fields: list[str] = None) -> dict:
+    """Reduce el JSON de un issue a lo que usan los modelos.
+
+    Conserva `id`, `key` y `self`, y de `fields` solo los campos de la proyección (todos si es None) que
+    tienen valor. Los campos de `NAMED_FIELDS` se reemplazan por su valor compartido `{"name": ...}`,
+    descartando íconos, descripciones y URLs que Jira repite en cada issue. Se descarta `expand`.
+
+    Args:
+        details (dict): El JSON del issue tal como lo devuelve la API de Jira.
+        fields (list[str], optional): La proyección con la que se recuperó el issue.
+
+    Returns:
+        dict: El JSON reducido.
+
+    Examples:
+        >>> compact_details({"expand": "...", "id": "10001", "key": "PJX-1", "fields": {
+        ...     "issuetype": {"id": "10100", "name": "Test", "iconUrl": "..."}, "summary": "Login", "labels": []
+        ... }}, fields=["issuetype", "summary"])
+        {"id": "10001", "key": "PJX-1", "fields": {"issuetype": {"name": "Test"}, "summary": "Login"}}
+    """
+    wanted = set(fields) if fields is not None else None
+    compact_fields = {}
+
+    for name, value in details.get("fields", {}).items():
+        if value is None or (wanted is not None and name not in wanted):
+            continue
+
+        if name in NAMED_FIELDS and isinstance(value, dict) and "name" in value:
+            value = named_value(name, value["name"])
+
+        compact_fields[name] = value
+
+    compact = {name: details[name] for name in ("id", "key", "self") if name in details}
+    compact["fields"] = compact_fields
+
+    return compact
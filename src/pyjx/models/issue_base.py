@@ -1,19 +1,25 @@
 from json import dumps
-from api.client import Client
+from pyjx.api.client import Client
 from abc import ABC
 
 class IssueBase(ABC):
-    def __init__(self, fields: dict, factory, observers) -> None:
+    __slots__ = ("__fields", "__client", "__factory", "__observers", "__issue_deleted", "__projection", "__loader")
+
+    def __init__(self, fields: dict, factory, observers: list = None) -> None:
         """Inicializa una nueva instancia de IssueBase.
 
         Args:
             fields (dict): Un diccionario con los campos del Issue.
+            factory (IssueFactory): La fábrica que creó el Issue.
+            observers (list, optional): Observadores que reciben las notificaciones del Issue.
         """
         self.__fields = fields
         self.__client = Client
         self.__factory = factory
-        self.__observers = observers
+        self.__observers = observers or []
         self.__issue_deleted = False
+        self.__projection = None
+        self.__loader = None
 
     def key(self) -> str:
         """Devuelve la clave del Issue.
@@ -37,7 +43,7 @@ class IssueBase(ABC):
             >>> issue.issuetype()
             "PJX-1"
         """
-        return self.__fields.get("fields", {}).get("issuetype", {}).get("name", {})
+        return (self.field("issuetype") or {}).get("name", {})
 
     def id(self) -> str:
         """Devuelve el id del Issue.
@@ -49,6 +55,9 @@ class IssueBase(ABC):
             >>> issue.id()
             "123131"
         """
+        if self.__fields.get("id") is None and self.__projection is not None:
+            self.load()
+
         return str(self.__fields.get("id"))
 
     def summary(self) -> str:
@@ -61,11 +70,88 @@ class IssueBase(ABC):
             >>> issue.summary()
             "This is a summary"
         """
-        return self.__fields.get("fields", {}).get("summary", None)
+        return self.field("summary")
+
+    def field(self, name: str):
+        """Devuelve un campo del Issue.
+
+        Si el Issue se recuperó con una proyección que no incluye el campo, primero se cargan todos sus campos.
+
+        Args:
+            name (str): El nombre del campo en Jira.
+
+        Returns:
+            Any: El valor del campo, o None si el Issue no lo tiene.
+
+        Examples:
+            >>> issue.field("labels")
+            ["regression"]
+        """
+        if name not in self.__fields.get("fields", {}) and self.__projection is not None and name not in self.__projection:
+            self.load()
+
+        return self.__fields.get("fields", {}).get(name)
+
+    def set_projection(self, fields: list[str]) -> None:
+        """Indica que el Issue se recuperó solo con los campos `fields`.
+
+        Args:
+            fields (list[str]): Los campos recuperados. None si se recuperaron todos.
+
+        Examples:
+            >>> issue.set_projection(["issuetype", "summary"])
+        """
+        self.__projection = frozenset(fields) if fields is not None else None
+
+    def is_partial(self) -> bool:
+        """Indica si el Issue se recuperó con una proyección de campos.
+
+        Examples:
+            >>> issue_factory.get("PJX-1", fields=["summary"]).is_partial()
+            True
+        """
+        return self.__projection is not None
+
+    def has_fields(self, fields: list[str] = None) -> bool:
+        """Indica si el Issue ya tiene cargados los campos `fields` (todos si es None)."""
+        if self.__projection is None:
+            return True
+
+        return fields is not None and self.__projection.issuperset(fields)
+
+    def set_loader(self, loader) -> None:
+        """Delega la carga de los campos del Issue en `loader`, que los carga junto con los de otros Issues.
+
+        Args:
+            loader (Callable[[IssueBase], None]): Recibe el Issue y debe llamar a su `load(details)`. None para
+                cargarlo por sí mismo.
+        """
+        self.__loader = loader
+
+    def load(self, details: dict = None) -> None:
+        """Carga todos los campos de un Issue recuperado con una proyección.
+
+        Args:
+            details (dict, optional): El JSON completo del Issue, si ya se recuperó. Si es None, se pide a Jira
+                (o al cargador del Issue).
+
+        Examples:
+            >>> issue.load()
+        """
+        if details is None and self.__loader is not None:
+            self.__loader(self)
+            return
+
+        details = details if details is not None else self.__client.get(f"rest/api/2/issue/{self.key()}")
+        self.__fields = self.__factory.model_details(details)
+        self.__projection = None
+        self.__loader = None
     
     def json(self) -> dict:
         """Devuelve los campos del Issue obtenidos de la API de Jira.
 
+        Si el Issue es parcial (`is_partial()`), solo contiene los campos de su proyección.
+
         Returns:
             dict: Los campos del Issue.
 
@@ -112,6 +198,7 @@ class IssueBase(ABC):
 
         self.__client.put(f"rest/api/2/issue/{self.key()}", data=dumps(fields), headers=headers)
         self.__update_fields(fields)
+        self.__factory.invalidate(self)
 
     def delete(self) -> None:
         """Elimina el Issue.
@@ -121,6 +208,7 @@ class IssueBase(ABC):
         """
         self.__client.delete(f"rest/api/2/issue/{self.key()}")
         self.__issue_deleted = True
+        self.__factory.invalidate(self)
     
     def exists(self) -> bool:
         """Verifica si el Issue existe en Jira.
@@ -0,0 +1,96 @@
+import time
+from threading import Lock
+from typing import Callable
+
+
+class Membership:
+    """Memoriza los issues que contiene un Test Set, Test Execution o Test Plan.
+
+    La lista se pide a Xray en el primer uso y se conserva hasta que se llama a `refresh()` o, si se
+    indica `max_age`, hasta que pasan esos segundos. Las altas y bajas del propio modelo se aplican
+    localmente con `add` y `remove`, sin volver a pedir la lista.
+
+    Examples:
+        >>> membership = Membership(lambda: factory.proxies(Client.get(f"rest/raven/1.0/api/testset/{key}/test")))
+        >>> membership.items()
+        [Test(key=PJX-2, ...)]
+        >>> membership.keys()
+        ["PJX-2"]
+    """
+
+    def __init__(self, fetch: Callable[[], list], max_age: float = None) -> None:
+        """Inicializa la membresía sin pedirla.
+
+        Args:
+            fetch (Callable[[], list]): Pide a Xray los issues de la membresía.
+            max_age (float, optional): Segundos tras los que la membresía se vuelve a pedir. None para no expirar.
+        """
+        self.__fetch = fetch
+        self.__max_age = max_age
+        self.__items = None
+        self.__fetched_at = 0.0
+        self.__lock = Lock()
+
+    def items(self) -> list:
+        """Devuelve los issues de la membresía, pidiéndolos solo si no se tienen o están vencidos."""
+        with self.__lock:
+            if self.__is_stale():
+                self.__load()
+
+            return list(self.__items)
+
+    def keys(self) -> list[str]:
+        """Devuelve las claves de los issues de la membresía."""
+        return [issue.key() for issue in self.items()]
+
+    def refresh(self) -> list:
+        """Vuelve a pedir la membresía a Xray.
+
+        Returns:
+            list: Los issues de la membresía.
+        """
+        with self.__lock:
+            self.__load()
+
+            return list(self.__items)
+
+    def invalidate(self) -> None:
+        """Descarta la membresía memorizada; el siguiente uso la vuelve a pedir."""
+        with self.__lock:
+            self.__items = None
+
+    def add(self, issues: list) -> None:
+        """Agrega localmente los issues que aún no forman parte de la membresía.
+
+        Args:
+            issues (list): Los issues agregados en Xray.
+        """
+        with self.__lock:
+            if self.__items is None:
+                return
+
+            present = {issue.key() for issue in self.__items}
+            self.__items += [issue for issue in issues if issue.key() not in present]
+
+    def remove(self, keys: list[str]) -> None:
+        """Quita localmente los issues de la membresía.
+
+        Args:
+            keys (list[str]): Las claves de los issues quitados en Xray.
+        """
+        with self.__lock:
+            if self.__items is None:
+                return
+
+            removed = {str(key).upper() for key in keys}
+            self.__items = [issue for issue in self.__items if str(issue.key()).upper() not in removed]
+
+    def __is_stale(self) -> bool:
+        if self.__items is None:
+            return True
+
+        return self.__max_age is not None and time.monotonic() - self.__fetched_at > self.__max_age
+
+    def __load(self) -> None:
+        self.__items = list(self.__fetch())
+        self.__fetched_at = time.monotonic()
@@ -1,14 +1,18 @@
-from models.issue_base import IssueBase
+import sys
+from pyjx.models.issue_base import IssueBase
 
 class Test(IssueBase):
     """Representa un issue tipo "Test".
 
     Contiene métodos para obtener la información de los tests de su contenido.
     """
+    __slots__ = ("__test_execution_key", "__test_set_key", "__test_plan_key", "__test_run_id", "__test_execution_status")
 
     def __init__(self, details: dict, factory):
         super().__init__(details, factory)
         self.__test_execution_key = None
+        self.__test_set_key = None
+        self.__test_plan_key = None
         self.__test_run_id = None
         self.__test_execution_status = "NotDefined"
     
@@ -102,7 +106,7 @@ class Test(IssueBase):
         Args:
             status (str): El estado de la ejecución del Test.
         """
-        self.__test_execution_status = status
+        self.__test_execution_status = sys.intern(status) if isinstance(status, str) else status
 
     def __repr__(self) -> str:
-        return f"Test(key={self.key()}, test_execution={self.__test_execution_key}, test_run={self.__test_run_data.get("id", "NotDefined")}, status={self.__test_execution_status}, summary={self.summary()})"
+        return f"Test(key={self.key()}, test_execution={self.__test_execution_key}, test_run={self.__test_run_id}, status={self.__test_execution_status}, summary={self.summary()})"
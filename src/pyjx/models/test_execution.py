@@ -1,14 +1,57 @@
-from models.issue_base import IssueBase
-from models.test import Test
+from typing import Iterator, Union
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from pyjx.api.client import Client
+from pyjx.api.batching import chunk
+from pyjx.errors import ClientError, ServerError
+from pyjx.models.issue_base import IssueBase
+from pyjx.models.test import Test
+from pyjx.models.membership import Membership
+
+
+IMPORT_BATCH_SIZE = 500
+"""Número máximo de resultados por cada envío a `rest/raven/1.0/import/execution`."""
+
+TEST_RUN_PAGE_SIZE = 200
+"""Número de test runs por página de `rest/raven/1.0/api/testexec/{key}/test`."""
+
+
+def status_outcome(status: str, error: str = None, via: str = "import") -> dict:
+    """Construye el resultado de la actualización de estado de un test.
+
+    Args:
+        status (str): El estado solicitado.
+        error (str, optional): El mensaje de error si no se pudo actualizar.
+        via (str, optional): "import" si se actualizó con la importación de resultados o "testrun" si fue por test run.
+
+    Returns:
+        dict: Un diccionario con las claves "status", "updated", "via" y "error".
+    """
+    return {
+        "status": status,
+        "updated": error is None,
+        "via": via,
+        "error": error
+    }
 
 class TestExecution(IssueBase):
+    __slots__ = ("__client", "__factory", "__tests", "__runs", "__runs_lock")
+
     def __init__(self, details: dict, factory):
         super().__init__(details, factory)
-        self.__tests = None
+        self.__client = Client
+        self.__factory = factory
+        self.__tests = Membership(self.__fetch_tests, factory.membership_ttl())
+        # Los Tests son compartidos entre Test Executions (y con el caché del factory): el test run de cada uno
+        # en este Test Execution se guarda aquí, no en el Test
+        self.__runs: dict[str, dict] = {}
+        self.__runs_lock = Lock()
 
     def tests(self):
         """Devuelve los tests asociados al Test Execution.
 
+        La lista se pide a Xray en el primer uso y se memoriza hasta `refresh()`.
+
         Returns:
             list: Una lista de tests asociados al Test Execution.
 
@@ -25,12 +68,63 @@ class TestExecution(IssueBase):
                 }
             ]
         """
-        self.__set_tests()
-        return self.__tests
+        return self.__tests.items()
+
+    def refresh(self) -> None:
+        """Vuelve a pedir a Xray los tests asociados al Test Execution.
+
+        Examples:
+            >>> test_execution.refresh()
+        """
+        self.__tests.refresh()
+
+    def __fetch_tests(self) -> list:
+        # Xray devuelve el ID del test run, no el del issue, en el campo `id` de cada elemento
+        runs = {run["key"]: {"id": run["id"], "status": run.get("status")} for run in self.__test_runs()}
+
+        with self.__runs_lock:
+            self.__runs = runs
+
+        return self.__factory.proxies([{"key": key} for key in runs])
+
+    def __test_runs(self) -> Iterator[dict]:
+        page = 1
+
+        while True:
+            params = {
+                "limit": TEST_RUN_PAGE_SIZE,
+                "page": page
+            }
+            count = 0
 
-    def __set_tests(self):
-        response_json = self.__client.get(f"rest/raven/1.0/api/testexec/{self.key()}/test")
-        self.__tests = self.__factory.bulk_get([test["key"] for test in response_json])
+            for run in self.__client.stream(f"rest/raven/1.0/api/testexec/{self.key()}/test", params=params):
+                count += 1
+                yield run
+
+            if count < TEST_RUN_PAGE_SIZE:
+                return
+
+            page += 1
+
+    def test_runs(self) -> dict[str, dict]:
+        """Devuelve el test run de cada test del Test Execution, indexado por la clave del test.
+
+        Los test runs se obtienen en la misma consulta paginada a Xray que usa `tests()`, sin consultas adicionales
+        por test. Pertenecen a este Test Execution: los Tests no se modifican, porque son compartidos con otros
+        Test Executions.
+
+        Returns:
+            dict[str, dict]: El `id` y el `status` del test run de cada test. Los tests que se agregaron después de
+                la consulta tienen `id` None hasta que se actualiza su estado.
+
+        Examples:
+            >>> test_execution.test_runs()["PJX-1"]
+            {"id": 4512, "status": "TODO"}
+        """
+        keys = self.__tests.keys()
+
+        with self.__runs_lock:
+            return {key: dict(self.__runs.get(key, {"id": None, "status": None})) for key in keys}
 
     def test_keys(self):
         """Devuelve las claves de los tests asociados al Test Set.
@@ -42,7 +136,7 @@ class TestExecution(IssueBase):
             >>> test_set.test_keys()
             ["PJX-1", "PJX-2"]
         """
-        return [test.key() for test in self.__tests]
+        return self.__tests.keys()
 
     def add(self, issue_keys: list[str]) -> None:
         """Agrega tests al Test Execution.
@@ -62,7 +156,14 @@ class TestExecution(IssueBase):
         }
 
         response_json = self.__client.post(f"rest/raven/1.0/api/testexec/{self.key()}/test", json=data, headers=headers)
-        self.__set_tests()
+
+        for key in [self.key(), *issue_keys]:
+            self.__factory.invalidate(key)
+
+        if response_json:
+            self.__tests.invalidate()
+        else:
+            self.__tests.add(self.__factory.proxies([{"key": key} for key in issue_keys]))
 
         return response_json
 
@@ -84,7 +185,14 @@ class TestExecution(IssueBase):
         }
 
         response_json = self.__client.post(f"rest/raven/1.0/api/testexec/{self.key()}/test", json=data, headers=headers)
-        self.__set_tests()
+
+        for key in [self.key(), *issue_keys]:
+            self.__factory.invalidate(key)
+
+        if response_json:
+            self.__tests.invalidate()
+        else:
+            self.__tests.remove(issue_keys)
 
         return response_json
 
@@ -98,11 +206,14 @@ class TestExecution(IssueBase):
             >>> test_execution.test_count()
             2
         """
-        return len(self.__tests)
+        return len(self.__tests.items())
 
     def set_test_status(self, test: Test, status: str) -> None:
         """Establece el estado de los tests en el Test Execution.
 
+        El test run es el que se asignó al Test con `set_test_run_id`, si tiene uno; si no, el de `test_runs()`, o
+        se consulta a Xray si el test aún no pertenecía al Test Execution. El estado también se asigna al Test.
+
         Args:
             test (Test): El test al que se le va a establecer el estado.
             status (str): El estado a establecer en el test.
@@ -113,8 +224,119 @@ class TestExecution(IssueBase):
         params = {
             "status": status.upper()
         }
-        self.__client.put(f"rest/raven/1.0/api/testrun/{test.test_run_id()}/status", params=params)
-        test.set_test_run_status(status)
+        test_run_id = self.__resolve_test_run_id(test.key(), test)
+        self.__client.put(f"rest/raven/1.0/api/testrun/{test_run_id}/status", params=params)
+        self.__record_run(test.key(), test_run_id, status.upper())
+        test.set_test_run_status(status.upper())
+
+    def set_test_statuses(self, statuses: dict[Union[Test, str], str], batch_size: int = IMPORT_BATCH_SIZE) -> dict[str, dict]:
+        """Establece el estado de varios tests del Test Execution en lotes.
+
+        Los estados se envían a la importación de resultados de Xray (`rest/raven/1.0/import/execution`) en lotes
+        de `batch_size` tests. Si la importación de un lote falla, sus tests se actualizan de forma concurrente
+        con `PUT rest/raven/1.0/api/testrun/{id}/status`, respetando el límite de concurrencia del factory. Los IDs
+        de los test runs se toman de `test_runs()`; solo se consultan uno a uno los de tests que aún no pertenecían
+        al Test Execution.
+
+        La importación agrega al Test Execution los tests que no pertenecían a él. A los tests indicados como `Test`
+        se les asigna el estado enviado, y su test run se elige como en `set_test_status`.
+
+        Args:
+            statuses (dict[Union[Test, str], str]): Los estados a establecer, indexados por test o por clave de test.
+            batch_size (int, optional): El número máximo de tests por importación.
+
+        Returns:
+            dict[str, dict]: El resultado de cada test, indexado por su clave. Ver `status_outcome`.
+
+        Examples:
+            >>> test_execution.set_test_statuses({test: "PASS", "PJX-2": "FAIL"})
+            {"PJX-1": {"status": "PASS", "updated": True, "via": "import", "error": None}, "PJX-2": {...}}
+        """
+        pending = {}
+
+        for test, status in statuses.items():
+            key = test.key() if isinstance(test, Test) else test
+            pending[key] = (test if isinstance(test, Test) else None, status.upper())
+
+        outcomes = {}
+        failed = []
+
+        for batch in chunk(list(pending.items()), batch_size):
+            data = {
+                "testExecutionKey": self.key(),
+                "tests": [{"testKey": key, "status": status} for key, (_, status) in batch]
+            }
+
+            try:
+                self.__client.post("rest/raven/1.0/import/execution", json=data)
+            except (ClientError, ServerError):
+                failed.extend(batch)
+                continue
+
+            for key, (test, status) in batch:
+                self.__record_run(key, None, status)
+                outcomes[key] = status_outcome(status)
+
+                if test is not None:
+                    test.set_test_run_status(status)
+
+            self.__tests.add(self.__factory.proxies([{"key": key} for key, _ in batch]))
+
+        if failed:
+            outcomes.update(self.__set_test_run_statuses(failed))
+
+        return {key: outcomes[key] for key in pending}
+
+    def __set_test_run_statuses(self, items: list[tuple]) -> dict[str, dict]:
+        limit = self.__factory.concurrency_limit()
+        self.__tests.items()
+
+        def set_status(item: tuple) -> tuple[str, dict]:
+            key, (test, status) = item
+
+            try:
+                test_run_id = self.__resolve_test_run_id(key, test)
+                limit.run(self.__client.put, f"rest/raven/1.0/api/testrun/{test_run_id}/status", params={"status": status}, operation="test_run_status")
+            except (ClientError, ServerError) as error:
+                return key, status_outcome(status, error.message, via="testrun")
+
+            self.__record_run(key, test_run_id, status)
+
+            if test is not None:
+                test.set_test_run_status(status)
+
+            return key, status_outcome(status, via="testrun")
+
+        with ThreadPoolExecutor(max_workers=min(limit.max_limit(), len(items)), thread_name_prefix="pyjx-testrun") as executor:
+            return dict(executor.map(set_status, items))
+
+    def __resolve_test_run_id(self, test_key: str, test: Union[Test, None]) -> int:
+        if test is not None and test.test_run_id() is not None:
+            return test.test_run_id()
+
+        with self.__runs_lock:
+            test_run_id = self.__runs.get(test_key, {}).get("id")
+
+        if test_run_id is None:
+            test_run_id = self.__test_run_id(test_key)
+
+        return test_run_id
+
+    def __record_run(self, test_key: str, test_run_id: Union[int, None], status: str) -> None:
+        with self.__runs_lock:
+            run = self.__runs.setdefault(test_key, {"id": None, "status": None})
+            run["status"] = status
+
+            if test_run_id is not None:
+                run["id"] = test_run_id
+
+    def __test_run_id(self, test_key: str) -> int:
+        params = {
+            "testExecIssueKey": self.key(),
+            "testIssueKey": test_key
+        }
+
+        return self.__client.get("rest/raven/1.0/api/testrun", params=params)["id"]
 
     def add_attachment_to_test(self, test: Test, attachment_data: dict) -> None:
         """Agrega un archivo adjunto al test dentro del Test Execution.
@@ -130,7 +352,7 @@ class TestExecution(IssueBase):
                 contentType: "text/plain"
             })
         """
-        self.__client.post(f"rest/raven/1.0/api/testrun/{test.test_run_id()}/attachment", json=attachment_data)
+        self.__client.post(f"rest/raven/1.0/api/testrun/{self.__resolve_test_run_id(test.key(), test)}/attachment", json=attachment_data)
 
     def __repr__(self) -> str:
         return f"TestExecution(key={self.key()}, summary={self.summary()}, tests={self.test_count()}"
@@ -1,14 +1,22 @@
-from models.issue_base import IssueBase
+from pyjx.api.client import Client
+from pyjx.models.issue_base import IssueBase
+from pyjx.models.membership import Membership
 
 class TestPlan(IssueBase):
+    __slots__ = ("__client", "__factory", "__tests", "__test_executions")
+
     def __init__(self, details: dict, factory):
         super().__init__(details, factory)
-        self.__tests = None
-        self.__test_executions = None
+        self.__client = Client
+        self.__factory = factory
+        self.__tests = Membership(self.__fetch_tests, factory.membership_ttl())
+        self.__test_executions = Membership(self.__fetch_test_executions, factory.membership_ttl())
     
     def tests(self) -> list:
         """Devuelve los tests asociados al Test Plan.
 
+        La lista se pide a Xray en el primer uso y se memoriza hasta `refresh()`.
+
         Returns:
             list: Una lista de tests asociados al Test Plan.
 
@@ -25,12 +33,10 @@ class TestPlan(IssueBase):
                 }
             ]
         """
-        self.__set_tests()
-        return self.__tests
+        return self.__tests.items()
 
-    def __set_tests(self):
-        response_json = self.__client.get(f"rest/raven/1.0/api/testplan/{self.key()}/test")
-        self.__tests = self.__factory.bulk_get([test["key"] for test in response_json])
+    def __fetch_tests(self) -> list:
+        return self.__factory.proxies(self.__client.stream(f"rest/raven/1.0/api/testplan/{self.key()}/test"))
 
     def test_keys(self):
         """Devuelve las claves de los tests asociados al Test Set.
@@ -42,7 +48,7 @@ class TestPlan(IssueBase):
             >>> test_set.test_keys()
             ["PJX-1", "PJX-2"]
         """
-        return [test.key() for test in self.__tests]
+        return self.__tests.keys()
 
     def test_executions(self) -> list:
         """Devuelve los test executions asociados al Test Plan.
@@ -63,12 +69,10 @@ class TestPlan(IssueBase):
                 }
             ]
         """
-        self.__set_test_executions()
-        return self.__test_executions
+        return self.__test_executions.items()
 
-    def __set_test_executions(self):
-        response_json = self.__client.get(f"rest/raven/1.0/api/testplan/{self.key()}/testexecution")
-        self.__test_executions = self.__factory.bulk_get([test["key"] for test in response_json])
+    def __fetch_test_executions(self) -> list:
+        return self.__factory.proxies(self.__client.stream(f"rest/raven/1.0/api/testplan/{self.key()}/testexecution"), issuetype="Test Execution")
 
     def test_execution_keys(self):
         """Devuelve las claves de los tests asociados al Test Set.
@@ -80,7 +84,7 @@ class TestPlan(IssueBase):
             >>> test_set.test_keys()
             ["PJX-1", "PJX-2"]
         """
-        return [test.key() for test in self.test_executions()]
+        return self.__test_executions.keys()
 
     def add_test_executions(self, test_execution_keys: dict) -> None:
         """Agrega test executions al Test Plan.
@@ -99,8 +103,18 @@ class TestPlan(IssueBase):
         "Accept": "application/json",
         "Content-Type": "application/json"
         }
-        self.__client.post(f"rest/raven/1.0/api/testplan/{self.key()}/testexecution", json=data, headers=headers)
-        self.test_executions()
+        response_json = self.__client.post(f"rest/raven/1.0/api/testplan/{self.key()}/testexecution", json=data, headers=headers)
+
+        for key in [self.key(), *test_execution_keys]:
+            self.__factory.invalidate(key)
+
+        # `addTestsToPlan` también agrega al plan los tests de las ejecuciones
+        self.__tests.invalidate()
+
+        if response_json:
+            self.__test_executions.invalidate()
+        else:
+            self.__test_executions.add(self.__factory.proxies([{"key": key} for key in test_execution_keys], issuetype="Test Execution"))
     
     def remove_test_executions(self, test_execution_keys: dict) -> None:
         """Remueve test executions del Test Plan.
@@ -118,8 +132,15 @@ class TestPlan(IssueBase):
         "Accept": "application/json",
         "Content-Type": "application/json"
         }
-        self.__client.post(f"rest/raven/1.0/api/testplan/{self.key()}/testexecution", json=data, headers=headers)
-        self.test_executions()
+        response_json = self.__client.post(f"rest/raven/1.0/api/testplan/{self.key()}/testexecution", json=data, headers=headers)
+
+        for key in [self.key(), *test_execution_keys]:
+            self.__factory.invalidate(key)
+
+        if response_json:
+            self.__test_executions.invalidate()
+        else:
+            self.__test_executions.remove(test_execution_keys)
     
     def test_count(self) -> int:
         """Devuelve la cantidad de tests asociados al Test Plan.
@@ -131,7 +152,7 @@ class TestPlan(IssueBase):
             >>> test_plan.test_count()
             2
         """
-        return len(self.__tests)
+        return len(self.__tests.items())
     
     def test_execution_count(self) -> int:
         """Devuelve la cantidad de test executions asociados al Test Plan.
@@ -143,7 +164,16 @@ class TestPlan(IssueBase):
             >>> test_plan.test_execution_count()
             2
         """
-        return len(self.__set_test_executions)
+        return len(self.__test_executions.items())
+
+    def refresh(self) -> None:
+        """Vuelve a pedir a Xray los tests y test executions asociados al Test Plan.
+
+        Examples:
+            >>> test_plan.refresh()
+        """
+        self.__tests.refresh()
+        self.__test_executions.refresh()
 
     def __repr__(self) -> str:
         return f"TestPlan(key={self.key()}, summary={self.summary()})"
@@ -1,18 +1,25 @@
-from models.issue_base import IssueBase
+from pyjx.api.client import Client
+from pyjx.models.issue_base import IssueBase
+from pyjx.models.membership import Membership
 
 class TestSet(IssueBase):
     """Representa un issue tipo "Test Set".
 
     Contiene métodos para obtener la información de los tests de su contenido. Un metodo para agregar un o mas tests y uno mas para removerlos.
     """
+    __slots__ = ("__client", "__factory", "__tests")
 
     def __init__(self, details: dict, factory):
         super().__init__(details, factory)
-        self.__tests = None
+        self.__client = Client
+        self.__factory = factory
+        self.__tests = Membership(self.__fetch_tests, factory.membership_ttl())
 
     def tests(self):
         """Devuelve los tests asociados al Test Set.
 
+        La lista se pide a Xray en el primer uso y se memoriza hasta `refresh()`.
+
         Returns:
             list: Una lista de tests asociados al Test Set.
 
@@ -29,8 +36,7 @@ class TestSet(IssueBase):
                 }
             ]
         """
-        self.__set_tests()
-        return self.__tests
+        return self.__tests.items()
     
     def test_keys(self):
         """Devuelve las claves de los tests asociados al Test Set.
@@ -42,7 +48,7 @@ class TestSet(IssueBase):
             >>> test_set.test_keys()
             ["PJX-1", "PJX-2"]
         """
-        return [test.key() for test in self.tests()]
+        return self.__tests.keys()
 
     def test_count(self):
         """Devuelve la cantidad de tests asociados al Test Set.
@@ -54,11 +60,18 @@ class TestSet(IssueBase):
             >>> test_set.test_count()
             2
         """
-        return len(self.__tests)
+        return len(self.__tests.items())
+
+    def refresh(self) -> None:
+        """Vuelve a pedir a Xray los tests asociados al Test Set.
+
+        Examples:
+            >>> test_set.refresh()
+        """
+        self.__tests.refresh()
 
-    def __set_tests(self):
-        response_json = self.__client.get(f"rest/raven/1.0/api/testset/{self.key()}/test")
-        self.__tests = self.__factory.bulk_get([test["key"] for test in response_json])
+    def __fetch_tests(self) -> list:
+        return self.__factory.proxies(self.__client.stream(f"rest/raven/1.0/api/testset/{self.key()}/test"))
 
     def add(self, test_keys: list[str]):
         """Agrega tests al Test Set.
@@ -77,8 +90,15 @@ class TestSet(IssueBase):
         "Content-Type": "application/json"
         }
 
-        self.__client.post(f"rest/raven/1.0/api/testset/{self.key()}/test", json=data, headers=headers)
-        self.__set_tests()
+        response_json = self.__client.post(f"rest/raven/1.0/api/testset/{self.key()}/test", json=data, headers=headers)
+
+        for key in [self.key(), *test_keys]:
+            self.__factory.invalidate(key)
+
+        if response_json:
+            self.__tests.invalidate()
+        else:
+            self.__tests.add(self.__factory.proxies([{"key": key} for key in test_keys]))
 
     def remove(self, test_keys: list[str]):
         """Remueve tests del Test Set.
@@ -97,8 +117,15 @@ class TestSet(IssueBase):
         "Content-Type": "application/json"
         }
 
-        self.__client.post(f"rest/raven/1.0/api/testset/{self.key()}/test", json=data, headers=headers)
-        self.__set_tests()
+        response_json = self.__client.post(f"rest/raven/1.0/api/testset/{self.key()}/test", json=data, headers=headers)
+
+        for key in [self.key(), *test_keys]:
+            self.__factory.invalidate(key)
+
+        if response_json:
+            self.__tests.invalidate()
+        else:
+            self.__tests.remove(test_keys)
 
     def __repr__(self) -> str:
         return f"TestSet(key={self.key()}, summary={self.summary()}, tests={self.test_count()})"
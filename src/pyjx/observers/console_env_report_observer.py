@@ -1,5 +1,11 @@
 from .base_report_observer import BaseReportObserver
 
 class ConsoleEnvReportObserver(BaseReportObserver):
+    def __init__(self, prefix: str = None) -> None:
+        self.__prefix = prefix
+
     def update(self, issue, message, timestamp):
+        if self.__prefix is not None:
+            message = f"[{self.__prefix}] {message}"
+
         print(timestamp, message)
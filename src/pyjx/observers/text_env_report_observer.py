@@ -1,10 +1,20 @@
+from threading import Lock
+from typing import ClassVar
 from .base_report_observer import BaseReportObserver
 
 class TextEnvReportObserver(BaseReportObserver):
-    def __init__(self, path: str) -> None:
+    __lock: ClassVar[Lock] = Lock()
+
+    def __init__(self, path: str, prefix: str = None) -> None:
         self.__path = path
+        self.__prefix = prefix
 
     def update(self, issue, message, timestamp):
-        with open(self.__path, mode="a", encoding="utf-8") as reporter:
-            content = timestamp + " " + message + " " + repr(issue)
+        if self.__prefix is not None:
+            message = f"[{self.__prefix}] {message}"
+
+        content = timestamp + " " + message + " " + repr(issue) + "\n"
+
+        # Las ambientaciones de un lote escriben en el mismo archivo desde varios hilos
+        with TextEnvReportObserver.__lock, open(self.__path, mode="a", encoding="utf-8") as reporter:
             reporter.write(content)
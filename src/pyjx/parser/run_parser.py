@@ -1,4 +1,6 @@
-from workflows.env.environment_command import EnvironmentCommand
+from pyjx.workflows.env.environment_command import EnvironmentCommand
+from pyjx.workflows.env.batch_command import BatchEnvironmentCommand, BATCH_WORKERS
+from pyjx.workflows.up.up_command import UpCommand
 
 class RunCommandBuilder:
     def __init__(self, subparsers):
@@ -13,13 +15,19 @@ class RunCommandBuilder:
         env_parser.add_argument("--txt-reporter", "-tr", action="store_true", help='')
         env_parser.add_argument("--no-console-reporter", "-ncr", action="store_true", default=False, help='')
         env_parser.add_argument("--schema-version", "-sv", default=1, type=int, help='')
+        env_parser.add_argument("--disk-cache", "-dc", action="store_true", default=False, help='Reuse issues stored in ~/.pyjx/issues.sqlite3, syncing only what changed since the last run')
+        env_parser.add_argument("--plan-only", "-po", action="store_true", default=False, help='Resolve the environment into an execution plan without modifying Jira: reads are sent, writes are only recorded')
+        env_parser.add_argument("--rate-limit", "-rl", default=None, type=float, help='Maximum requests per second sent to Jira; also used to estimate the duration with --plan-only')
+        env_parser.add_argument("--resume", "-r", action="store_true", default=False, help='Resume the last run from pyjx.env.journal.jsonl, skipping the issues, clones, links and additions it already completed')
+        env_parser.add_argument("--batch", "-b", default=None, help='JSONL file with one environment spec per line; all specs are validated first and then built concurrently, sharing the Jira session, cache and rate limit')
+        env_parser.add_argument("--batch-workers", "-bw", default=BATCH_WORKERS, type=int, help='Maximum specs built at the same time with --batch')
         env_parser.set_defaults(namespace="pyjx.env.json")
-        env_parser.set_defaults(func=lambda args, invoke_path: EnvironmentCommand(args, invoke_path).execute())
+        env_parser.set_defaults(func=lambda args, invoke_path: (BatchEnvironmentCommand if args.batch is not None else EnvironmentCommand)(args, invoke_path).execute())
 
         up_parser = run_subparsers.add_parser('up', help='Run up')
         up_parser.add_argument("--path", "-p", default=None, help='')
         up_parser.add_argument("--txt-reporter", "-tr", action="store_true", help='')
-        up_parser.add_argument("--no-console-reporter", "-ncr", action="store_false", help='')
+        up_parser.add_argument("--no-console-reporter", "-ncr", action="store_true", default=False, help='')
         up_parser.add_argument("--schema-version", "-sv", default=1, type=int, help='')
         up_parser.set_defaults(namespace="pyjx.up.json")
-        up_parser.set_defaults(func=lambda args: print("Running up with no args needed."))
+        up_parser.set_defaults(func=lambda args, invoke_path: UpCommand(args, invoke_path).execute())
@@ -0,0 +1,171 @@
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from jsonschema import ValidationError
+from pyjx.api.client import Client
+from pyjx.api.caches.issue_cache import IssueCache
+from pyjx.api.caches.issue_store import IssueStore, project_scope
+from pyjx.api.concurrency import AdaptiveLimit
+from pyjx.api.factories.issue_factory import IssueFactory, WORKFLOW_FIELDS
+from .environment_command import EnvironmentCommand, rate_limiter
+
+
+BATCH_WORKERS = 4
+"""Cantidad por defecto de especificaciones que se ambientan a la vez."""
+
+
+def spec_outcome(label: str, status: str, seconds: float, summary: dict = None, error: Exception = None) -> dict:
+    """Construye el resultado de una especificación del lote.
+
+    Args:
+        label (str): El número de línea de la especificación.
+        status (str): "ok" o "error".
+        seconds (float): Segundos que tomó la ambientación.
+        summary (dict, optional): El resumen de `EnvironmentCommand.build`.
+        error (Exception, optional): El error que detuvo la ambientación.
+
+    Returns:
+        dict: El resultado con `spec`, `status`, `seconds`, `created`, `linked`, `added` y `error`.
+    """
+    summary = summary or {}
+
+    return {
+        "spec": label,
+        "status": status,
+        "seconds": seconds,
+        "created": summary.get("created", 0),
+        "linked": summary.get("linked", 0),
+        "added": summary.get("added", 0),
+        "error": None if error is None else f"{type(error).__name__}: {error}"
+    }
+
+
+class BatchEnvironmentCommand:
+    """Ambienta varias especificaciones de un archivo JSONL en un único proceso.
+
+    Todas las especificaciones se validan antes de empezar; si alguna no es válida o está repetida no se ambienta
+    ninguna. Cada una escribe su journal con el identificador de su contenido, por lo que `--resume` sigue
+    funcionando aunque se reordene el archivo. Luego se ambientan hasta `--batch-workers` a la vez en hilos que
+    comparten la sesión y el límite de peticiones de Client, el caché de issues, el límite de concurrencia de las
+    operaciones en lote y, con `--disk-cache`, el almacén en disco. El error de una especificación no detiene a las demás; al final se imprime un resumen.
+
+    Examples:
+        >>> BatchEnvironmentCommand(args, os.getcwd()).execute()
+        [{"spec": "1", "status": "ok", "seconds": 2.4, "created": 3, "linked": 2, "added": 5, "error": None}]
+    """
+
+    def __init__(self, args, invoke_path: str) -> None:
+        """Carga y valida todas las especificaciones del lote.
+
+        Args:
+            args (Namespace): Los argumentos de `pyjx2 run env --batch`.
+            invoke_path (str): La ruta desde la que se invocó el comando.
+
+        Raises:
+            FileNotFoundError: Si no existe el archivo del lote.
+            ValueError: Si alguna especificación no es válida o está repetida, si no todas usan las mismas credenciales
+                o si se pidió `--plan-only`.
+        """
+        self.__args = args
+        path = os.path.join(invoke_path, args.batch)
+
+        if args.plan_only:
+            raise ValueError("--plan-only no está disponible con --batch; simule cada especificación con --path.")
+
+        if not os.path.exists(path):
+            raise FileNotFoundError("No fue encontrado el archivo del lote de ambientaciones. Verifique la ruta del archivo.")
+
+        self.__commands: list[EnvironmentCommand] = []
+        lines: dict[str, int] = {}
+        errors = []
+
+        with open(path, mode="r", encoding="utf-8") as batch_file:
+            for number, line in enumerate(batch_file, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    command = EnvironmentCommand(args, invoke_path, content=json.loads(line), label=str(number))
+                except json.JSONDecodeError as error:
+                    errors.append(f"Línea {number}: JSON inválido ({error.msg})")
+                    continue
+                except ValidationError as error:
+                    errors.append(f"Línea {number}: {error.message}")
+                    continue
+                except ValueError as error:
+                    errors.append(f"Línea {number}: {error}")
+                    continue
+
+                if command.spec() in lines:
+                    # Dos especificaciones iguales compartirían el journal
+                    errors.append(f"Línea {number}: repite la especificación de la línea {lines[command.spec()]}")
+                    continue
+
+                lines[command.spec()] = number
+                self.__commands.append(command)
+
+        if errors:
+            raise ValueError("El lote de ambientaciones no es válido:\n" + "\n".join(errors))
+
+        if not self.__commands:
+            raise ValueError("El lote de ambientaciones no tiene especificaciones.")
+
+        if any(command.auth() != self.__commands[0].auth() for command in self.__commands):
+            raise ValueError("Las especificaciones del lote comparten la sesión de Jira y deben usar las mismas credenciales.")
+
+    def execute(self) -> list[dict]:
+        """Ambienta las especificaciones del lote e imprime el resumen.
+
+        Returns:
+            list[dict]: El resultado de cada especificación, en el orden del archivo.
+        """
+        Client.configure_auth(**self.__commands[0].auth())
+
+        if self.__args.rate_limit is not None:
+            Client.configure_rate_limit(rate_limiter(self.__args.rate_limit))
+
+        cache = IssueCache()
+        limit = AdaptiveLimit(initial=8, max_limit=32)
+        store = IssueStore(scope=project_scope(key for command in self.__commands for key in command.keys())) if self.__args.disk_cache else None
+
+        try:
+            if store is not None:
+                store.sync(IssueFactory(store=store, default_fields=WORKFLOW_FIELDS))
+
+            with ThreadPoolExecutor(max_workers=self.__args.batch_workers) as executor:
+                outcomes = list(executor.map(lambda command: self.__build(command, store, cache, limit), self.__commands))
+        finally:
+            Client.close()
+
+            if store is not None:
+                store.close()
+
+        print(self.__report(outcomes))
+
+        return outcomes
+
+    def __build(self, command: EnvironmentCommand, store: IssueStore, cache: IssueCache, limit: AdaptiveLimit) -> dict:
+        label = command.label()
+        started_at = time.perf_counter()
+
+        try:
+            summary = command.build(store=store, cache=cache, limit=limit)
+        except Exception as error:
+            return spec_outcome(label, "error", time.perf_counter() - started_at, error=error)
+
+        return spec_outcome(label, "ok", time.perf_counter() - started_at, summary)
+
+    def __report(self, outcomes: list[dict]) -> str:
+        failed = [outcome for outcome in outcomes if outcome["status"] == "error"]
+        lines = [f"Resumen del lote ({len(outcomes)} ambientaciones, {len(failed)} con error):"]
+
+        for outcome in outcomes:
+            if outcome["status"] == "ok":
+                detail = f"{outcome['created']} issues creados, {outcome['linked']} enlaces, {outcome['added']} agregados"
+            else:
+                detail = outcome["error"]
+
+            lines.append(f"  [{outcome['spec']}] {outcome['status']} en {outcome['seconds']:.2f} s: {detail}")
+
+        return "\n".join(lines)
@@ -1,35 +1,76 @@
 import os
 import json
+from datetime import datetime
+from typing import Any, Callable, Union
 from jsonschema import validate
-from pyjx.api.factories.issue_factory import IssueFactory
+from pyjx.api.factories.issue_factory import IssueFactory, WORKFLOW_FIELDS
 from pyjx.api.client import Client
+from pyjx.api.caches.issue_cache import IssueCache
+from pyjx.api.caches.issue_store import IssueStore, project_scope
+from pyjx.api.concurrency import AdaptiveLimit
+from pyjx.api.rate_limit import RateLimiter, TokenBucket
+from pyjx.api.recorder import RequestRecorder
+from pyjx.api.journal import OperationJournal, JOURNAL_FILE, spec_digest
 from pyjx.api.builders.requests.create import RequestBodyCreateBuilder
 from pyjx.config.global_config import GlobalConfig
+from pyjx.workflows.scheduler import TaskGraph
+from pyjx.observers.base_report_observer import BaseReportObserver
 from pyjx.observers.console_env_report_observer import ConsoleEnvReportObserver
 from pyjx.observers.text_env_report_observer import TextEnvReportObserver
+from .test_resolver import TestResolver
 from .strategies.add_strategy import TestAdditionStrategy
 from .strategies.clone_strategy import TestClonationStrategy
 from .strategies.create_strategy import TestCreationStrategy
 
 
+def environment_schema(schema_version: int) -> dict:
+    """Carga el JSON Schema de las especificaciones de ambientación.
+
+    Args:
+        schema_version (int): La versión del esquema.
+
+    Returns:
+        dict: El esquema.
+    """
+    schema_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "schemas", "environment_schema_" + str(schema_version) + ".json"))
+
+    with open(schema_path, mode="r", encoding="utf-8") as json_schema_file:
+        return json.load(json_schema_file)
+
+
+def rate_limiter(rate: float) -> RateLimiter:
+    """Construye el limitador de `--rate-limit`: `rate` peticiones por segundo con ráfagas de hasta un segundo."""
+    return RateLimiter(TokenBucket(rate=rate, burst=max(1, int(rate))))
+
+
 class EnvironmentCommand:
-    def __init__(self, args, invoke_path: str) -> None:
+    def __init__(self, args, invoke_path: str, content: dict = None, label: str = None) -> None:
+        """Valida la especificación de la ambientación.
+
+        Args:
+            args (Namespace): Los argumentos de `pyjx2 run env`.
+            invoke_path (str): La ruta desde la que se invocó el comando.
+            content (dict, optional): La especificación ya cargada. Por defecto, se lee de `--path` o del namespace.
+            label (str, optional): El nombre de la especificación dentro de un lote. Se antepone a los mensajes de
+                consola; su journal se distingue por el contenido de la especificación (`spec_digest`).
+        """
         self.__global_config = GlobalConfig
         self.__args = args
         self.__invoke_path = invoke_path
-        path = args.path if args.path is not None else os.path.join(invoke_path, args.namespace)
-        schema_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "schemas", "environment_schema_" + str(args.schema_version) + ".json"))
+        self.__label = label
+
+        if content is None:
+            path = args.path if args.path is not None else os.path.join(invoke_path, args.namespace)
 
-        if not os.path.exists(path):
-            raise FileNotFoundError("No fue encontrado el esquema para la ejecución de ambientación. Verifique la ruta del archivo.")
+            if not os.path.exists(path):
+                raise FileNotFoundError("No fue encontrado el esquema para la ejecución de ambientación. Verifique la ruta del archivo.")
 
-        with open(path, mode="r", encoding="utf-8") as json_file:
-            content: dict = json.load(json_file)
+            with open(path, mode="r", encoding="utf-8") as json_file:
+                content = json.load(json_file)
 
-        with open(schema_path, mode="r", encoding="utf-8") as json_schema_file:
-            schema = json.load(json_schema_file)
+        validate(content, environment_schema(args.schema_version))
 
-        validate(content, schema)
+        self.__spec = spec_digest(content)
 
         global_auth = self.__global_config.get_auth()
 
@@ -41,10 +82,180 @@ class EnvironmentCommand:
             raise ValueError("No hay datos para la autenticación. Configure la propiedad 'auth' o defina sus credenciales con `pyjx2 config auth`")
 
         self.__data = content
-    
+        self.__observers: list[BaseReportObserver] = []
+
+        if args.txt_reporter:
+            self.__observers.append(TextEnvReportObserver(os.path.join(invoke_path, "pyjx.env.log"), prefix=label))
+
+        if not args.no_console_reporter:
+            self.__observers.append(ConsoleEnvReportObserver(prefix=label))
+
+    def auth(self) -> dict:
+        """Devuelve las credenciales con las que se ejecuta la ambientación (`username` y `password`)."""
+        return dict(self.__auth)
+
+    def label(self) -> str:
+        """Devuelve el nombre de la especificación dentro de un lote, o None si se ejecuta sola."""
+        return self.__label
+
+    def keys(self) -> list[str]:
+        """Devuelve las claves de los issues existentes que nombra la especificación: plan, ejecución, set y los
+        tests (o sus contenedores) que se agregan o clonan."""
+        keys = [self.__data.get(name) for name in ("plan", "execution", "set")]
+
+        for action in ("add", "clone"):
+            target = self.__data["tests"].get(action) or {}
+            keys.extend([*target.get("keys", []), *(target.get(name) for name in ("plan", "execution", "set"))])
+
+        return [key for key in keys if key]
+
+    def spec(self) -> str:
+        """Devuelve el identificador estable de la especificación (`spec_digest`)."""
+        return self.__spec
+
+    def journal_path(self) -> str:
+        """Devuelve la ruta del journal de la ambientación, en la ruta de invocación.
+
+        Dentro de un lote, el journal se nombra con el identificador de la especificación y no con su posición,
+        de modo que reordenar o editar el archivo del lote no reanuda una especificación con el journal de otra.
+        """
+        if self.__label is None:
+            return os.path.join(self.__invoke_path, JOURNAL_FILE)
+
+        return os.path.join(self.__invoke_path, JOURNAL_FILE.replace(".journal", f".{self.__spec}.journal"))
+
     def execute(self):
         Client.configure_auth(**self.__auth)
 
+        if self.__args.rate_limit is not None:
+            Client.configure_rate_limit(rate_limiter(self.__args.rate_limit))
+
+        if self.__args.plan_only:
+            self.__plan_environment()
+            return
+
+        store = IssueStore(scope=project_scope(self.keys())) if self.__args.disk_cache else None
+
+        try:
+            if store is not None:
+                store.sync(IssueFactory(store=store, default_fields=WORKFLOW_FIELDS))
+
+            self.build(store=store)
+        finally:
+            Client.close()
+
+            if store is not None:
+                store.close()
+
+    def build(self, store: IssueStore = None, cache: IssueCache = None, limit: AdaptiveLimit = None) -> dict:
+        """Construye la ambientación en Jira, registrando las escrituras en su journal.
+
+        No configura ni cierra Client, por lo que varias ambientaciones pueden construirse a la vez compartiendo
+        la sesión, el límite de peticiones y, si se indican, el almacén, el caché y el límite de concurrencia.
+
+        Args:
+            store (IssueStore, optional): El almacén en disco, ya sincronizado.
+            cache (IssueCache, optional): El caché de issues. Por defecto, uno propio.
+            limit (AdaptiveLimit, optional): El límite de concurrencia de las operaciones en lote. Por defecto, uno propio.
+
+        Returns:
+            dict: Las escrituras registradas en el journal (`created`, `linked` y `added`) y la duración en segundos
+                de la ruta crítica (`seconds`).
+
+        Examples:
+            >>> EnvironmentCommand(args, os.getcwd()).build()
+            {"created": 3, "linked": 2, "added": 5, "seconds": 4.21}
+        """
+        journal = OperationJournal(self.journal_path(), resume=self.__args.resume, spec=self.__spec)
+
+        try:
+            issue_creator = IssueFactory(cache=cache, store=store, limit=limit, default_fields=WORKFLOW_FIELDS, journal=journal)
+            critical_path = self.__build_environment(issue_creator, journal)
+        finally:
+            journal.close()
+
+        entries = journal.entries()
+
+        return {
+            "created": sum(1 for entry in entries if entry["op"] == "create"),
+            "linked": sum(1 for entry in entries if entry["op"] == "link"),
+            "added": sum(len(entry["keys"]) for entry in entries if entry["op"] == "add"),
+            "seconds": sum(duration for _, duration in critical_path)
+        }
+
+    def __build_environment(self, issue_creator: IssueFactory, journal: OperationJournal) -> list[tuple[str, float]]:
+        for observer in self.__observers:
+            issue_creator.register_observer(observer)
+
+        if self.__args.resume:
+            done = [entry for entry in journal.entries() if entry["op"] in ("create", "link", "add")]
+            self.__notify_observers(f"Reanudando la ambientación: {len(done)} operaciones del journal no se repetirán")
+
+        graph = self.__task_graph(issue_creator)
+        graph.run()
+
+        self.__report_critical_path(graph.critical_path())
+
+        return graph.critical_path()
+
+    def __plan_environment(self):
+        recorder = RequestRecorder()
+        Client.configure_recorder(recorder)
+
+        try:
+            self.__task_graph(IssueFactory(default_fields=WORKFLOW_FIELDS)).run()
+        finally:
+            Client.configure_recorder(None)
+            Client.close()
+
+        print(self.__plan_report(recorder))
+
+    def __plan_report(self, recorder: RequestRecorder) -> str:
+        lines = ["Plan de ambientación (no se modificó Jira)"]
+
+        fetched = recorder.fetched_keys()
+        lines.append(f"Issues a consultar ({len(fetched)}): {', '.join(fetched)}")
+
+        planned = recorder.planned_issues()
+        lines.append(f"Issues a crear ({len(planned)}):")
+        lines += [
+            f"  {key} {body.get('fields', {}).get('issuetype', {}).get('name', 'Test')} {body.get('fields', {}).get('summary', '')!r}"
+            for key, body in planned.items()
+        ]
+
+        mutations = recorder.mutations()
+        links = [request["body"] for request in mutations if request["path"].lstrip("/") == "rest/api/2/issueLink"]
+        clones = [f"{link['inwardIssue']['key']} -> {link['outwardIssue']['key']}" for link in links if link["type"]["name"] == "Duplicate"]
+        lines.append(f"Tests a clonar ({len(clones)}): {', '.join(clones)}")
+
+        lines.append("Issues a enlazar:")
+        lines += [
+            f"  {request['path'].lstrip('/').split('/')[4]} {request['path'].lstrip('/').split('/')[5]}: {len(request['body']['add'])} issues ({', '.join(request['body']['add'])})"
+            for request in mutations
+            if request["path"].lstrip("/").startswith("rest/raven/1.0/api/test") and isinstance(request["body"], dict) and request["body"].get("add")
+        ]
+
+        counts = recorder.counts()
+        lines.append(f"Peticiones por endpoint ({sum(stats['sent'] + stats['recorded'] for stats in counts.values())}):")
+        lines += [
+            f"  {name}: {stats['sent'] + stats['recorded']} ({stats['sent']} enviadas, {stats['recorded']} simuladas)"
+            for name, stats in sorted(counts.items())
+        ]
+
+        estimate = recorder.estimate(Client.rate_limiter())
+
+        if all(stats["rate"] is None for stats in estimate.values()):
+            lines.append("Tiempo estimado: sin límite de peticiones configurado (use --rate-limit)")
+        else:
+            lines.append(f"Tiempo estimado con el límite de peticiones: {max(stats['seconds'] for stats in estimate.values()):.1f} s")
+            lines += [
+                f"  {name}: {stats['requests']} peticiones a {stats['rate']}/s -> {stats['seconds']:.1f} s"
+                for name, stats in estimate.items() if stats["rate"] is not None
+            ]
+
+        return "\n".join(lines)
+
+    def __task_graph(self, issue_creator: IssueFactory) -> TaskGraph:
         test_plan_key = self.__data.get("plan")
         test_execution_key = self.__data.get("execution")
         test_set_key = self.__data.get("set")
@@ -54,45 +265,99 @@ class EnvironmentCommand:
         create_fields = self.__data.get("tests", {}).get("create", None)
         tests_fields = self.__data.get("tests", {}).get("fields", None)
 
-        issue_creator = IssueFactory()
+        resolver = TestResolver(issue_creator)
+        graph = TaskGraph()
 
-        if self.__args.txt_report:
-            issue_creator.register_observer(TextEnvReportObserver(self.__invoke_path))
+        # Lecturas: el plan, el execution y el set existentes y los orígenes de los tests no dependen entre sí; las
+        # estrategias comparten el resolvedor, así que cada origen y cada clave se consultan una sola vez
+        graph.add("plan", lambda: self.__get_existing(issue_creator, test_plan_key, "Test Plan", required=True))
+        graph.add("execution.get", lambda: self.__get_existing(issue_creator, test_execution_key, "Test Execution"))
+        graph.add("set.get", lambda: self.__get_existing(issue_creator, test_set_key, "Test Set"))
+        graph.add("add", lambda: TestAdditionStrategy().tests(add_fields, issue_creator, resolver))
+        graph.add("clone.sources", lambda: TestClonationStrategy().sources(clone_fields, issue_creator, resolver))
 
-        if not self.__args.no_console_report:
-            issue_creator.register_observer(ConsoleEnvReportObserver())
+        # Ninguna escritura empieza hasta que todas las lecturas terminan bien: una especificación con una clave
+        # inexistente o de otro tipo falla sin modificar Jira
+        graph.add("validate", lambda *issues: None, depends_on=["plan", "execution.get", "set.get", "add", "clone.sources"])
 
-        issue_test_plan = issue_creator.get(test_plan_key)
+        graph.add(
+            "execution",
+            lambda issue_test_execution, _: issue_test_execution or self.__create(issue_creator, "Test Execution", "execution"),
+            depends_on=["execution.get", "validate"]
+        )
+        graph.add(
+            "set",
+            lambda issue_test_set, _: issue_test_set or self.__create(issue_creator, "Test Set", "set"),
+            depends_on=["set.get", "validate"]
+        )
+        graph.add(
+            "clone",
+            lambda sources, _: TestClonationStrategy().clone(sources, tests_fields, issue_creator),
+            depends_on=["clone.sources", "validate"]
+        )
+        graph.add("create", lambda _: TestCreationStrategy().tests(create_fields, tests_fields, issue_creator), depends_on=["validate"])
 
-        test_plan_summary: str = ""
-        test_plan_domain: str = ""
-        test_plan_celula: str = ""
-        test_plan_org: str = ""
+        graph.add(
+            "set.add",
+            lambda issue_test_set, *tests: self.__add_tests(issue_creator, issue_test_set, tests),
+            depends_on=["set", "add", "clone", "create"]
+        )
+        graph.add(
+            "execution.add",
+            lambda issue_test_execution, issue_test_set, _: self.__add_once(issue_creator, issue_test_execution, [issue_test_set.key()], issue_test_execution.add),
+            depends_on=["execution", "set", "set.add"]
+        )
+        graph.add(
+            "plan.add_test_executions",
+            lambda issue_test_plan, issue_test_execution, _: self.__add_once(issue_creator, issue_test_plan, [issue_test_execution.key()], issue_test_plan.add_test_executions),
+            depends_on=["plan", "execution", "execution.add"]
+        )
 
-        request_body_builder = RequestBodyCreateBuilder()
+        return graph
 
-        if test_execution_key is None:
-            execution_body = request_body_builder.add_summary("").add_issue_type("Test Execution").build()
-            issue_test_execution = issue_creator.create(execution_body)
-            request_body_builder.reset()
-        else:
-            issue_test_execution = issue_creator.get(test_execution_key)
-            
-        if test_set_key is None:
-            set_body = request_body_builder.add_summary("").add_issue_type("Test Set").build()
-            issue_test_set = issue_creator.create(set_body)
-            request_body_builder.reset()
-        else:
-            issue_test_set = issue_creator.get(test_set_key)
+    def __get_existing(self, issue_creator: IssueFactory, key: Union[str, None], issuetype: str, required: bool = False):
+        if key is None and required:
+            raise ValueError(f"La especificación no indica el {issuetype}")
+
+        if key is None:
+            return None
+
+        issue = issue_creator.get(key)
+
+        if issue.issuetype() != issuetype:
+            raise ValueError(f"{key} es un {issue.issuetype()}; se esperaba un {issuetype}")
+
+        return issue
+
+    def __create(self, issue_creator: IssueFactory, issuetype: str, ref: str):
+        body = RequestBodyCreateBuilder().add_summary("").add_issue_type(issuetype).build()
+
+        return issue_creator.create(body, ref=ref)
+
+    def __add_tests(self, issue_creator: IssueFactory, issue_test_set, tests: tuple[list, ...]) -> None:
+        keys = list(dict.fromkeys(test.key() for strategy_tests in tests for test in strategy_tests))
+        self.__add_once(issue_creator, issue_test_set, keys, issue_test_set.add)
+
+    def __add_once(self, issue_creator: IssueFactory, container, keys: list[str], add: Callable[[list[str]], Any]) -> None:
+        journal = issue_creator.journal()
+
+        if journal is not None:
+            done = journal.added(container.key())
+            keys = [key for key in keys if key not in done]
+
+        if not keys:
+            return
+
+        add(keys)
 
-        add_strategy = TestAdditionStrategy()
-        add_strategy.operation(add_fields, issue_test_set, issue_creator)
+        if journal is not None:
+            journal.record("add", container=container.key(), keys=keys)
 
-        clone_strategy = TestClonationStrategy()
-        clone_strategy.operation(clone_fields, tests_fields, issue_test_set, issue_creator)
+    def __report_critical_path(self, critical_path: list[tuple[str, float]]) -> None:
+        total = sum(duration for _, duration in critical_path)
+        steps = " -> ".join(f"{name} ({duration:.2f} s)" for name, duration in critical_path)
+        self.__notify_observers(f"Ruta crítica de {total:.2f} s: {steps}")
 
-        creation_strategy = TestCreationStrategy()
-        creation_strategy.operation(create_fields, tests_fields, issue_test_set, issue_creator)
-        
-        issue_test_execution.add([issue_test_set.key()])
-        issue_test_plan.add([issue_test_execution.key()])
+    def __notify_observers(self, message: str) -> None:
+        for observer in self.__observers:
+            observer.update(None, message, str(datetime.now()))
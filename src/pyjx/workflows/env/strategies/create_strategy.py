@@ -1,6 +1,6 @@
 from typing import Union
 from pyjx.api.factories.issue_factory import IssueFactory
-from models.issue_base import IssueBase
+from pyjx.models.issue_base import IssueBase
 from pyjx.api.builders.requests.create import RequestBodyCreateBuilder
 from pyjx.api.builders.requests.bulk_create import RequestBodyBulkCreateBuilder
 
@@ -10,13 +10,21 @@ class TestCreationStrategy:
         if fields is None:
             return
 
+        issue.add([test.key() for test in self.tests(fields, tests_fields, factory)])
+
+    def tests(self, fields: Union[list, None], tests_fields: Union[dict, None], factory: IssueFactory) -> list[IssueBase]:
+        if fields is None:
+            return []
+
         bulk_create_builder = RequestBodyBulkCreateBuilder()
 
-        for issue_name in fields:
+        refs = []
+
+        for index, issue_name in enumerate(fields):
             create_builder = RequestBodyCreateBuilder()
             body = create_builder.add_summary(issue_name).add_issue_type("Test").build()
             bulk_create_builder.add_issue(body)
+            refs.append(f"create:{index}:{issue_name}")
 
         bulk_data = bulk_create_builder.build()
-        tests = factory.bulk_create(bulk_data)
-        issue.add([test.key for test in tests])
+        return factory.bulk_create(bulk_data, refs)
@@ -0,0 +1,112 @@
+from threading import Lock
+from typing import Union
+from pyjx.api.factories.issue_factory import IssueFactory
+from pyjx.models.issue_base import IssueBase
+
+
+SOURCES = ("plan", "execution", "set", "path")
+"""Orígenes de tests de las estrategias que se resuelven consultando un contenedor de Xray."""
+
+
+class TestResolver:
+    """Resuelve los tests de las estrategias de ambientación, indexados por clave.
+
+    Todas las estrategias de una ejecución comparten el mismo resolvedor: cada origen (plan, execution, set
+    o ruta del repositorio) se consulta una sola vez y cada clave explícita se pide a Jira solo si ningún
+    otro origen la resolvió antes, por lo que las configuraciones que se solapan no generan peticiones
+    adicionales. Es seguro usarlo desde varios hilos.
+
+    Examples:
+        >>> resolver = TestResolver(factory)
+        >>> resolver.resolve({"set": "PJX-5", "keys": ["PJX-6", "PJX-7"]})
+        [Test(key=PJX-6, ...), Test(key=PJX-7, ...)]
+        >>> resolver.resolve({"set": "PJX-5"})  # no vuelve a consultar PJX-5
+        [Test(key=PJX-6, ...)]
+        >>> resolver.stats()
+        {"sources": 1, "tests": 2, "references": 3}
+    """
+
+    def __init__(self, factory: IssueFactory) -> None:
+        """Inicializa el resolvedor sin consultar nada.
+
+        Args:
+            factory (IssueFactory): El factory con el que se consultan Jira y Xray.
+        """
+        self.__factory = factory
+        self.__tests: dict[str, IssueBase] = {}
+        self.__sources: dict[tuple[str, str], list[str]] = {}
+        self.__source_locks: dict[tuple[str, str], Lock] = {}
+        self.__references = 0
+        self.__lock = Lock()
+        self.__keys_lock = Lock()
+
+    def resolve(self, fields: Union[dict, None]) -> list[IssueBase]:
+        """Devuelve los tests de todos los orígenes de una estrategia, sin repetidos.
+
+        Args:
+            fields (Union[dict, None]): Los orígenes de la estrategia: `plan`, `execution`, `set`, `path` y/o `keys`.
+
+        Returns:
+            list[IssueBase]: Los tests, en el orden de los orígenes y sin claves repetidas.
+        """
+        if fields is None:
+            return []
+
+        keys = []
+
+        for source in SOURCES:
+            if (value := fields.get(source)):
+                keys += self.__source_keys(source, str(value))
+
+        if (test_keys := fields.get("keys")):
+            keys += self.__resolve_keys(test_keys)
+
+        with self.__lock:
+            self.__references += len(keys)
+
+            return [self.__tests[key] for key in dict.fromkeys(keys)]
+
+    def stats(self) -> dict:
+        """Devuelve los orígenes consultados, los tests únicos resueltos y las referencias a tests recibidas."""
+        with self.__lock:
+            return {
+                "sources": len(self.__sources),
+                "tests": len(self.__tests),
+                "references": self.__references
+            }
+
+    def __source_keys(self, source: str, value: str) -> list[str]:
+        with self.__lock:
+            source_lock = self.__source_locks.setdefault((source, value), Lock())
+
+        # Si dos estrategias piden el mismo origen a la vez, la segunda espera el resultado de la primera
+        with source_lock:
+            if (keys := self.__sources.get((source, value))) is not None:
+                return keys
+
+            tests = self.__fetch(source, value)
+
+            with self.__lock:
+                keys = [self.__tests.setdefault(test.key(), test).key() for test in tests]
+                self.__sources[(source, value)] = keys
+
+            return keys
+
+    def __fetch(self, source: str, value: str) -> list[IssueBase]:
+        if source == "path":
+            return self.__factory.get_tests_from_test_repository(value)
+
+        return self.__factory.get(value).tests()
+
+    def __resolve_keys(self, keys: list[str]) -> list[str]:
+        with self.__keys_lock:
+            with self.__lock:
+                missing = [key for key in dict.fromkeys(keys) if key not in self.__tests]
+
+            tests = self.__factory.bulk_get(missing) if missing else []
+
+            with self.__lock:
+                for test in tests:
+                    self.__tests.setdefault(test.key(), test)
+
+                return [key for key in keys if key in self.__tests]
@@ -0,0 +1,184 @@
+import time
+from threading import Lock
+from typing import Any, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class TaskGraph:
+    """Ejecuta de forma concurrente un grafo de tareas con dependencias.
+
+    Cada tarea se inicia en cuanto terminan todas sus dependencias y recibe sus resultados como argumentos,
+    en el orden de `depends_on`. Si una tarea falla, no se inicia ninguna tarea nueva, se esperan las que
+    están en curso y se propaga el primer error.
+
+    Examples:
+        >>> graph = TaskGraph()
+        >>> graph.add("plan", lambda: factory.get("PJX-1"))
+        >>> graph.add("set", lambda: factory.get("PJX-2"))
+        >>> graph.add("tests", lambda test_set: test_set.tests(), depends_on=["set"])
+        >>> graph.run()["tests"]
+        [Test(key=PJX-3, ...)]
+        >>> graph.critical_path()
+        [("set", 0.41), ("tests", 0.87)]
+    """
+
+    def __init__(self) -> None:
+        self.__tasks: dict[str, tuple[Callable, tuple[str, ...]]] = {}
+        self.__timings: dict[str, tuple[float, float]] = {}
+        self.__lock = Lock()
+
+    def add(self, name: str, function: Callable, depends_on: Iterable[str] = ()) -> "TaskGraph":
+        """Agrega una tarea al grafo.
+
+        Args:
+            name (str): El nombre único de la tarea.
+            function (Callable): La función a ejecutar; recibe los resultados de sus dependencias.
+            depends_on (Iterable[str], optional): Los nombres de las tareas que deben terminar antes.
+
+        Returns:
+            TaskGraph: El propio grafo.
+
+        Raises:
+            ValueError: Si ya existe una tarea con ese nombre.
+        """
+        if name in self.__tasks:
+            raise ValueError(f"La tarea {name!r} ya existe en el grafo")
+
+        self.__tasks[name] = (function, tuple(depends_on))
+
+        return self
+
+    def run(self, max_workers: int = None) -> dict[str, Any]:
+        """Ejecuta todas las tareas respetando sus dependencias.
+
+        Args:
+            max_workers (int, optional): Máximo de tareas simultáneas. Por defecto, tantas como tareas.
+
+        Returns:
+            dict[str, Any]: El resultado de cada tarea, indexado por su nombre.
+
+        Raises:
+            ValueError: Si una dependencia no existe o el grafo tiene ciclos.
+        """
+        order = self.__topological_order()
+        waiting = {name: len(set(depends_on)) for name, (_, depends_on) in self.__tasks.items()}
+        dependents: dict[str, list[str]] = {name: [] for name in self.__tasks}
+
+        for name, (_, depends_on) in self.__tasks.items():
+            for dependency in set(depends_on):
+                dependents[dependency].append(name)
+
+        results: dict[str, Any] = {}
+        error = None
+        ready = [name for name in order if waiting[name] == 0]
+        running = {}
+        self.__timings = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers or max(len(order), 1), thread_name_prefix="pyjx-task") as executor:
+            while ready or running:
+                for name in ready:
+                    function, depends_on = self.__tasks[name]
+                    running[executor.submit(self.__run_task, name, function, [results[dependency] for dependency in depends_on])] = name
+
+                ready = []
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = running.pop(future)
+
+                    try:
+                        results[name] = future.result()
+                    except Exception as task_error:
+                        error = error or task_error
+                        continue
+
+                    for dependent in dependents[name]:
+                        waiting[dependent] -= 1
+
+                        if waiting[dependent] == 0 and error is None:
+                            ready.append(dependent)
+
+                if error is not None:
+                    ready = []
+
+        if error is not None:
+            raise error
+
+        return results
+
+    def timings(self) -> dict[str, tuple[float, float]]:
+        """Devuelve el inicio y el fin (según `time.perf_counter`) de cada tarea de la última ejecución."""
+        with self.__lock:
+            return dict(self.__timings)
+
+    def critical_path(self) -> list[tuple[str, float]]:
+        """Devuelve la cadena de dependencias más larga de la última ejecución.
+
+        La duración de una cadena es la suma de las duraciones de sus tareas, por lo que la ruta crítica es
+        la cota inferior del tiempo total de la ejecución, sin importar cuántas tareas corran en paralelo.
+
+        Returns:
+            list[tuple[str, float]]: Las tareas de la ruta crítica, en orden, con su duración en segundos.
+        """
+        timings = self.timings()
+        finish: dict[str, float] = {}
+        previous: dict[str, str] = {}
+
+        for name in self.__topological_order():
+            if name not in timings:
+                continue
+
+            started_at, ended_at = timings[name]
+            dependencies = [dependency for dependency in self.__tasks[name][1] if dependency in finish]
+            slowest = max(dependencies, key=finish.get, default=None)
+            finish[name] = (ended_at - started_at) + (finish[slowest] if slowest is not None else 0.0)
+            previous[name] = slowest
+
+        if not finish:
+            return []
+
+        path = []
+        name = max(finish, key=finish.get)
+
+        while name is not None:
+            started_at, ended_at = timings[name]
+            path.append((name, ended_at - started_at))
+            name = previous[name]
+
+        return path[::-1]
+
+    def __run_task(self, name: str, function: Callable, arguments: list) -> Any:
+        started_at = time.perf_counter()
+
+        try:
+            return function(*arguments)
+        finally:
+            with self.__lock:
+                self.__timings[name] = (started_at, time.perf_counter())
+
+    def __topological_order(self) -> list[str]:
+        order = []
+        state: dict[str, int] = {}
+
+        def visit(name: str) -> None:
+            if state.get(name) == 2:
+                return
+
+            if state.get(name) == 1:
+                raise ValueError(f"El grafo de tareas tiene un ciclo que incluye {name!r}")
+
+            if name not in self.__tasks:
+                raise ValueError(f"La tarea {name!r} no existe en el grafo")
+
+            state[name] = 1
+
+            for dependency in self.__tasks[name][1]:
+                visit(dependency)
+
+            state[name] = 2
+            order.append(name)
+
+        for name in self.__tasks:
+            visit(name)
+
+        return order
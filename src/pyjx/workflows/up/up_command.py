@@ -0,0 +1,193 @@
+import os
+import json
+from datetime import datetime
+from threading import BoundedSemaphore
+from typing import Iterable, Iterator, Union
+from concurrent.futures import ThreadPoolExecutor
+from jsonschema import validate
+from pyjx.api.client import Client
+from pyjx.api.batching import chunk
+from pyjx.api.factories.issue_factory import IssueFactory, WORKFLOW_FIELDS
+from pyjx.config.global_config import GlobalConfig
+from pyjx.models.test_execution import TestExecution, IMPORT_BATCH_SIZE
+from pyjx.observers.base_report_observer import BaseReportObserver
+from pyjx.observers.console_env_report_observer import ConsoleEnvReportObserver
+from pyjx.observers.text_env_report_observer import TextEnvReportObserver
+
+
+UP_CONCURRENCY = 4
+"""Número máximo de lotes de estados que se envían a Xray al mismo tiempo."""
+
+
+def attach_results_schema(schema_version: int) -> dict:
+    """Carga el JSON Schema de los archivos de resultados de `pyjx2 run up`.
+
+    Args:
+        schema_version (int): La versión del esquema (`--schema-version`).
+
+    Returns:
+        dict: El esquema.
+    """
+    schema_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "schemas", "attach_results_schema_" + str(schema_version) + ".json"))
+
+    with open(schema_path, mode="r", encoding="utf-8") as json_schema_file:
+        return json.load(json_schema_file)
+
+
+def resolve_keys(target: Union[dict, None], factory: IssueFactory) -> Iterator[str]:
+    """Resuelve de forma perezosa las claves de los tests a los que apunta un filtro del esquema.
+
+    Args:
+        target (Union[dict, None]): Un objeto con `keys`, `set` y/o `filter` (JQL).
+        factory (IssueFactory): El factory con el que se consultan Jira y Xray.
+
+    Yields:
+        str: Cada clave de test, en el orden en que se resuelve. Puede haber repetidas.
+
+    Examples:
+        >>> list(resolve_keys({"keys": ["PJX-1"], "set": "PJX-9"}, factory))
+        ["PJX-1", "PJX-2", "PJX-3"]
+    """
+    if target is None:
+        return
+
+    if (keys := target.get("keys")):
+        yield from keys
+
+    if (test_set_key := target.get("set")):
+        yield from factory.get(test_set_key).test_keys()
+
+    if (jql := target.get("filter")):
+        yield from (issue.key() for issue in factory.search(jql, fields=[]))
+
+
+def targeted_statuses(rules: Iterable[dict], factory: IssueFactory) -> Iterator[tuple[str, str]]:
+    """Resuelve las reglas `status` del esquema en pares (clave, estado).
+
+    Las reglas se aplican en orden y cada test toma el estado de la primera regla que lo incluye, lo que
+    permite empezar a enviar cambios antes de resolver las reglas siguientes.
+
+    Args:
+        rules (Iterable[dict]): Las reglas con su `value` y su filtro `keys`, `set` o `filter`.
+        factory (IssueFactory): El factory con el que se consultan Jira y Xray.
+
+    Yields:
+        tuple[str, str]: La clave del test y el estado que le corresponde.
+
+    Examples:
+        >>> list(targeted_statuses([{"value": "PASS", "keys": ["PJX-1"]}, {"value": "FAIL", "keys": ["PJX-1", "PJX-2"]}], factory))
+        [("PJX-1", "PASS"), ("PJX-2", "FAIL")]
+    """
+    seen = set()
+
+    for rule in rules:
+        for key in resolve_keys(rule, factory):
+            if key not in seen:
+                seen.add(key)
+                yield key, rule["value"]
+
+
+class UpCommand:
+    def __init__(self, args, invoke_path: str) -> None:
+        self.__global_config = GlobalConfig
+        self.__args = args
+        self.__invoke_path = invoke_path
+        path = args.path if args.path is not None else os.path.join(invoke_path, args.namespace)
+
+        if not os.path.exists(path):
+            raise FileNotFoundError("No fue encontrado el esquema para la actualización de resultados. Verifique la ruta del archivo.")
+
+        with open(path, mode="r", encoding="utf-8") as json_file:
+            content: dict = json.load(json_file)
+
+        validate(content, attach_results_schema(args.schema_version))
+
+        global_auth = self.__global_config.get_auth()
+
+        if content.get("auth"):
+            self.__auth: dict = content.get("auth")
+        elif global_auth is not None:
+            self.__auth = global_auth
+        else:
+            raise ValueError("No hay datos para la autenticación. Configure la propiedad 'auth' o defina sus credenciales con `pyjx2 config auth`")
+
+        self.__data = content
+        self.__observers: list[BaseReportObserver] = []
+
+        if args.txt_reporter:
+            self.__observers.append(TextEnvReportObserver(os.path.join(invoke_path, "pyjx.up.log")))
+
+        if not args.no_console_reporter:
+            self.__observers.append(ConsoleEnvReportObserver())
+
+    def execute(self) -> dict[str, dict]:
+        """Actualiza los estados de los tests del Test Execution según el archivo.
+
+        Returns:
+            dict[str, dict]: El resultado de cada test enviado, indexado por su clave. Ver `status_outcome`.
+        """
+        Client.configure_auth(**self.__auth)
+
+        try:
+            return self.__update_statuses()
+        finally:
+            Client.close()
+
+    def __update_statuses(self) -> dict[str, dict]:
+        factory = IssueFactory(default_fields=WORKFLOW_FIELDS)
+        test_execution: TestExecution = factory.get(self.__data["execution"])
+        current = {key: run["status"] for key, run in test_execution.test_runs().items()}
+
+        exclude = self.__data.get("exclude") or {}
+        excluded_keys = set(resolve_keys(exclude, factory))
+        excluded_statuses = set(exclude.get("status", []))
+        skipped = {"outside": 0, "excluded": 0, "unchanged": 0}
+
+        def changes() -> Iterator[tuple[str, str]]:
+            for key, status in targeted_statuses(self.__data.get("status", []), factory):
+                if key not in current:
+                    skipped["outside"] += 1
+                elif key in excluded_keys or current[key] in excluded_statuses:
+                    skipped["excluded"] += 1
+                elif current[key] == status:
+                    skipped["unchanged"] += 1
+                else:
+                    yield key, status
+
+        outcomes = self.__push(test_execution, changes())
+        updated = sum(outcome["updated"] for outcome in outcomes.values())
+
+        for key, outcome in outcomes.items():
+            if not outcome["updated"]:
+                self.__notify_observers(test_execution, f"Error al establecer {outcome['status']} en {key}: {outcome['error']}")
+
+        self.__notify_observers(
+            test_execution,
+            f"{updated} de {len(outcomes)} estados actualizados en {test_execution.key()}; "
+            f"{skipped['unchanged']} sin cambios, {skipped['excluded']} excluidos y {skipped['outside']} fuera del Test Execution"
+        )
+
+        return outcomes
+
+    def __push(self, test_execution: TestExecution, changes: Iterable[tuple[str, str]]) -> dict[str, dict]:
+        # Los lotes se envían a medida que se resuelven; el semáforo limita los lotes pendientes en memoria
+        slots = BoundedSemaphore(UP_CONCURRENCY * 2)
+        futures = []
+
+        with ThreadPoolExecutor(max_workers=UP_CONCURRENCY, thread_name_prefix="pyjx-up") as executor:
+            for batch in chunk(changes, IMPORT_BATCH_SIZE):
+                slots.acquire()
+                future = executor.submit(test_execution.set_test_statuses, dict(batch))
+                future.add_done_callback(lambda _: slots.release())
+                futures.append(future)
+
+        outcomes = {}
+
+        for future in futures:
+            outcomes.update(future.result())
+
+        return outcomes
+
+    def __notify_observers(self, issue, message: str) -> None:
+        for observer in self.__observers:
+            observer.update(issue, message, str(datetime.now()))
@@ -17,7 +17,7 @@ class TestJSONSchemaUpdate(unittest.TestCase):
                 'src',
                 'pyjx',
                 'schemas',
-                'attach_results_schema.json'
+                'attach_results_schema_1.json'
             )
         )
         with open(path, 'r', encoding="utf-8") as file:
@@ -0,0 +1,151 @@
+import re
+import json
+import threading
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubRequest:
+    """Petición recibida por el servidor de pruebas."""
+
+    def __init__(self, method: str, path: str, query: dict, body: bytes, headers: dict) -> None:
+        self.method = method
+        self.path = path
+        self.query = query
+        self.body = body
+        self.headers = headers
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class StubJiraServer:
+    """Servidor HTTP local que imita las respuestas de Jira/Xray en las pruebas unitarias.
+
+    Las rutas se registran con una expresión regular sobre el path y una función que
+    recibe la StubRequest y devuelve una tupla (status, body, headers).
+
+    Examples:
+        >>> server = StubJiraServer().start()
+        >>> server.route("GET", r"rest/api/2/issue/PJX-1", body={"key": "PJX-1"})
+        >>> server.url
+        "http://127.0.0.1:50000/"
+        >>> server.stop()
+    """
+
+    def __init__(self) -> None:
+        self.routes: list = []
+        self.requests: list[StubRequest] = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self.__server = None
+        self.__thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.__server.server_address
+        return f"http://{host}:{port}/"
+
+    def route(self, method: str, pattern: str, handler=None, status: int = 200, body=None, headers: dict = None) -> None:
+        if handler is None:
+            handler = lambda request: (status, body, headers or {})
+
+        self.routes.insert(0, (method, re.compile(pattern), handler))
+
+    def route_search_by_keys(self, make_issue=None) -> None:
+        """Responde `rest/api/2/search` con los issues de la cláusula `id in (...)` de la consulta."""
+        make_issue = make_issue or issue_payload
+
+        def handler(request):
+            jql = request.query["jql"][0]
+            keys = jql[jql.index("id in (") + len("id in ("):jql.index(")")].split(",") if "id in (" in jql else []
+            start_at = int(request.query.get("startAt", ["0"])[0])
+            max_results = int(request.query.get("maxResults", ["50"])[0])
+            issues = [make_issue(key) for key in keys[start_at:start_at + max_results]]
+            return 200, {"startAt": start_at, "total": len(keys), "issues": issues}, {}
+
+        self.route("GET", r"rest/api/2/search", handler=handler)
+
+    def route_server_clock(self, server_time: str = "2024-05-01T10:00:00.000-0600", time_zone: str = "America/Mexico_City") -> None:
+        """Responde `rest/api/2/serverInfo` con la hora del servidor y `rest/api/2/myself` con la zona horaria del usuario."""
+        self.route("GET", r"rest/api/2/serverInfo", body={"serverTime": server_time})
+        self.route("GET", r"rest/api/2/myself", body={"name": "user", "timeZone": time_zone})
+
+    def requests_to(self, method: str, pattern: str) -> list[StubRequest]:
+        regex = re.compile(pattern)
+        return [request for request in self.requests if request.method == method and regex.fullmatch(request.path)]
+
+    def start(self) -> "StubJiraServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with stub.lock:
+                    stub.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def __handle(self):
+                parsed = urlparse(self.path)
+                path = parsed.path.lstrip("/")
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                request = StubRequest(self.command, path, parse_qs(parsed.query), body, dict(self.headers))
+
+                with stub.lock:
+                    stub.requests.append(request)
+
+                status, payload, headers = 404, {"errorMessages": [f"No route for {path}"]}, {}
+
+                for method, pattern, handler in stub.routes:
+                    if method == self.command and pattern.fullmatch(path):
+                        status, payload, headers = handler(request)
+                        break
+
+                if isinstance(payload, (bytes, str)):
+                    content = payload.encode("utf-8") if isinstance(payload, str) else payload
+                elif payload is None:
+                    content = b""
+                else:
+                    content = json.dumps(payload).encode("utf-8")
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, str(value))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = __handle
+
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
+
+
+def issue_payload(key: str, issuetype: str = "Test", summary: str = "", **fields) -> dict:
+    """Construye un issue con la forma que devuelve `rest/api/2/issue/{key}`."""
+    number = key.split("-")[-1]
+    return {
+        "id": str(10000 + int(number)),
+        "key": key,
+        "self": f"https://jira.com/rest/api/2/issue/{10000 + int(number)}",
+        "fields": {
+            "summary": summary or f"Summary {key}",
+            "issuetype": {"name": issuetype},
+            **fields
+        }
+    }
@@ -0,0 +1,206 @@
+import time
+import asyncio
+import threading
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.async_client import AsyncClient
+from pyjx.api.factories.async_issue_factory import AsyncIssueFactory
+from pyjx.errors import ClientError
+from pyjx.models.test import Test
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+class TestAsyncIssueFactory(TestCase):
+    def setUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.server = StubJiraServer().start()
+        self.server.route("GET", r"rest/api/2/issue/PJX-\d+", handler=self.slow_issue)
+        self.server.route("POST", r"rest/api/2/issueLink", handler=self.slow_link)
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool(pool_maxsize=10)
+        AsyncClient.configure(max_workers=10)
+
+    def tearDown(self):
+        AsyncClient.close()
+        Client.close()
+        self.server.stop()
+
+    def track(self, response):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.2)
+        with self.lock:
+            self.in_flight -= 1
+        return response
+
+    def slow_issue(self, request):
+        key = request.path.split("/")[-1]
+        return self.track((200, issue_payload(key), {}))
+
+    def slow_link(self, request):
+        return self.track((201, "", {}))
+
+    def test_bulk_create_dispatches_batches_under_semaphore(self):
+        def slow_bulk(request):
+            updates = request.json()["issueUpdates"]
+            return self.track((201, {"issues": [{"key": update["fields"]["summary"]} for update in updates]}, {}))
+
+        self.server.route("POST", r"rest/api/2/issue/bulk", handler=slow_bulk)
+        self.server.route_search_by_keys()
+        keys = [f"PJX-{number}" for number in range(1, 251)]
+        factory = AsyncIssueFactory(concurrency=3)
+
+        start = time.perf_counter()
+        issues = asyncio.run(factory.bulk_create({"issueUpdates": [{"fields": {"summary": key}} for key in keys]}))
+        elapsed = time.perf_counter() - start
+
+        batch_sizes = [len(request.json()["issueUpdates"]) for request in self.server.requests_to("POST", r"rest/api/2/issue/bulk")]
+        assert_that([issue.key() for issue in issues]).is_equal_to(keys)
+        assert_that(issues[0]).is_instance_of(Test)
+        assert_that(batch_sizes).is_equal_to([50] * 5)
+        assert_that(self.max_in_flight).is_equal_to(3)
+        assert_that(elapsed).is_less_than(5 * 0.2)
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/.*")).is_empty()
+
+    def test_bulk_create_keeps_other_batches_when_one_fails_on_the_server(self):
+        def bulk(request):
+            updates = request.json()["issueUpdates"]
+            if any(update["fields"]["summary"] == "PJX-60" for update in updates):
+                return 500, {"errorMessages": ["Internal server error"]}, {}
+            return 201, {"issues": [{"key": update["fields"]["summary"]} for update in updates]}, {}
+
+        self.server.route("POST", r"rest/api/2/issue/bulk", handler=bulk)
+        self.server.route_search_by_keys()
+        keys = [f"PJX-{number}" for number in range(1, 61)]
+
+        issues = asyncio.run(AsyncIssueFactory().bulk_create({"issueUpdates": [{"fields": {"summary": key}} for key in keys]}))
+
+        assert_that([issue.key() for issue in issues]).is_equal_to(keys[:50])
+        assert_that([error["index"] for error in issues.errors()]).is_equal_to(list(range(50, 60)))
+        assert_that(issues.errors()[0]["status"]).is_equal_to(500)
+
+    def test_bulk_create_fetches_issues_missing_from_the_search_index(self):
+        self.server.route("POST", r"rest/api/2/issue/bulk", body={"issues": [{"key": "PJX-1"}, {"key": "PJX-2"}, {"key": "PJX-3"}], "errors": []})
+        self.server.route("GET", r"rest/api/2/search", body={"startAt": 0, "total": 1, "issues": [issue_payload("PJX-1")]})
+        self.server.route("GET", r"rest/api/2/issue/PJX-3", status=404, body={"errorMessages": ["Issue Does Not Exist"]})
+
+        issues = asyncio.run(AsyncIssueFactory().bulk_create({"issueUpdates": [{"fields": {"summary": key}} for key in ["PJX-1", "PJX-2", "PJX-3"]]}))
+
+        assert_that([issue.key() for issue in issues]).is_equal_to(["PJX-1", "PJX-2"])
+        assert_that(issues.errors()).is_length(1)
+        assert_that(issues.errors()[0]).contains_entry({"index": 2}, {"key": "PJX-3"}, {"status": 404})
+
+    def test_factory_can_be_reused_across_event_loops(self):
+        self.server.route("POST", r"rest/api/2/issue/bulk", handler=lambda request: (
+            201, {"issues": [{"key": update["fields"]["summary"]} for update in request.json()["issueUpdates"]], "errors": []}, {}
+        ))
+        self.server.route_search_by_keys()
+        factory = AsyncIssueFactory(concurrency=1)
+        data = {"PJX-1": {"fields": {"summary": "PJX-11"}}, "PJX-2": {"fields": {"summary": "PJX-12"}}}
+
+        # Con un solo lugar, los enlaces de cada ejecución esperan en el semáforo de su propio event loop
+        first = asyncio.run(factory.bulk_clone(data))
+        second = asyncio.run(factory.bulk_clone(data))
+
+        assert_that([clone.key() for clone in first]).is_equal_to(["PJX-11", "PJX-12"])
+        assert_that([clone.key() for clone in second]).is_equal_to(["PJX-11", "PJX-12"])
+        assert_that(second.link_errors()).is_empty()
+
+    def test_bulk_get_builds_issues_from_search(self):
+        self.server.route("GET", r"rest/api/2/search", body={"issues": [issue_payload("PJX-1"), issue_payload("PJX-2")]})
+        factory = AsyncIssueFactory()
+
+        issues = asyncio.run(factory.bulk_get(["PJX-1", "PJX-2"]))
+
+        assert_that([issue.key() for issue in issues]).is_equal_to(["PJX-1", "PJX-2"])
+        assert_that(self.server.requests).is_length(1)
+
+    def test_bulk_get_keeps_the_projection(self):
+        self.server.route_search_by_keys()
+        factory = AsyncIssueFactory()
+
+        issues = asyncio.run(factory.bulk_get(["PJX-1", "PJX-2"], fields=["summary"]))
+
+        assert_that([issue.is_partial() for issue in issues]).is_equal_to([True, True])
+        assert_that(issues[0].has_fields(["issuetype", "summary"])).is_true()
+        assert_that(issues[0].has_fields(["labels"])).is_false()
+        assert_that(asyncio.run(factory.bulk_get(["PJX-3"]))[0].is_partial()).is_false()
+
+    def test_bulk_clone_links_concurrently(self):
+        self.server.route("POST", r"rest/api/2/issue/bulk", status=201, body={"issues": [{"key": "PJX-10"}, {"key": "PJX-11"}, {"key": "PJX-12"}]})
+        self.server.route_search_by_keys()
+        factory = AsyncIssueFactory(concurrency=3)
+
+        issues = asyncio.run(factory.bulk_clone({
+            "PJX-1": {"fields": {"summary": "1"}},
+            "PJX-2": {"fields": {"summary": "2"}},
+            "PJX-3": {"fields": {"summary": "3"}}
+        }))
+
+        links = [request.json() for request in self.server.requests_to("POST", r"rest/api/2/issueLink")]
+        assert_that([issue.key() for issue in issues]).is_equal_to(["PJX-10", "PJX-11", "PJX-12"])
+        assert_that([(link["inwardIssue"]["key"], link["outwardIssue"]["key"]) for link in links]).contains_only(
+            ("PJX-1", "PJX-10"), ("PJX-2", "PJX-11"), ("PJX-3", "PJX-12")
+        )
+        assert_that(self.max_in_flight).is_equal_to(3)
+
+    def test_bulk_clone_collects_link_errors(self):
+        self.server.route("POST", r"rest/api/2/issue/bulk", status=201, body={"issues": [{"key": "PJX-10"}, {"key": "PJX-11"}]})
+        self.server.route("POST", r"rest/api/2/issueLink", handler=lambda request: (
+            (404, {"errorMessages": ["Issue does not exist"], "errors": {}}, {}) if request.json()["inwardIssue"]["key"] == "PJX-2" else (201, "", {})
+        ))
+        self.server.route_search_by_keys()
+
+        clones = asyncio.run(AsyncIssueFactory().bulk_clone({"PJX-1": {"fields": {"summary": "1"}}, "PJX-2": {"fields": {"summary": "2"}}}))
+
+        assert_that([clone.key() for clone in clones]).is_equal_to(["PJX-10", "PJX-11"])
+        assert_that(clones.link_errors()).is_equal_to([{
+            "inward": "PJX-2",
+            "outward": "PJX-11",
+            "status": 404,
+            "errors": {"errorMessages": ["Issue does not exist"], "errors": {}}
+        }])
+
+    def test_get_supports_projection_and_expand(self):
+        factory = AsyncIssueFactory()
+
+        issue = asyncio.run(factory.get("PJX-1", fields=["summary"]))
+        cached = asyncio.run(factory.get("PJX-1", fields=["summary"]))
+        asyncio.run(factory.get("PJX-1", expand=["changelog"]))
+
+        requests = self.server.requests_to("GET", r"rest/api/2/issue/PJX-1")
+        assert_that(issue.is_partial()).is_true()
+        assert_that(cached).is_same_as(issue)
+        assert_that([request.query for request in requests]).is_equal_to([{"fields": ["issuetype,summary"]}, {"expand": ["changelog"]}])
+
+    def test_errors_keep_client_semantics(self):
+        self.server.route("GET", r"rest/api/2/issue/PJX-404", status=404, body={"errorMessages": ["Not found"]})
+        factory = AsyncIssueFactory()
+
+        assert_that(asyncio.run).raises(ClientError).when_called_with(factory.get("PJX-404"))
+
+    def test_bulk_get_requests_remaining_pages_concurrently(self):
+        issues = [issue_payload(f"PJX-{number}") for number in range(1, 121)]
+
+        def handler(request):
+            start_at = int(request.query["startAt"][0])
+            return self.track((200, {"total": 120, "issues": issues[start_at:start_at + 50]}, {}))
+
+        self.server.route("GET", r"rest/api/2/search", handler=handler)
+        factory = AsyncIssueFactory()
+
+        result = asyncio.run(factory.bulk_get([issue["key"] for issue in issues]))
+
+        assert_that([issue.key() for issue in result]).is_equal_to([issue["key"] for issue in issues])
+        assert_that(self.max_in_flight).is_equal_to(2)
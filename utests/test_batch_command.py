@@ -0,0 +1,135 @@
+import io
+import json
+import tempfile
+from argparse import Namespace
+from contextlib import redirect_stdout
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.journal import spec_digest
+from pyjx.workflows.env.batch_command import BatchEnvironmentCommand
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+AUTH = {"username": "user", "password": "password"}
+
+
+class TestBatchEnvironmentCommand(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        self.server.route_search_by_keys()
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", issuetype="Test Plan"))
+        self.server.route("GET", r"rest/api/2/issue/PJX-2", body=issue_payload("PJX-2", issuetype="Test Execution"))
+        self.server.route("GET", r"rest/api/2/issue/PJX-3", body=issue_payload("PJX-3", issuetype="Test Set"))
+        self.server.route("GET", r"rest/api/2/issue/PJX-404", status=404, body={"errorMessages": ["Issue Does Not Exist"]})
+        self.server.route("POST", r"rest/raven/1.0/api/testset/PJX-3/test", body="")
+        self.server.route("POST", r"rest/raven/1.0/api/testexec/PJX-2/test", body="")
+        self.server.route("POST", r"rest/raven/1.0/api/testplan/PJX-1/testexecution", body="")
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        Client.close()
+        self.server.stop()
+        self.directory.cleanup()
+
+    def command(self, lines: list[str], **options) -> BatchEnvironmentCommand:
+        with open(os.path.join(self.directory.name, "specs.jsonl"), mode="w", encoding="utf-8") as batch_file:
+            batch_file.write("\n".join(lines) + "\n")
+
+        args = Namespace(path=None, txt_reporter=False, no_console_reporter=True, schema_version=1, disk_cache=False, plan_only=False, rate_limit=None, resume=False, namespace="pyjx.env.json", batch="specs.jsonl", batch_workers=2)
+        vars(args).update(options)
+
+        return BatchEnvironmentCommand(args, self.directory.name)
+
+    def spec(self, **content) -> str:
+        return json.dumps({"auth": AUTH, **content})
+
+    def test_specs_are_built_concurrently_with_a_summary(self):
+        command = self.command([
+            self.spec(plan="PJX-1", execution="PJX-2", set="PJX-3", tests={"add": {"keys": ["PJX-10"]}}),
+            "",
+            self.spec(plan="PJX-404", execution="PJX-2", set="PJX-3", tests={"add": {"keys": ["PJX-11"]}}),
+            self.spec(plan="PJX-1", execution="PJX-2", set="PJX-3", tests={"add": {"keys": ["PJX-12"]}})
+        ])
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            outcomes = command.execute()
+
+        assert_that([(outcome["spec"], outcome["status"]) for outcome in outcomes]).is_equal_to([("1", "ok"), ("3", "error"), ("4", "ok")])
+        assert_that(outcomes[0]).has_added(3)
+        assert_that(outcomes[1]["error"]).starts_with("ClientError")
+        # La especificación con el plan inexistente falla al validarse, antes de cualquier escritura
+        assert_that(sorted(request.json()["add"] for request in self.server.requests_to("POST", r"rest/raven/1.0/api/testset/PJX-3/test"))).is_equal_to([["PJX-10"], ["PJX-12"]])
+        assert_that([request.json()["add"] for request in self.server.requests_to("POST", r"rest/raven/1.0/api/testexec/PJX-2/test")]).is_equal_to([["PJX-3"], ["PJX-3"]])
+        assert_that([request for request in self.server.requests if request.method == "POST" and "PJX-11" in request.body.decode("utf-8")]).is_empty()
+        journal = f"pyjx.env.{spec_digest(json.loads(self.spec(plan='PJX-1', execution='PJX-2', set='PJX-3', tests={'add': {'keys': ['PJX-12']}})))}.journal.jsonl"
+        assert_that(os.path.exists(os.path.join(self.directory.name, journal))).is_true()
+        assert_that(output.getvalue()).contains("Resumen del lote (3 ambientaciones, 1 con error):")
+        assert_that(output.getvalue()).contains("  [1] ok en ", ": 0 issues creados, 0 enlaces, 3 agregados")
+
+    def test_txt_reporter_labels_the_lines_of_each_spec(self):
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-3/test", body=[])
+        command = self.command([
+            self.spec(plan="PJX-1", execution="PJX-2", set="PJX-3", tests={"add": {"keys": ["PJX-10"]}}),
+            self.spec(plan="PJX-1", execution="PJX-2", set="PJX-3", tests={"add": {"keys": ["PJX-12"]}})
+        ], txt_reporter=True)
+
+        command.execute()
+
+        with open(os.path.join(self.directory.name, "pyjx.env.log"), mode="r", encoding="utf-8") as log_file:
+            lines = log_file.read().splitlines()
+
+        assert_that(lines).is_not_empty()
+        assert_that([line for line in lines if "[1] " not in line and "[2] " not in line]).is_empty()
+        assert_that([line for line in lines if "[1] Ruta crítica de" in line]).is_length(1)
+        assert_that([line for line in lines if "[2] Ruta crítica de" in line]).is_length(1)
+
+    def test_every_spec_is_validated_before_building_any(self):
+        with self.assertRaises(ValueError) as context:
+            self.command([
+                self.spec(plan="PJX-1", tests={"add": {"keys": ["PJX-10"]}}),
+                '{"plan": "PJX-1",',
+                self.spec(plan="not a key", tests={"add": {"keys": ["PJX-10"]}})
+            ])
+
+        assert_that(str(context.exception)).contains("Línea 2: JSON inválido", "Línea 3: ")
+        assert_that(str(context.exception)).does_not_contain("Línea 1")
+        assert_that(self.server.requests).is_empty()
+
+    def test_resume_follows_each_spec_after_reordering_the_batch(self):
+        specs = [
+            self.spec(plan="PJX-1", execution="PJX-2", set="PJX-3", tests={"add": {"keys": ["PJX-10"]}}),
+            self.spec(plan="PJX-1", execution="PJX-2", set="PJX-3", tests={"add": {"keys": ["PJX-11"]}})
+        ]
+
+        with redirect_stdout(io.StringIO()):
+            self.command(specs).execute()
+            self.server.requests.clear()
+            outcomes = self.command(list(reversed(specs)), resume=True).execute()
+
+        assert_that([outcome["status"] for outcome in outcomes]).is_equal_to(["ok", "ok"])
+        assert_that([request for request in self.server.requests if request.method == "POST"]).is_empty()
+
+    def test_repeated_specs_are_rejected(self):
+        spec = self.spec(plan="PJX-1", tests={"add": {"keys": ["PJX-10"]}})
+
+        with self.assertRaises(ValueError) as context:
+            self.command([spec, spec])
+
+        assert_that(str(context.exception)).contains("Línea 2: repite la especificación de la línea 1")
+
+    def test_specs_must_share_the_credentials(self):
+        self.assertRaises(ValueError, self.command, [
+            self.spec(plan="PJX-1"),
+            json.dumps({"auth": {"username": "other", "password": "password"}, "plan": "PJX-1", "set": "PJX-3"})
+        ])
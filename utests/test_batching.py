@@ -0,0 +1,53 @@
+from unittest import TestCase
+from urllib.parse import quote_plus
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+
+from pyjx.api.batching import chunk, chunk_keys, order_by_keys
+
+
+class Issue:
+    def __init__(self, key: str, id_: str) -> None:
+        self.__key = key
+        self.__id = id_
+
+    def key(self):
+        return self.__key
+
+    def id(self):
+        return self.__id
+
+
+class TestBatching(TestCase):
+    def test_chunk(self):
+        assert_that(list(chunk(range(5), 2))).is_equal_to([[0, 1], [2, 3], [4]])
+        assert_that(list(chunk([], 2))).is_empty()
+
+    def test_chunk_keys_by_count(self):
+        keys = [f"PJX-{number}" for number in range(1, 8)]
+
+        batches = list(chunk_keys(keys, max_count=3, max_length=10000))
+
+        assert_that(batches).is_equal_to([keys[0:3], keys[3:6], keys[6:7]])
+
+    def test_chunk_keys_by_encoded_length(self):
+        keys = [f"PJX-{number}" for number in range(1000, 1100)]
+
+        batches = list(chunk_keys(keys, max_count=1000, max_length=100))
+
+        assert_that([key for batch in batches for key in batch]).is_equal_to(keys)
+        for batch in batches:
+            assert_that(len(quote_plus(",".join(batch)))).is_less_than_or_equal_to(100)
+
+    def test_chunk_keys_keeps_oversize_key_alone(self):
+        assert_that(list(chunk_keys(["PJX-1", "PJX-100000"], max_count=10, max_length=5))).is_equal_to([["PJX-1"], ["PJX-100000"]])
+
+    def test_order_by_keys(self):
+        first, second, third = Issue("PJX-1", "101"), Issue("PJX-2", "102"), Issue("PJX-3", "103")
+
+        ordered = order_by_keys([third, first, second], ["102", "pjx-1", "PJX-2", "PJX-404"])
+
+        assert_that(ordered).is_equal_to([second, first, third])
@@ -0,0 +1,182 @@
+import time
+from unittest import TestCase
+from requests import Timeout
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.retry import RetryPolicy
+from pyjx.errors import ClientError, ServerError
+from requests import ConnectionError
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+class TestClient(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1"))
+        self.server.route("POST", r"rest/api/2/issueLink", status=201, body="")
+        self.server.route("GET", r"rest/api/2/issue/PJX-404", status=404, body={"errorMessages": ["Not found"]})
+        self.server.route("GET", r"rest/api/2/issue/PJX-500", status=500, body={"errorMessages": ["Boom"]})
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+        Client.configure_retry(RetryPolicy(backoff_factor=0.01))
+
+    def tearDown(self):
+        Client.close()
+        Client.configure_retry(RetryPolicy())
+        self.server.stop()
+
+    def route_failing(self, method: str, path: str, statuses: list[int], headers: dict = None):
+        responses = iter(statuses)
+
+        def handler(request):
+            status = next(responses, 200)
+            return status, {"key": "PJX-1"} if status < 400 else {"errorMessages": ["Try later"]}, headers or {}
+
+        self.server.route(method, path, handler=handler)
+
+    def test_requests_reuse_pooled_connection(self):
+        for _ in range(5):
+            issue = Client.get("rest/api/2/issue/PJX-1")
+            assert_that(issue["key"]).is_equal_to("PJX-1")
+
+        Client.post("rest/api/2/issueLink", json={})
+
+        assert_that(self.server.requests).is_length(6)
+        assert_that(self.server.connections).is_equal_to(1)
+
+    def test_session_is_shared_until_closed(self):
+        session = Client.session()
+        assert_that(Client.session()).is_same_as(session)
+
+        Client.close()
+
+        assert_that(Client.session()).is_not_same_as(session)
+
+    def test_close_opens_new_connection_on_next_request(self):
+        Client.get("rest/api/2/issue/PJX-1")
+        Client.close()
+        Client.get("rest/api/2/issue/PJX-1")
+
+        assert_that(self.server.connections).is_equal_to(2)
+
+    def test_configure_pool_replaces_session(self):
+        session = Client.session()
+        Client.configure_pool(pool_connections=2, pool_maxsize=4, pool_block=True)
+        adapter = Client.session().get_adapter(self.server.url)
+
+        assert_that(Client.session()).is_not_same_as(session)
+        assert_that(adapter._pool_maxsize).is_equal_to(4)
+        assert_that(adapter._pool_block).is_true()
+
+    def test_empty_body_is_returned_as_empty_dict(self):
+        assert_that(Client.post("rest/api/2/issueLink", json={})).is_equal_to({})
+
+    def test_status_errors(self):
+        assert_that(Client.get).raises(ClientError).when_called_with("rest/api/2/issue/PJX-404")
+        assert_that(Client.get).raises(ServerError).when_called_with("rest/api/2/issue/PJX-500")
+
+    def test_throttled_get_is_retried(self):
+        self.route_failing("GET", r"rest/api/2/issue/PJX-2", [429, 503], headers={"Retry-After": "0"})
+
+        issue = Client.get("rest/api/2/issue/PJX-2")
+
+        assert_that(issue["key"]).is_equal_to("PJX-1")
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/PJX-2")).is_length(3)
+        assert_that(Client.retry_stats()).is_equal_to({"GET": 2})
+
+    def test_post_is_only_retried_when_throttled(self):
+        self.route_failing("POST", r"rest/api/2/issue", [429])
+
+        Client.post("rest/api/2/issue", json={})
+        self.route_failing("POST", r"rest/api/2/issue", [503])
+
+        assert_that(Client.post).raises(ServerError).when_called_with("rest/api/2/issue", json={})
+        assert_that(self.server.requests_to("POST", r"rest/api/2/issue")).is_length(3)
+
+    def test_error_is_raised_when_retries_are_exhausted(self):
+        Client.configure_retry(RetryPolicy(max_retries=2, backoff_factor=0.01))
+        self.route_failing("GET", r"rest/api/2/issue/PJX-2", [429, 429, 429, 429])
+
+        assert_that(Client.get).raises(ClientError).when_called_with("rest/api/2/issue/PJX-2")
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/PJX-2")).is_length(3)
+
+    def route_slow(self, method: str, path: str, slow_calls: int):
+        calls = iter(range(slow_calls))
+
+        def handler(request):
+            if next(calls, None) is not None:
+                time.sleep(0.5)
+            return 200, issue_payload("PJX-2"), {}
+
+        self.server.route(method, path, handler=handler)
+
+    def test_timed_out_get_is_retried(self):
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"), timeout=0.2)
+        self.route_slow("GET", r"rest/api/2/issue/PJX-2", slow_calls=2)
+
+        issue = Client.get("rest/api/2/issue/PJX-2")
+
+        assert_that(issue["key"]).is_equal_to("PJX-2")
+        assert_that(Client.retry_stats()).is_equal_to({"GET": 2})
+
+    def test_timed_out_post_is_not_retried(self):
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"), timeout=0.2)
+        self.route_slow("POST", r"rest/api/2/issue", slow_calls=1)
+
+        assert_that(Client.post).raises(Timeout).when_called_with("rest/api/2/issue", json={})
+        assert_that(Client.retry_stats()).is_empty()
+
+    def test_connection_errors_are_retried_until_the_budget_runs_out(self):
+        Client.configure("http://127.0.0.1:9/", HTTPBasicAuth("user", "password"))
+        Client.configure_retry(RetryPolicy(max_retries=2, backoff_factor=0.01))
+
+        assert_that(Client.get).raises(ConnectionError).when_called_with("rest/api/2/issue/PJX-1")
+        assert_that(Client.retry_stats()).is_equal_to({"GET": 2})
+
+
+class FakeResponse:
+    def __init__(self, status_code: int = 429, headers: dict = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class TestRetryPolicy(TestCase):
+    def test_delay_honours_retry_after(self):
+        policy = RetryPolicy(max_backoff=30)
+
+        assert_that(policy.delay(0, FakeResponse(headers={"Retry-After": "7"}))).is_equal_to(7)
+        assert_that(policy.delay(0, FakeResponse(headers={"Retry-After": "120"}))).is_equal_to(30)
+        assert_that(policy.delay(0, FakeResponse(headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}))).is_equal_to(0)
+
+    def test_delay_backs_off_exponentially(self):
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+
+        assert_that([policy.delay(attempt) for attempt in range(4)]).is_equal_to([0.5, 1, 2, 3])
+
+    def test_jitter_stays_within_backoff(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=30)
+
+        for _ in range(50):
+            assert_that(policy.delay(2)).is_between(0, 4)
+
+    def test_statuses_are_configurable_per_method(self):
+        policy = RetryPolicy(max_retries=1, statuses_by_method={"POST": {429, 503}})
+
+        assert_that(policy.should_retry("POST", FakeResponse(503), 0)).is_true()
+        assert_that(policy.should_retry("POST", FakeResponse(503), 1)).is_false()
+        assert_that(policy.should_retry("GET", FakeResponse(404), 0)).is_false()
+
+    def test_connection_errors_are_only_retried_for_idempotent_methods(self):
+        policy = RetryPolicy(max_retries=1)
+
+        assert_that(policy.should_retry_error("PUT", ConnectionError(), 0)).is_true()
+        assert_that(policy.should_retry_error("GET", Timeout(), 1)).is_false()
+        assert_that(policy.should_retry_error("POST", ConnectionError(), 0)).is_false()
+        assert_that(policy.should_retry_error("GET", ValueError(), 0)).is_false()
@@ -0,0 +1,143 @@
+import gc
+import json
+import tracemalloc
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.factories.issue_factory import IssueFactory, WORKFLOW_FIELDS
+from pyjx.api.caches.issue_store import IssueStore
+from pyjx.models.compact import compact_details, named_value
+from pyjx.models.test import Test
+from stub_jira_server import StubJiraServer
+
+
+def jira_payload(number: int) -> str:
+    """JSON de un Test como lo devuelve `rest/api/2/search` sin proyección."""
+    fields = {
+        "issuetype": {
+            "self": "https://jira.example.com/rest/api/2/issuetype/10100",
+            "id": "10100",
+            "description": "Un caso de prueba de Xray",
+            "iconUrl": "https://jira.example.com/secure/viewavatar?size=xsmall&avatarId=10315&avatarType=issuetype",
+            "name": "Test",
+            "subtask": False,
+            "avatarId": 10315
+        },
+        "summary": f"Validar el inicio de sesión con credenciales válidas número {number}",
+        "status": {
+            "self": "https://jira.example.com/rest/api/2/status/10000",
+            "description": "",
+            "iconUrl": "https://jira.example.com/",
+            "name": "To Do",
+            "id": "10000",
+            "statusCategory": {"self": "https://jira.example.com/rest/api/2/statuscategory/2", "id": 2, "key": "new", "colorName": "blue-gray", "name": "To Do"}
+        },
+        "priority": {"self": "https://jira.example.com/rest/api/2/priority/3", "iconUrl": "https://jira.example.com/images/icons/priorities/medium.svg", "name": "Medium", "id": "3"},
+        "labels": ["regression", "login"],
+        "description": "Dado un usuario registrado\nCuando ingresa usuario y contraseña válidos\nEntonces accede al tablero principal. " * 3,
+        "created": "2024-03-01T10:15:30.000-0600",
+        "updated": "2024-03-02T11:20:00.000-0600",
+        **{f"customfield_{10000 + index}": None for index in range(25)}
+    }
+
+    return json.dumps({
+        "expand": "operations,versionedRepresentations,editmeta,changelog,renderedFields",
+        "id": str(10000 + number),
+        "self": f"https://jira.example.com/rest/api/2/issue/{10000 + number}",
+        "key": f"PJX-{number}",
+        "fields": fields
+    })
+
+
+def bytes_per_issue(factory: IssueFactory, fields: list[str] = None, count: int = 2000) -> float:
+    payloads = [jira_payload(number) for number in range(count)]
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        issues = [factory.build(json.loads(payload), fields) for payload in payloads]
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert_that(issues).is_length(count)
+
+    return (after - before) / count
+
+
+class TestCompactModels(TestCase):
+    def test_models_have_no_instance_dict(self):
+        test = IssueFactory().build(json.loads(jira_payload(1)))
+
+        assert_that(hasattr(test, "__dict__")).is_false()
+        assert_that(test.test_set_key()).is_none()
+        assert_that(repr(test)).contains("test_run=None")
+
+    def test_compact_details_keeps_only_projected_values(self):
+        details = compact_details(json.loads(jira_payload(1)), ["issuetype", "summary", "customfield_10000"])
+
+        assert_that(details).does_not_contain_key("expand")
+        assert_that(details["fields"]).is_equal_to({
+            "issuetype": {"name": "Test"},
+            "summary": "Validar el inicio de sesión con credenciales válidas número 1"
+        })
+
+    def test_named_values_are_shared_between_issues(self):
+        first = compact_details(json.loads(jira_payload(1)))
+        second = compact_details(json.loads(jira_payload(2)))
+
+        assert_that(first["fields"]["status"]).is_same_as(second["fields"]["status"])
+        assert_that(first["fields"]["issuetype"]["name"]).is_same_as(second["fields"]["issuetype"]["name"])
+        assert_that(first["fields"]).does_not_contain_key("customfield_10000")
+
+    def test_compact_issue_behaves_like_a_regular_one(self):
+        test = IssueFactory(compact=True, default_fields=WORKFLOW_FIELDS).build(json.loads(jira_payload(7)), WORKFLOW_FIELDS)
+
+        assert_that(test).is_instance_of(Test)
+        assert_that(test.key()).is_equal_to("PJX-7")
+        assert_that(test.id()).is_equal_to("10007")
+        assert_that(test.issuetype()).is_equal_to("Test")
+        assert_that(test.summary()).ends_with("número 7")
+
+    def test_lazily_loaded_issue_stays_compact(self):
+        server = StubJiraServer().start()
+        server.route("GET", r"rest/api/2/issue/PJX-7", body=json.loads(jira_payload(7)))
+        Client.configure(server.url, HTTPBasicAuth("user", "password"))
+
+        try:
+            test = IssueFactory(compact=True).build(json.loads(jira_payload(7)), WORKFLOW_FIELDS)
+            test.load()
+        finally:
+            Client.close()
+            server.stop()
+
+        assert_that(test.is_partial()).is_false()
+        assert_that(test.json()).does_not_contain_key("expand")
+        assert_that(test.json()["fields"]["status"]).is_same_as(named_value("status", "To Do"))
+        assert_that(test.json()["fields"]).does_not_contain_key("customfield_10000")
+        assert_that(test.json()["fields"]["labels"]).is_equal_to(["regression", "login"])
+
+    def test_compact_issue_can_be_stored(self):
+        store = IssueStore(path=":memory:", scope='project = "PJX"')
+        test = IssueFactory(compact=True).build(json.loads(jira_payload(7)))
+
+        store.put(test.json())
+
+        assert_that(store).is_length(1)
+
+    def test_memory_per_issue(self):
+        """Verifica la cifra documentada en `IssueFactory(compact=...)`: ~1.2 KB por Test compacto frente a ~6.7 KB."""
+        full = bytes_per_issue(IssueFactory())
+        compact = bytes_per_issue(IssueFactory(compact=True), WORKFLOW_FIELDS)
+
+        assert_that(compact).is_less_than(1500)
+        assert_that(compact * 4).is_less_than(full)
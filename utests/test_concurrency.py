@@ -0,0 +1,146 @@
+import time
+from threading import Thread
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.retry import RetryPolicy
+from pyjx.api.concurrency import AdaptiveLimit, is_overload
+from pyjx.api.factories.issue_factory import IssueFactory
+from pyjx.errors import ClientError, ServerError
+from stub_jira_server import StubJiraServer
+
+
+class FakeResponse:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.text = ""
+        self.reason = "Too Many Requests"
+        self.request = None
+
+    def json(self):
+        return {}
+
+
+class TestAdaptiveLimit(TestCase):
+    def test_limit_grows_additively_while_latency_is_stable(self):
+        limit = AdaptiveLimit(initial=4, max_limit=6)
+
+        for _ in range(4):
+            limit.run(lambda: None)
+
+        assert_that(limit.limit()).is_equal_to(4)
+        assert_that(limit.stats()["limit"]).is_greater_than(4.9)
+
+        for _ in range(100):
+            limit.run(lambda: None)
+
+        assert_that(limit.limit()).is_equal_to(6)
+
+    def test_overload_halves_the_limit_once_per_round(self):
+        limit = AdaptiveLimit(initial=8, min_limit=2)
+        started = [limit.acquire() for _ in range(3)]
+
+        for started_at in started:
+            limit.release(started_at, overloaded=True)
+
+        assert_that(limit.limit()).is_equal_to(4)
+        assert_that(limit.stats()["decreases"]).is_equal_to(1)
+
+        limit.release(limit.acquire(), overloaded=True)
+        limit.release(limit.acquire(), overloaded=True)
+
+        assert_that(limit.limit()).is_equal_to(2)
+
+    def test_latency_spike_shrinks_the_limit(self):
+        limit = AdaptiveLimit(initial=8, latency_tolerance=3)
+
+        for _ in range(5):
+            limit.run(time.sleep, 0.01)
+        limit.run(time.sleep, 0.1)
+
+        assert_that(limit.limit()).is_equal_to(4)
+
+    def test_latency_is_compared_within_each_operation(self):
+        limit = AdaptiveLimit(initial=8, latency_tolerance=3)
+
+        for _ in range(5):
+            limit.run(time.sleep, 0.01, operation="link")
+        limit.run(time.sleep, 0.1, operation="bulk_create")
+        limit.run(time.sleep, 0.01, operation="link")
+
+        assert_that(limit.stats()["decreases"]).is_equal_to(0)
+        assert_that(limit.stats()["latency"]).contains_key("link", "bulk_create")
+
+    def test_errors_are_propagated_and_classified(self):
+        limit = AdaptiveLimit(initial=8)
+
+        def throttled():
+            raise ClientError(FakeResponse(429))
+
+        assert_that(limit.run).raises(ClientError).when_called_with(throttled)
+        assert_that(limit.limit()).is_equal_to(4)
+        assert_that(is_overload(ServerError(FakeResponse(503)))).is_true()
+        assert_that(is_overload(ClientError(FakeResponse(400)))).is_false()
+
+    def test_in_flight_never_exceeds_the_limit(self):
+        limit = AdaptiveLimit(initial=2, max_limit=2)
+        observed = []
+
+        def work():
+            observed.append(limit.stats()["in_flight"])
+            time.sleep(0.02)
+
+        threads = [Thread(target=limit.run, args=(work,)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert_that(max(observed)).is_less_than_or_equal_to(2)
+
+
+class TestIssueFactoryAdaptiveConcurrency(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+        Client.configure_retry(RetryPolicy(max_retries=0))
+
+    def tearDown(self):
+        Client.configure_retry(RetryPolicy())
+        Client.close()
+        self.server.stop()
+
+    def test_default_limit_starts_at_concurrency(self):
+        factory = IssueFactory(concurrency=3)
+
+        assert_that(factory.concurrency_limit().limit()).is_equal_to(3)
+        assert_that(factory.concurrency_limit().max_limit()).is_equal_to(12)
+
+    def test_bulk_get_feeds_the_limit(self):
+        self.server.route_search_by_keys()
+        factory = IssueFactory(limit=AdaptiveLimit(initial=2, max_limit=4))
+
+        factory.bulk_get([f"PJX-{number}" for number in range(1, 1001)])
+
+        stats = factory.concurrency_limit().stats()
+        assert_that(stats["increases"] + stats["decreases"]).is_equal_to(5)
+        assert_that(stats["latency"]).contains_only("bulk_get")
+        assert_that(stats["latency"]["bulk_get"]).is_greater_than(0)
+
+    def test_throttled_bulk_create_shrinks_the_limit(self):
+        self.server.route("POST", r"rest/api/2/issue/bulk", status=429, body={"errorMessages": ["Rate limit exceeded"]})
+        factory = IssueFactory(limit=AdaptiveLimit(initial=8))
+
+        created = factory.bulk_create({"issueUpdates": [{"fields": {"summary": str(number)}} for number in range(10)]})
+
+        assert_that(created).is_empty()
+        assert_that(created.errors()).is_length(10)
+        assert_that(factory.concurrency_limit().limit()).is_equal_to(4)
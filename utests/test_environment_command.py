@@ -0,0 +1,218 @@
+import io
+import json
+import tempfile
+from threading import Barrier, BrokenBarrierError
+from itertools import count
+from argparse import Namespace
+from contextlib import redirect_stdout
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.caches.issue_store import IssueStore
+from pyjx.errors import ClientError
+from pyjx.api.rate_limit import RateLimiter
+from pyjx.api.journal import JOURNAL_FILE
+from pyjx.workflows.env.environment_command import EnvironmentCommand
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+def overlapping(barrier: Barrier, payload: dict, overlapped: list):
+    """Responde `payload` cuando las demás peticiones del `barrier` también están en curso y anota la ruta en `overlapped`."""
+    def handler(request):
+        try:
+            barrier.wait()
+            overlapped.append(request.path)
+        except BrokenBarrierError:
+            pass
+
+        return 200, payload, {}
+
+    return handler
+
+
+class TestEnvironmentCommand(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        self.server.route_search_by_keys()
+        self.server.route_server_clock()
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", issuetype="Test Plan"))
+        self.server.route("GET", r"rest/api/2/issue/PJX-2", body=issue_payload("PJX-2", issuetype="Test Execution"))
+        self.server.route("GET", r"rest/api/2/issue/PJX-3", body=issue_payload("PJX-3", issuetype="Test Set"))
+        self.server.route("POST", r"rest/api/2/issue", body={"id": "10003", "key": "PJX-3"})
+        self.server.route("POST", r"rest/api/2/issue/bulk", body={"issues": [{"id": "10020", "key": "PJX-20"}], "errors": []})
+        self.server.route("POST", r"rest/raven/1.0/api/testset/PJX-3/test", body="")
+        self.server.route("POST", r"rest/raven/1.0/api/testexec/PJX-2/test", body="")
+        self.server.route("POST", r"rest/raven/1.0/api/testplan/PJX-1/testexecution", body="")
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        Client.configure_rate_limit(RateLimiter())
+        Client.close()
+        self.server.stop()
+        self.directory.cleanup()
+
+    def command(self, content: dict, **options) -> EnvironmentCommand:
+        with open(os.path.join(self.directory.name, "pyjx.env.json"), mode="w", encoding="utf-8") as json_file:
+            json.dump({"auth": {"username": "user", "password": "password"}, **content}, json_file)
+
+        args = Namespace(path=None, txt_reporter=False, no_console_reporter=False, schema_version=1, disk_cache=False, plan_only=False, rate_limit=None, resume=False, namespace="pyjx.env.json")
+        vars(args).update(options)
+
+        return EnvironmentCommand(args, self.directory.name)
+
+    def test_environment_is_built_as_a_task_graph(self):
+        command = self.command({
+            "plan": "PJX-1",
+            "execution": "PJX-2",
+            "tests": {
+                "add": {"keys": ["PJX-10", "PJX-11"]},
+                "create": ["Login"],
+                "fields": {"app": {"key": "CDA-1"}, "path": "Regresión"}
+            }
+        })
+        output = io.StringIO()
+        reads, writes, overlapped = Barrier(2, timeout=5), Barrier(2, timeout=5), []
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", handler=overlapping(reads, issue_payload("PJX-1", issuetype="Test Plan"), overlapped))
+        self.server.route("GET", r"rest/api/2/issue/PJX-2", handler=overlapping(reads, issue_payload("PJX-2", issuetype="Test Execution"), overlapped))
+        self.server.route("POST", r"rest/api/2/issue", handler=overlapping(writes, {"id": "10003", "key": "PJX-3"}, overlapped))
+        self.server.route("POST", r"rest/api/2/issue/bulk", handler=overlapping(writes, {"issues": [{"id": "10020", "key": "PJX-20"}], "errors": []}, overlapped))
+
+        with redirect_stdout(output):
+            command.execute()
+
+        # El plan y la ejecución se leen a la vez, y el set y los tests se crean a la vez
+        assert_that(overlapped).contains_only("rest/api/2/issue/PJX-1", "rest/api/2/issue/PJX-2", "rest/api/2/issue", "rest/api/2/issue/bulk")
+        assert_that(overlapped).is_length(4)
+        assert_that([request.json() for request in self.server.requests_to("POST", r"rest/raven/1.0/api/testset/PJX-3/test")]).is_equal_to([
+            {"add": ["PJX-10", "PJX-11", "PJX-20"]}
+        ])
+        assert_that(self.server.requests_to("POST", r"rest/raven/1.0/api/testexec/PJX-2/test")[0].json()).is_equal_to({"add": ["PJX-3"]})
+        assert_that(self.server.requests_to("POST", r"rest/raven/1.0/api/testplan/PJX-1/testexecution")).is_length(1)
+        assert_that(output.getvalue()).contains("Ruta crítica de")
+        assert_that(output.getvalue()).contains("-> set.add (")
+
+    def test_txt_reporter_writes_the_log_in_the_invoke_path(self):
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-3/test", body=[])
+        command = self.command({"plan": "PJX-1", "execution": "PJX-2", "tests": {"add": {"keys": ["PJX-10"]}}}, txt_reporter=True, no_console_reporter=True)
+
+        command.execute()
+
+        with open(os.path.join(self.directory.name, "pyjx.env.log"), mode="r", encoding="utf-8") as log_file:
+            assert_that(log_file.read()).contains("Ruta crítica de")
+
+    def test_plan_only_records_writes_without_sending_them(self):
+        command = self.command({
+            "plan": "PJX-1",
+            "tests": {
+                "add": {"keys": ["PJX-10", "PJX-11"]},
+                "clone": {"keys": ["PJX-12", "PJX-10"]},
+                "create": ["Login"],
+                "fields": {"app": {"key": "CDA-1"}, "path": "Regresión"}
+            }
+        }, plan_only=True, rate_limit=2)
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            command.execute()
+
+        report = output.getvalue()
+        assert_that([request.method for request in self.server.requests]).contains_only("GET")
+        assert_that(report).contains("Issues a consultar (4): ")
+        assert_that(report).contains("PJX-1", "PJX-10", "PJX-11", "PJX-12")
+        assert_that(report).contains("Issues a crear (5):", "Test Execution", "Test Set")
+        assert_that(report).contains("Tests a clonar (2): PJX-12 -> PLANNED-")
+        assert_that(report).contains("  POST rest/api/2/issueLink: 2 (0 enviadas, 2 simuladas)")
+        assert_that(report).contains("  testexec PLANNED-")
+        assert_that(report).contains("Tiempo estimado con el límite de peticiones: ")
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/PLANNED-.*")).is_empty()
+
+    def test_resume_skips_the_writes_already_in_the_journal(self):
+        keys = count(100)
+        failing = {"enabled": True}
+
+        def bulk_create(request):
+            issue_updates = request.json()["issueUpdates"]
+
+            if failing["enabled"] and len(issue_updates) < 50:
+                return 500, {"errorMessages": ["Internal server error"]}, {}
+
+            return 200, {"issues": [{"id": str(key), "key": f"PJX-{key}"} for key in (next(keys) for _ in issue_updates)], "errors": []}, {}
+
+        self.server.route("POST", r"rest/api/2/issue/bulk", handler=bulk_create)
+        content = {
+            "plan": "PJX-1",
+            "execution": "PJX-2",
+            "tests": {
+                "create": [f"Login {index}" for index in range(60)],
+                "fields": {"app": {"key": "CDA-1"}, "path": "Regresión"}
+            }
+        }
+
+        with redirect_stdout(io.StringIO()):
+            # El lote que falla en el servidor se reporta como error de sus elementos y el resto se ambienta
+            self.command(content).execute()
+
+            failing["enabled"] = False
+            first_run = len(self.server.requests)
+            self.command(content, resume=True).execute()
+            resumed = self.server.requests[first_run:]
+
+            second_run = len(self.server.requests)
+            self.command(content, resume=True).execute()
+            replayed = self.server.requests[second_run:]
+
+        assert_that([len(request.json()["issueUpdates"]) for request in resumed if request.path == "rest/api/2/issue/bulk"]).is_equal_to([10])
+        assert_that([request for request in resumed if request.path == "rest/api/2/issue"]).is_empty()
+        assert_that([len(request.json()["add"]) for request in self.server.requests_to("POST", r"rest/raven/1.0/api/testset/PJX-3/test")]).is_equal_to([50, 10])
+        assert_that([request.method for request in replayed]).contains_only("GET")
+        assert_that(os.path.exists(os.path.join(self.directory.name, JOURNAL_FILE))).is_true()
+
+    def test_a_missing_issue_fails_before_any_write(self):
+        self.server.route("GET", r"rest/api/2/issue/PJX-404", status=404, body={"errorMessages": ["Issue Does Not Exist"]})
+        command = self.command({"plan": "PJX-404", "set": "PJX-3", "tests": {"add": {"keys": ["PJX-10"]}}})
+
+        with redirect_stdout(io.StringIO()):
+            self.assertRaises(ClientError, command.execute)
+
+        assert_that([request.method for request in self.server.requests]).contains_only("GET")
+
+    def test_an_issue_of_another_type_fails_before_any_write(self):
+        command = self.command({"plan": "PJX-2", "tests": {"create": ["Login"], "fields": {"app": {"key": "CDA-1"}, "path": "Regresión"}}})
+
+        with redirect_stdout(io.StringIO()):
+            self.assertRaises(ValueError, command.execute)
+
+        assert_that([request.method for request in self.server.requests]).contains_only("GET")
+
+    def test_disk_cache_serves_the_second_run(self):
+        home = os.environ.get("HOME")
+        os.environ["HOME"] = self.directory.name
+        content = {"plan": "PJX-1", "execution": "PJX-2", "set": "PJX-3", "tests": {"add": {"keys": ["PJX-10", "PJX-11"]}}}
+
+        try:
+            with redirect_stdout(io.StringIO()):
+                self.command(content, disk_cache=True).execute()
+                first_run = [request for request in self.server.requests if request.method == "GET"]
+                self.server.requests.clear()
+                self.command(content, disk_cache=True).execute()
+                second_run = [request for request in self.server.requests if request.method == "GET"]
+        finally:
+            os.environ["HOME"] = home
+
+        store = IssueStore(os.path.join(self.directory.name, ".pyjx", "issues.sqlite3"), scope='project = "PJX"')
+        assert_that(store).is_length(5)
+        store.close()
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/.*")).is_empty()
+        searches = [request.query["jql"][0] for request in second_run if request.path == "rest/api/2/search"]
+        assert_that(searches).is_length(1)
+        assert_that(searches[0]).starts_with('project = "PJX" AND updated >=')
+        assert_that(len(second_run)).is_less_than(len(first_run))
@@ -0,0 +1,67 @@
+import time
+from unittest import TestCase
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+
+from pyjx.api.caches.issue_cache import IssueCache
+
+
+class Issue:
+    def __init__(self, key: str, id_: str) -> None:
+        self.__key = key
+        self.__id = id_
+
+    def key(self):
+        return self.__key
+
+    def id(self):
+        return self.__id
+
+
+class TestIssueCache(TestCase):
+    def test_get_by_key_or_id(self):
+        cache = IssueCache()
+        issue = Issue("PJX-1", "10001")
+        cache.put(issue)
+
+        assert_that(cache.get("PJX-1")).is_same_as(issue)
+        assert_that(cache.get("pjx-1")).is_same_as(issue)
+        assert_that(cache.get("10001")).is_same_as(issue)
+        assert_that(cache.get("PJX-2")).is_none()
+        assert_that(cache.stats()).is_equal_to({"hits": 3, "misses": 1, "size": 1})
+
+    def test_entries_expire_after_ttl(self):
+        cache = IssueCache(ttl=0.05)
+        cache.put(Issue("PJX-1", "10001"))
+        time.sleep(0.1)
+
+        assert_that(cache.get("PJX-1")).is_none()
+        assert_that(cache).is_length(0)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = IssueCache(max_size=2)
+        cache.put(Issue("PJX-1", "10001"))
+        cache.put(Issue("PJX-2", "10002"))
+        cache.get("PJX-1")
+        cache.put(Issue("PJX-3", "10003"))
+
+        assert_that(cache.get("PJX-2")).is_none()
+        assert_that(cache.get("10002")).is_none()
+        assert_that(cache.get("PJX-1")).is_not_none()
+        assert_that(cache.get("PJX-3")).is_not_none()
+
+    def test_invalidate_by_id(self):
+        cache = IssueCache()
+        cache.put(Issue("PJX-1", "10001"))
+        cache.invalidate("10001")
+
+        assert_that(cache.get("PJX-1")).is_none()
+
+    def test_zero_size_disables_cache(self):
+        cache = IssueCache(max_size=0)
+        cache.put(Issue("PJX-1", "10001"))
+
+        assert_that(cache.get("PJX-1")).is_none()
@@ -0,0 +1,386 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.factories.issue_factory import IssueFactory, ALL_FIELDS, WORKFLOW_FIELDS
+from pyjx.api.concurrency import AdaptiveLimit
+from pyjx.models.test import Test
+from pyjx.models.test_set import TestSet
+from pyjx.observers.base_report_observer import BaseReportObserver
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+class MessageObserver(BaseReportObserver):
+    def __init__(self) -> None:
+        self.messages = []
+
+    def update(self, issue, message, timestamp):
+        self.messages.append(message)
+
+
+class TestIssueFactoryBulk(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+        self.factory = IssueFactory()
+
+    def tearDown(self):
+        Client.close()
+        self.server.stop()
+
+    def test_bulk_get_builds_issues_from_search_payload(self):
+        self.server.route("GET", r"rest/api/2/search", body={"issues": [
+            issue_payload("PJX-1"),
+            issue_payload("PJX-2", issuetype="Test Set")
+        ]})
+
+        issues = self.factory.bulk_get(["PJX-1", "PJX-2"])
+
+        assert_that(issues[0]).is_instance_of(Test)
+        assert_that(issues[1]).is_instance_of(TestSet)
+        assert_that(issues[1].summary()).is_equal_to("Summary PJX-2")
+        assert_that(self.server.requests).is_length(1)
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/.*")).is_empty()
+
+    def test_bulk_get_passes_projection_through(self):
+        self.server.route("GET", r"rest/api/2/search", body={"issues": [issue_payload("PJX-1")]})
+
+        self.factory.bulk_get(["PJX-1"], fields=["summary", "labels"], expand=["changelog"])
+
+        query = self.server.requests[0].query
+        assert_that(query["jql"]).is_equal_to(["id in (PJX-1)"])
+        assert_that(query["fields"]).is_equal_to(["issuetype,summary,labels"])
+        assert_that(query["expand"]).is_equal_to(["changelog"])
+
+    def route_paged_search(self, total: int, max_results_cap: int = 1000):
+        issues = [issue_payload(f"PJX-{number}") for number in range(1, total + 1)]
+
+        def handler(request):
+            start_at = int(request.query["startAt"][0])
+            max_results = min(int(request.query["maxResults"][0]), max_results_cap)
+            page = issues[start_at:start_at + max_results]
+            return 200, {"startAt": start_at, "maxResults": max_results, "total": total, "issues": page}, {}
+
+        self.server.route("GET", r"rest/api/2/search", handler=handler)
+
+    def test_search_walks_every_page(self):
+        self.route_paged_search(total=120)
+
+        issues = list(self.factory.search('project = "PJX"', page_size=50))
+
+        assert_that([issue.key() for issue in issues]).is_equal_to([f"PJX-{number}" for number in range(1, 121)])
+        assert_that([request.query["startAt"][0] for request in self.server.requests]).is_equal_to(["0", "50", "100"])
+
+    def test_search_advances_by_page_length_when_jira_caps_max_results(self):
+        self.route_paged_search(total=100, max_results_cap=40)
+
+        issues = list(self.factory.search('project = "PJX"', page_size=100))
+
+        assert_that(issues).is_length(100)
+        assert_that([request.query["startAt"][0] for request in self.server.requests]).is_equal_to(["0", "40", "80"])
+
+    def test_search_is_lazy(self):
+        self.route_paged_search(total=120)
+
+        issues = self.factory.search('project = "PJX"', page_size=50)
+        first = next(issues)
+
+        assert_that(first.key()).is_equal_to("PJX-1")
+        assert_that(self.server.requests).is_length(1)
+        issues.close()
+
+    def test_search_prefetches_next_page(self):
+        self.route_paged_search(total=120)
+
+        issues = self.factory.search('project = "PJX"', page_size=50, prefetch=True)
+        next(issues)
+        issues.close()
+
+        assert_that([request.query["startAt"][0] for request in self.server.requests]).is_equal_to(["0", "50"])
+
+    def test_bulk_get_reads_every_page(self):
+        self.route_paged_search(total=75)
+
+        issues = self.factory.bulk_get([f"PJX-{number}" for number in range(1, 76)])
+
+        assert_that(issues).is_length(75)
+
+    def test_bulk_get_splits_large_key_lists_and_keeps_order(self):
+        def handler(request):
+            jql = request.query["jql"][0]
+            keys = jql[len("id in ("):-1].split(",")
+            return 200, {"total": len(keys), "issues": [issue_payload(key) for key in reversed(keys)]}, {}
+
+        self.server.route("GET", r"rest/api/2/search", handler=handler)
+        keys = [f"PJX-{number}" for number in range(450, 0, -1)]
+
+        issues = self.factory.bulk_get(keys)
+
+        batch_sizes = sorted(len(request.query["jql"][0].split(",")) for request in self.server.requests)
+        assert_that([issue.key() for issue in issues]).is_equal_to(keys)
+        assert_that(batch_sizes).is_equal_to([50, 200, 200])
+
+    def test_bulk_get_without_keys_sends_no_request(self):
+        assert_that(self.factory.bulk_get([])).is_empty()
+        assert_that(self.server.requests).is_empty()
+
+    def route_bulk_create(self, invalid_summaries=(), failing_summaries=()):
+        def handler(request):
+            updates = request.json()["issueUpdates"]
+            if any(update["fields"]["summary"] in failing_summaries for update in updates):
+                return 500, {"errorMessages": ["Internal server error"]}, {}
+            issues, errors = [], []
+            for index, update in enumerate(updates):
+                summary = update["fields"]["summary"]
+                if summary in invalid_summaries:
+                    errors.append({"status": 400, "elementErrors": {"errorMessages": [], "errors": {"summary": "Invalid"}}, "failedElementNumber": index})
+                else:
+                    issues.append({"key": summary})
+            if not issues:
+                return 400, {"issues": [], "errors": errors}, {}
+            return 201, {"issues": issues, "errors": errors}, {}
+
+        self.server.route("POST", r"rest/api/2/issue/bulk", handler=handler)
+        self.server.route_search_by_keys()
+
+    def test_bulk_create_splits_into_batches_of_fifty(self):
+        self.route_bulk_create()
+        keys = [f"PJX-{number}" for number in range(1, 121)]
+
+        issues = self.factory.bulk_create({"issueUpdates": [{"fields": {"summary": key}} for key in keys]})
+
+        batch_sizes = sorted(len(request.json()["issueUpdates"]) for request in self.server.requests_to("POST", r"rest/api/2/issue/bulk"))
+        assert_that([issue.key() for issue in issues]).is_equal_to(keys)
+        assert_that(batch_sizes).is_equal_to([20, 50, 50])
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/.*")).is_empty()
+        assert_that(issues.errors()).is_empty()
+
+    def test_bulk_create_collects_partial_errors(self):
+        self.route_bulk_create(invalid_summaries={"PJX-3", "PJX-52"})
+        keys = [f"PJX-{number}" for number in range(1, 61)]
+
+        issues = self.factory.bulk_create({"issueUpdates": [{"fields": {"summary": key}} for key in keys]})
+
+        errors = issues.errors()
+        assert_that([issue.key() for issue in issues]).is_equal_to([key for key in keys if key not in {"PJX-3", "PJX-52"}])
+        assert_that(sorted(error["index"] for error in errors)).is_equal_to([2, 51])
+        assert_that(errors[0]["errors"]["errors"]).is_equal_to({"summary": "Invalid"})
+
+    def test_bulk_create_records_rejected_batch(self):
+        self.route_bulk_create(invalid_summaries={"PJX-1", "PJX-2"})
+
+        issues = self.factory.bulk_create({"issueUpdates": [{"fields": {"summary": "PJX-1"}}, {"fields": {"summary": "PJX-2"}}]})
+
+        assert_that(issues).is_empty()
+        assert_that([error["index"] for error in issues.errors()]).is_equal_to([0, 1])
+
+    def test_bulk_create_keeps_other_batches_when_one_fails_on_the_server(self):
+        self.route_bulk_create(failing_summaries={"PJX-60"})
+        keys = [f"PJX-{number}" for number in range(1, 61)]
+
+        issues = self.factory.bulk_create({"issueUpdates": [{"fields": {"summary": key}} for key in keys]})
+
+        assert_that([issue.key() for issue in issues]).is_equal_to(keys[:50])
+        assert_that([error["index"] for error in issues.errors()]).is_equal_to(list(range(50, 60)))
+        assert_that(issues.errors()[0]["status"]).is_equal_to(500)
+
+    def test_bulk_create_fetches_issues_missing_from_the_search_index(self):
+        self.route_bulk_create()
+        # El índice de búsqueda todavía no tiene PJX-2 ni PJX-3
+        self.server.route("GET", r"rest/api/2/search", body={"startAt": 0, "total": 1, "issues": [issue_payload("PJX-1")]})
+        self.server.route("GET", r"rest/api/2/issue/PJX-2", body=issue_payload("PJX-2"))
+        self.server.route("GET", r"rest/api/2/issue/PJX-3", status=404, body={"errorMessages": ["Issue Does Not Exist"]})
+
+        issues = self.factory.bulk_create({"issueUpdates": [{"fields": {"summary": key}} for key in ["PJX-1", "PJX-2", "PJX-3"]]})
+
+        assert_that([issue.key() for issue in issues]).is_equal_to(["PJX-1", "PJX-2"])
+        assert_that(issues.errors()).is_length(1)
+        assert_that(issues.errors()[0]).contains_entry({"index": 2}, {"key": "PJX-3"}, {"status": 404})
+
+    def test_bulk_clone_pairs_clones_with_sources_after_partial_errors(self):
+        self.route_bulk_create(invalid_summaries={"PJX-11"})
+        self.server.route("POST", r"rest/api/2/issueLink", status=201, body="")
+
+        clones = self.factory.bulk_clone({
+            "PJX-1": {"fields": {"summary": "PJX-11"}},
+            "PJX-2": {"fields": {"summary": "PJX-12"}}
+        })
+
+        links = [request.json() for request in self.server.requests_to("POST", r"rest/api/2/issueLink")]
+        assert_that([clone.key() for clone in clones]).is_equal_to(["PJX-12"])
+        assert_that([error["index"] for error in clones.errors()]).is_equal_to([0])
+        assert_that([(link["inwardIssue"]["key"], link["outwardIssue"]["key"]) for link in links]).is_equal_to([("PJX-2", "PJX-12")])
+
+    def test_bulk_clone_links_concurrently_and_collects_link_errors(self):
+        self.route_bulk_create()
+        in_flight, observed = [0], []
+
+        def link_handler(request):
+            with self.server.lock:
+                in_flight[0] += 1
+                observed.append(in_flight[0])
+            time.sleep(0.02)
+            with self.server.lock:
+                in_flight[0] -= 1
+            if request.json()["inwardIssue"]["key"] == "PJX-3":
+                return 404, {"errorMessages": ["Issue does not exist"], "errors": {}}, {}
+            return 201, "", {}
+
+        self.server.route("POST", r"rest/api/2/issueLink", handler=link_handler)
+        factory = IssueFactory(limit=AdaptiveLimit(initial=4, max_limit=4))
+
+        clones = factory.bulk_clone({f"PJX-{number}": {"fields": {"summary": f"PJX-{number + 100}"}} for number in range(1, 21)})
+
+        assert_that(clones).is_length(20)
+        assert_that(self.server.requests_to("POST", r"rest/api/2/issueLink")).is_length(20)
+        assert_that(max(observed)).is_between(2, 4)
+        assert_that(clones.link_errors()).is_equal_to([{
+            "inward": "PJX-3",
+            "outward": "PJX-103",
+            "status": 404,
+            "errors": {"errorMessages": ["Issue does not exist"], "errors": {}}
+        }])
+
+    def test_clone_records_link_error_without_failing(self):
+        self.server.route("POST", r"rest/api/2/issue", status=201, body={"key": "PJX-11"})
+        self.server.route("GET", r"rest/api/2/issue/PJX-11", body=issue_payload("PJX-11"))
+        self.server.route("POST", r"rest/api/2/issueLink", status=400, body={"errorMessages": ["No link issue type named 'Duplicate'"]})
+
+        observer = MessageObserver()
+        self.factory.register_observer(observer)
+
+        clone = self.factory.clone("PJX-1", {"fields": {"summary": "Clone"}})
+
+        assert_that(clone.key()).is_equal_to("PJX-11")
+        assert_that(observer.messages).contains("Error al enlazar PJX-11 con PJX-1: No link issue type named 'Duplicate'")
+
+    def test_concurrent_bulk_operations_keep_their_own_errors(self):
+        self.route_bulk_create(invalid_summaries={"PJX-3"})
+        self.server.route("POST", r"rest/api/2/issueLink", status=201, body="")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            created = executor.submit(self.factory.bulk_create, {"issueUpdates": [{"fields": {"summary": "PJX-3"}}, {"fields": {"summary": "PJX-4"}}]})
+            clones = executor.submit(self.factory.bulk_clone, {"PJX-1": {"fields": {"summary": "PJX-5"}}})
+
+        assert_that([error["index"] for error in created.result().errors()]).is_equal_to([0])
+        assert_that(clones.result().errors()).is_empty()
+        assert_that([clone.key() for clone in clones.result()]).is_equal_to(["PJX-5"])
+
+    def test_repeated_reads_are_served_from_cache(self):
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", issuetype="Test Set"))
+        self.server.route_search_by_keys()
+
+        first = self.factory.get("PJX-1")
+        second = self.factory.get("PJX-1")
+        issues = self.factory.bulk_get(["PJX-2", "PJX-1", "PJX-3"])
+
+        assert_that(second).is_same_as(first)
+        assert_that([issue.key() for issue in issues]).is_equal_to(["PJX-2", "PJX-1", "PJX-3"])
+        assert_that(issues[1]).is_same_as(first)
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/PJX-1")).is_length(1)
+        assert_that(self.server.requests_to("GET", r"rest/api/2/search")[0].query["jql"]).is_equal_to(["id in (PJX-2,PJX-3)"])
+        assert_that(self.factory.cache().hits()).is_equal_to(2)
+
+    def test_get_passes_projection_through(self):
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1"))
+
+        issue = self.factory.get("PJX-1", fields=["summary"], expand=["changelog"])
+
+        query = self.server.requests[0].query
+        assert_that(query["fields"]).is_equal_to(["issuetype,summary"])
+        assert_that(query["expand"]).is_equal_to(["changelog"])
+        assert_that(issue.is_partial()).is_true()
+
+    def test_default_projection_loads_missing_fields_on_demand(self):
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", handler=lambda request: (
+            200,
+            issue_payload("PJX-1", labels=["regression"]) if "fields" not in request.query else issue_payload("PJX-1"),
+            {}
+        ))
+        factory = IssueFactory(default_fields=WORKFLOW_FIELDS)
+
+        issue = factory.get("PJX-1")
+
+        assert_that(issue.summary()).is_equal_to("Summary PJX-1")
+        assert_that(self.server.requests).is_length(1)
+        assert_that(issue.field("labels")).is_equal_to(["regression"])
+        assert_that(issue.field("labels")).is_equal_to(["regression"])
+        assert_that(issue.is_partial()).is_false()
+        assert_that(self.server.requests).is_length(2)
+
+    def test_cached_partial_issue_is_refetched_for_wider_projection(self):
+        self.server.route_search_by_keys()
+        factory = IssueFactory(default_fields=WORKFLOW_FIELDS)
+
+        partial = factory.bulk_get(["PJX-1"])[0]
+        again = factory.bulk_get(["PJX-1"], fields=["summary"])[0]
+        full = factory.bulk_get(["PJX-1"], fields=ALL_FIELDS)[0]
+
+        assert_that(again).is_same_as(partial)
+        assert_that(full.is_partial()).is_false()
+        searches = self.server.requests_to("GET", r"rest/api/2/search")
+        assert_that(searches).is_length(2)
+        assert_that(searches[0].query["fields"]).is_equal_to(["issuetype,summary"])
+        assert_that(searches[1].query["fields"]).is_equal_to(["*all"])
+
+    def test_bulk_get_without_projection_asks_for_all_fields(self):
+        self.server.route_search_by_keys()
+
+        issue = IssueFactory().bulk_get(["PJX-1"])[0]
+
+        assert_that(self.server.requests_to("GET", r"rest/api/2/search")[0].query["fields"]).is_equal_to(["*all"])
+        assert_that(issue.is_partial()).is_false()
+
+    def test_collection_tests_are_lazy_proxies_loaded_in_one_batch(self):
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", issuetype="Test Set"))
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-1/test", body=[
+            {"id": 10002, "key": "PJX-2", "rank": 1},
+            {"id": 10003, "key": "PJX-3", "rank": 2},
+            {"id": 10004, "key": "PJX-4", "rank": 3}
+        ])
+        self.server.route_search_by_keys()
+
+        tests = self.factory.get("PJX-1").tests()
+
+        assert_that([test.key() for test in tests]).is_equal_to(["PJX-2", "PJX-3", "PJX-4"])
+        assert_that([test.id() for test in tests]).is_equal_to(["10002", "10003", "10004"])
+        assert_that(tests[0]).is_instance_of(Test)
+        assert_that(self.server.requests_to("GET", r"rest/api/2/search")).is_empty()
+
+        assert_that(tests[1].summary()).is_equal_to("Summary PJX-3")
+        assert_that([test.summary() for test in tests]).is_equal_to(["Summary PJX-2", "Summary PJX-3", "Summary PJX-4"])
+
+        searches = self.server.requests_to("GET", r"rest/api/2/search")
+        assert_that(searches).is_length(1)
+        assert_that(searches[0].query["jql"]).is_equal_to(["id in (PJX-2,PJX-3,PJX-4)"])
+        assert_that(self.factory.get("PJX-3")).is_same_as(tests[1])
+
+    def test_mutations_invalidate_cached_issues(self):
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", issuetype="Test Set"))
+        self.server.route("GET", r"rest/api/2/issue/PJX-2", body=issue_payload("PJX-2"))
+        self.server.route("PUT", r"rest/api/2/issue/PJX-2", status=204, body="")
+        self.server.route("POST", r"rest/raven/1.0/api/testset/PJX-1/test", status=200, body="")
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-1/test", body=[{"key": "PJX-2"}])
+        self.server.route_search_by_keys()
+
+        test_set = self.factory.get("PJX-1")
+        test = self.factory.get("PJX-2")
+        test_set.add(["PJX-2"])
+
+        assert_that(self.factory.get("PJX-1")).is_not_same_as(test_set)
+
+        test = self.factory.get("PJX-2")
+        test.update({"fields": {"summary": "New summary"}})
+
+        assert_that(self.factory.get("PJX-2")).is_not_same_as(test)
+        # La membresía del Test Set solo trae la clave, por lo que el get completo después de `add` va a Jira
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/PJX-2")).is_length(3)
@@ -0,0 +1,170 @@
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.caches.issue_store import IssueStore, project_scope
+from pyjx.api.factories.issue_factory import IssueFactory
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+SCOPE = 'project = "PJX"'
+
+
+class TestIssueStore(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "issues.sqlite3")
+        self.server = StubJiraServer().start()
+        self.server.route_search_by_keys()
+        self.server.route_server_clock()
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", updated="2024-05-01T10:00:00.000-0600"))
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+
+    def tearDown(self):
+        Client.close()
+        self.server.stop()
+        self.directory.cleanup()
+
+    def run_factory(self, action):
+        store = IssueStore(self.path, scope=SCOPE)
+        factory = IssueFactory(store=store)
+        store.sync(factory)
+        result = action(factory)
+        store.close()
+        return result
+
+    def test_warm_run_reads_from_disk(self):
+        self.run_factory(lambda factory: (factory.get("PJX-1"), factory.bulk_get(["PJX-2", "PJX-3"])))
+        self.server.requests.clear()
+
+        issues = self.run_factory(lambda factory: [factory.get("PJX-1"), *factory.bulk_get(["PJX-3", "PJX-2", "PJX-4"])])
+
+        assert_that([issue.key() for issue in issues]).is_equal_to(["PJX-1", "PJX-3", "PJX-2", "PJX-4"])
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/.*")).is_empty()
+        search_jqls = [request.query["jql"][0] for request in self.server.requests_to("GET", r"rest/api/2/search")]
+        assert_that(search_jqls).contains("id in (PJX-4)")
+
+    def test_sync_refreshes_issues_updated_since_last_sync(self):
+        self.run_factory(lambda factory: factory.get("PJX-1"))
+        self.server.route("GET", r"rest/api/2/search", body={"total": 1, "issues": [issue_payload("PJX-1", summary="Changed")]})
+
+        summary = self.run_factory(lambda factory: factory.get("PJX-1").summary())
+
+        jql = self.server.requests_to("GET", r"rest/api/2/search")[0].query["jql"][0]
+        assert_that(summary).is_equal_to("Changed")
+        assert_that(jql).starts_with('project = "PJX" AND updated >= "')
+
+    def test_first_sync_downloads_nothing(self):
+        store = IssueStore(self.path, scope=SCOPE)
+
+        assert_that(store.sync(IssueFactory(store=store))).is_equal_to(0)
+        assert_that(self.server.requests_to("GET", r"rest/api/2/search")).is_empty()
+        assert_that(store.last_sync()).is_equal_to(datetime(2024, 5, 1, 16, 0, tzinfo=timezone.utc))
+        store.close()
+
+    def test_sync_window_uses_server_time_in_the_user_time_zone(self):
+        self.run_factory(lambda factory: factory.get("PJX-1"))
+        self.server.route_server_clock(server_time="2024-05-01T12:00:00.000-0600", time_zone="America/Bogota")
+
+        self.run_factory(lambda factory: None)
+
+        jql = self.server.requests_to("GET", r"rest/api/2/search")[0].query["jql"][0]
+        assert_that(jql).is_equal_to('project = "PJX" AND updated >= "2024/05/01 10:55"')
+
+    def test_sync_discards_issues_deleted_in_jira(self):
+        self.run_factory(lambda factory: factory.bulk_get(["PJX-2", "PJX-3"]))
+
+        def search(request):
+            jql = request.query["jql"][0]
+            keys = [key for key in jql[jql.index("id in (") + len("id in ("):jql.index(")")].split(",") if key != "PJX-3"] if "id in (" in jql else []
+            return 200, {"startAt": 0, "total": len(keys), "issues": [issue_payload(key) for key in keys]}, {}
+
+        self.server.route("GET", r"rest/api/2/search", handler=search)
+        store = IssueStore(self.path, scope=SCOPE, sweep_interval=timedelta(0))
+        store.sync(IssueFactory(store=store))
+
+        sweep = [request for request in self.server.requests_to("GET", r"rest/api/2/search") if "validateQuery" in request.query]
+        assert_that(store.get("PJX-2")).is_not_none()
+        assert_that(store.get("PJX-3")).is_none()
+        assert_that(store).is_length(1)
+        assert_that(sweep[0].query["validateQuery"]).is_equal_to(["warn"])
+        store.close()
+
+    def test_unsynced_store_serves_no_reads(self):
+        store = IssueStore(self.path, scope=SCOPE)
+        store.put(issue_payload("PJX-1"))
+
+        assert_that(store.get("PJX-1")).is_none()
+        assert_that(store).is_length(1)
+        store.close()
+
+    def test_invalidated_issue_is_not_served(self):
+        store = IssueStore(self.path, scope=SCOPE)
+        factory = IssueFactory(store=store)
+        store.sync(factory)
+        factory.get("PJX-1")
+        factory.invalidate("PJX-1")
+
+        assert_that(store.get("PJX-1")).is_none()
+        store.close()
+
+    def test_projections_are_served_to_reads_they_cover(self):
+        store = IssueStore(self.path, scope=SCOPE)
+        store.sync(IssueFactory(store=store))
+        store.put(issue_payload("PJX-1", summary="Login"), fields=["issuetype", "summary"])
+
+        assert_that(store.get("PJX-1", fields=["issuetype"])["fields"]["summary"]).is_equal_to("Login")
+        assert_that(store.get("PJX-1", fields=["issuetype", "labels"])).is_none()
+        assert_that(store.get("PJX-1")).is_none()
+
+        store.put({"key": "PJX-1", "fields": {"issuetype": {"name": "Test"}, "labels": ["smoke"]}}, fields=["issuetype", "labels"])
+
+        assert_that(store.get("PJX-1", fields=["summary", "labels"])["fields"]).contains_entry({"summary": "Login"}, {"labels": ["smoke"]})
+        store.close()
+
+    def test_projected_reads_are_stored_for_the_next_run(self):
+        self.run_factory(lambda factory: factory.bulk_get(["PJX-2", "PJX-3"], fields=["summary"]))
+        self.server.requests.clear()
+
+        issues = self.run_factory(lambda factory: factory.bulk_get(["PJX-2", "PJX-3"], fields=["summary"]))
+
+        assert_that([issue.key() for issue in issues]).is_equal_to(["PJX-2", "PJX-3"])
+        assert_that([request.query["jql"][0] for request in self.server.requests_to("GET", r"rest/api/2/search")]).does_not_contain("id in (PJX-2,PJX-3)")
+
+    def sweeps(self) -> list:
+        return [request for request in self.server.requests_to("GET", r"rest/api/2/search") if "validateQuery" in request.query]
+
+    def test_deleted_issues_are_searched_once_per_interval(self):
+        self.run_factory(lambda factory: factory.bulk_get(["PJX-2", "PJX-3"]))
+        self.run_factory(lambda factory: None)
+
+        assert_that(self.sweeps()).is_empty()
+
+        self.server.route_server_clock(server_time="2024-05-02T11:00:00.000-0600")
+        self.run_factory(lambda factory: None)
+        self.run_factory(lambda factory: None)
+
+        assert_that(self.sweeps()).is_length(1)
+
+    def test_a_new_scope_discards_the_stored_issues(self):
+        self.run_factory(lambda factory: factory.bulk_get(["PJX-2", "PJX-3"]))
+        self.server.requests.clear()
+        store = IssueStore(self.path, scope=project_scope(["ABC-1", "PJX-2"]))
+
+        store.sync(IssueFactory(store=store))
+
+        assert_that(store).is_length(0)
+        assert_that(self.server.requests_to("GET", r"rest/api/2/search")).is_empty()
+        store.close()
+
+    def test_project_scope_names_the_projects_of_the_keys(self):
+        assert_that(project_scope(["PJX-1", "PJX-20"])).is_equal_to('project = "PJX"')
+        assert_that(project_scope(["PJX-1", "abc-7", None])).is_equal_to('project in ("ABC", "PJX")')
@@ -0,0 +1,76 @@
+import tempfile
+from unittest import TestCase
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+
+from pyjx.api.journal import OperationJournal, spec_digest
+
+
+class TestOperationJournal(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "pyjx.env.journal.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_resume_loads_the_completed_operations(self):
+        journal = OperationJournal(self.path)
+        journal.record("create", ref="set", key="PJX-10")
+        journal.record("link", inward="PJX-1", outward="PJX-11")
+        journal.record("add", container="PJX-10", keys=["PJX-11", "PJX-12"])
+        journal.close()
+
+        resumed = OperationJournal(self.path, resume=True)
+        resumed.close()
+
+        assert_that(resumed.created("set")).is_equal_to("PJX-10")
+        assert_that(resumed.created("execution")).is_none()
+        assert_that(resumed.linked("PJX-1", "PJX-11")).is_true()
+        assert_that(resumed.added("PJX-10")).is_equal_to({"PJX-11", "PJX-12"})
+        assert_that([entry["op"] for entry in resumed.entries()]).is_equal_to(["start", "create", "link", "add", "resume"])
+
+    def test_resume_refuses_the_journal_of_another_spec(self):
+        journal = OperationJournal(self.path, spec=spec_digest({"plan": "PJX-1"}))
+        journal.record("create", ref="set", key="PJX-10")
+        journal.close()
+
+        self.assertRaises(ValueError, OperationJournal, self.path, resume=True, spec=spec_digest({"plan": "PJX-2"}))
+
+        resumed = OperationJournal(self.path, resume=True, spec=spec_digest({"auth": {"username": "other"}, "plan": "PJX-1"}))
+        resumed.close()
+
+        assert_that(resumed.created("set")).is_equal_to("PJX-10")
+
+    def test_a_new_run_ignores_the_previous_ones(self):
+        journal = OperationJournal(self.path)
+        journal.record("create", ref="set", key="PJX-10")
+        journal.close()
+        OperationJournal(self.path).close()
+
+        resumed = OperationJournal(self.path, resume=True)
+        resumed.close()
+
+        assert_that(resumed.created("set")).is_none()
+
+    def test_a_truncated_line_is_skipped(self):
+        journal = OperationJournal(self.path)
+        journal.record("create", ref="create:0:Login", key="PJX-20")
+        journal.close()
+
+        with open(self.path, mode="a", encoding="utf-8") as journal_file:
+            journal_file.write('{"op": "create", "ref": "create:1:Lo')
+
+        resumed = OperationJournal(self.path, resume=True)
+        resumed.close()
+
+        assert_that(resumed.created("create:0:Login")).is_equal_to("PJX-20")
+        assert_that(resumed.created("create:1:Logout")).is_none()
+
+        resumed_again = OperationJournal(self.path, resume=True)
+        resumed_again.close()
+
+        assert_that([entry["op"] for entry in resumed_again.entries()]).is_equal_to(["start", "create", "resume", "resume"])
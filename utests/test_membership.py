@@ -0,0 +1,90 @@
+import time
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.factories.issue_factory import IssueFactory
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+class TestMembership(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", issuetype="Test Set"))
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-1/test", body=[
+            {"id": 10002, "key": "PJX-2"},
+            {"id": 10003, "key": "PJX-3"}
+        ])
+        self.server.route("POST", r"rest/raven/1.0/api/testset/PJX-1/test", status=200, body="")
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+
+    def tearDown(self):
+        Client.close()
+        self.server.stop()
+
+    def membership_requests(self) -> list:
+        return self.server.requests_to("GET", r"rest/raven/1.0/api/testset/PJX-1/test")
+
+    def test_membership_is_fetched_once(self):
+        test_set = IssueFactory().get("PJX-1")
+
+        for _ in range(10):
+            test_set.tests()
+            test_set.test_keys()
+            test_set.test_count()
+
+        assert_that(test_set.test_keys()).is_equal_to(["PJX-2", "PJX-3"])
+        assert_that(self.membership_requests()).is_length(1)
+
+    def test_count_does_not_require_a_previous_call(self):
+        assert_that(IssueFactory().get("PJX-1").test_count()).is_equal_to(2)
+
+    def test_add_and_remove_apply_deltas_locally(self):
+        test_set = IssueFactory().get("PJX-1")
+        test_set.tests()
+
+        test_set.add(["PJX-4", "PJX-2"])
+        assert_that(test_set.test_keys()).is_equal_to(["PJX-2", "PJX-3", "PJX-4"])
+
+        test_set.remove(["pjx-2"])
+        assert_that(test_set.test_keys()).is_equal_to(["PJX-3", "PJX-4"])
+
+        assert_that(self.membership_requests()).is_length(1)
+        assert_that(self.server.requests_to("GET", r"rest/api/2/.*")).is_length(1)
+
+    def test_add_with_errors_falls_back_to_refetch(self):
+        self.server.route("POST", r"rest/raven/1.0/api/testset/PJX-1/test", body=["Issue PJX-9 is not a Test"])
+        test_set = IssueFactory().get("PJX-1")
+        test_set.tests()
+
+        test_set.add(["PJX-9"])
+        test_set.tests()
+
+        assert_that(test_set.test_keys()).is_equal_to(["PJX-2", "PJX-3"])
+        assert_that(self.membership_requests()).is_length(2)
+
+    def test_refresh_refetches_membership(self):
+        test_set = IssueFactory().get("PJX-1")
+        test_set.tests()
+
+        test_set.refresh()
+        test_set.tests()
+
+        assert_that(self.membership_requests()).is_length(2)
+
+    def test_membership_expires_after_ttl(self):
+        test_set = IssueFactory(membership_ttl=0.05).get("PJX-1")
+
+        test_set.tests()
+        test_set.tests()
+        time.sleep(0.06)
+        test_set.tests()
+
+        assert_that(self.membership_requests()).is_length(2)
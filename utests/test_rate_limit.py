@@ -0,0 +1,102 @@
+import time
+import asyncio
+from unittest import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.async_client import AsyncClient
+from pyjx.api.rate_limit import RateLimiter, TokenBucket
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+class TestTokenBucket(TestCase):
+    def test_burst_is_served_without_waiting(self):
+        bucket = TokenBucket(rate=1, burst=5)
+
+        waits = [bucket.try_acquire() for _ in range(6)]
+
+        assert_that(waits[:5]).is_equal_to([0.0] * 5)
+        assert_that(waits[5]).is_greater_than(0)
+
+    def test_sustained_rate_is_enforced_across_threads(self):
+        bucket = TokenBucket(rate=50, burst=5)
+        started_at = time.monotonic()
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda _: bucket.acquire(), range(30)))
+
+        # 5 de ráfaga + 25 a 50/s
+        assert_that(time.monotonic() - started_at).is_greater_than_or_equal_to(0.45)
+
+    def test_invalid_configuration(self):
+        assert_that(TokenBucket).raises(ValueError).when_called_with(0, 1)
+        assert_that(TokenBucket).raises(ValueError).when_called_with(1, 0)
+
+
+class TestRateLimiter(TestCase):
+    def test_buckets_are_selected_by_longest_prefix(self):
+        default = TokenBucket(rate=10)
+        xray = TokenBucket(rate=5)
+        xray_import = TokenBucket(rate=1)
+        limiter = RateLimiter(default, {"rest/raven/1.0": xray, "rest/raven/1.0/import": xray_import})
+
+        assert_that(limiter.bucket("rest/api/2/issue")).is_equal_to(("default", default))
+        assert_that(limiter.bucket("/rest/raven/1.0/api/testexec")).is_equal_to(("rest/raven/1.0", xray))
+        assert_that(limiter.bucket("rest/raven/1.0/import/execution")).is_equal_to(("rest/raven/1.0/import", xray_import))
+        assert_that(limiter.rate("rest/raven/1.0/api")).is_equal_to(5)
+
+    def test_unlimited_by_default(self):
+        limiter = RateLimiter()
+
+        assert_that(limiter.acquire("rest/api/2/issue")).is_equal_to(0)
+        assert_that(limiter.rate("rest/api/2/issue")).is_none()
+        assert_that(limiter.stats()).is_equal_to({"default": {"requests": 1, "waited": 0.0}})
+
+
+class TestClientRateLimit(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1"))
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-1/test", body=[])
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+        AsyncClient.configure()
+
+    def tearDown(self):
+        Client.configure_rate_limit(RateLimiter())
+        AsyncClient.close()
+        Client.close()
+        self.server.stop()
+
+    def test_requests_take_tokens_from_their_bucket(self):
+        Client.configure_rate_limit(RateLimiter(TokenBucket(rate=100, burst=10), {"rest/raven/1.0": TokenBucket(rate=5, burst=2)}))
+
+        Client.get("rest/api/2/issue/PJX-1")
+        started_at = time.monotonic()
+        for _ in range(4):
+            Client.get("rest/raven/1.0/api/testset/PJX-1/test")
+
+        assert_that(time.monotonic() - started_at).is_greater_than_or_equal_to(0.3)
+        stats = Client.rate_limit_stats()
+        assert_that(stats["default"]["requests"]).is_equal_to(1)
+        assert_that(stats["rest/raven/1.0"]["requests"]).is_equal_to(4)
+        assert_that(stats["rest/raven/1.0"]["waited"]).is_greater_than(0)
+
+    def test_limit_is_shared_by_asyncio_tasks(self):
+        Client.configure_rate_limit(RateLimiter(TokenBucket(rate=40, burst=2)))
+
+        async def run():
+            await asyncio.gather(*[AsyncClient.get("rest/api/2/issue/PJX-1") for _ in range(10)])
+
+        started_at = time.monotonic()
+        asyncio.run(run())
+
+        assert_that(time.monotonic() - started_at).is_greater_than_or_equal_to(0.18)
+        assert_that(self.server.requests).is_length(10)
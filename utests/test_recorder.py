@@ -0,0 +1,58 @@
+from unittest import TestCase
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+
+from pyjx.api.rate_limit import RateLimiter, TokenBucket
+from pyjx.api.recorder import RequestRecorder, endpoint
+
+
+class TestRequestRecorder(TestCase):
+    def test_endpoints_group_keys_and_ids(self):
+        assert_that(endpoint("GET", "rest/api/2/issue/PJX-5")).is_equal_to("GET rest/api/2/issue/{key}")
+        assert_that(endpoint("PUT", "rest/raven/1.0/api/testrun/502/status")).is_equal_to("PUT rest/raven/1.0/api/testrun/{id}/status")
+        assert_that(endpoint("POST", "rest/api/2/issue/bulk")).is_equal_to("POST rest/api/2/issue/bulk")
+
+    def test_created_issues_can_be_read_and_searched(self):
+        recorder = RequestRecorder()
+
+        created = recorder.intercept("POST", "rest/api/2/issue", {"json": {"fields": {"summary": "Set", "issuetype": {"name": "Test Set"}}}}).json()
+        issue = recorder.intercept("GET", f"rest/api/2/issue/{created['key']}", {}).json()
+        page = recorder.intercept("GET", "rest/api/2/search", {"params": {"jql": f"id in ({created['key']})", "startAt": 0}}).json()
+
+        assert_that(created["key"]).is_equal_to("PLANNED-1")
+        assert_that(issue["fields"]["issuetype"]).is_equal_to({"name": "Test Set"})
+        assert_that(page["issues"]).is_equal_to([issue])
+        assert_that(recorder.intercept("GET", "rest/raven/1.0/api/testset/PLANNED-1/test", {}).json()).is_empty()
+
+    def test_reads_of_existing_issues_are_sent(self):
+        recorder = RequestRecorder()
+
+        assert_that(recorder.intercept("GET", "rest/api/2/issue/PJX-1", {})).is_none()
+        assert_that(recorder.intercept("GET", "rest/api/2/search", {"params": {"jql": "id in (PJX-1,PLANNED-1)"}})).is_none()
+        assert_that(recorder.intercept("PUT", "rest/raven/1.0/api/testrun/1/status", {"params": {"status": "PASS"}})).is_not_none()
+        assert_that(recorder.counts()).is_equal_to({
+            "GET rest/api/2/issue/{key}": {"sent": 1, "recorded": 0},
+            "GET rest/api/2/search": {"sent": 1, "recorded": 0},
+            "PUT rest/raven/1.0/api/testrun/{id}/status": {"sent": 0, "recorded": 1}
+        })
+        assert_that(recorder.fetched_keys()).is_equal_to(["PJX-1", "PLANNED-1"])
+
+    def test_estimate_uses_each_bucket_rate_and_burst(self):
+        recorder = RequestRecorder()
+
+        for _ in range(25):
+            recorder.intercept("POST", "rest/api/2/issueLink", {"data": "{}"})
+
+        for _ in range(12):
+            recorder.intercept("POST", "rest/raven/1.0/api/testset/PJX-1/test", {"json": {"add": ["PJX-2"]}})
+
+        estimate = recorder.estimate(RateLimiter(TokenBucket(rate=10, burst=5), {"rest/raven/1.0": TokenBucket(rate=1, burst=2)}))
+
+        assert_that(estimate).is_equal_to({
+            "default": {"requests": 25, "rate": 10, "seconds": 2.0},
+            "rest/raven/1.0": {"requests": 12, "rate": 1, "seconds": 10.0}
+        })
+        assert_that(RequestRecorder().estimate(RateLimiter())).is_empty()
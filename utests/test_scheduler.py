@@ -0,0 +1,88 @@
+import time
+from threading import Lock
+from unittest import TestCase
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+
+from pyjx.workflows.scheduler import TaskGraph
+
+
+def sleeping(seconds: float, result=None):
+    def task(*_):
+        time.sleep(seconds)
+        return result
+
+    return task
+
+
+class TestTaskGraph(TestCase):
+    def test_results_of_dependencies_are_passed_in_order(self):
+        graph = TaskGraph()
+        graph.add("a", lambda: 2)
+        graph.add("b", lambda: 3)
+        graph.add("c", lambda b, a: b - a, depends_on=["b", "a"])
+
+        assert_that(graph.run()).is_equal_to({"a": 2, "b": 3, "c": 1})
+
+    def test_independent_tasks_run_concurrently(self):
+        graph = TaskGraph()
+
+        for name in ("plan", "execution", "set"):
+            graph.add(name, sleeping(0.2))
+
+        graph.add("link", sleeping(0.1), depends_on=["plan", "execution", "set"])
+
+        started_at = time.perf_counter()
+        graph.run()
+
+        assert_that(time.perf_counter() - started_at).is_less_than(0.5)
+
+    def test_critical_path_is_the_longest_chain(self):
+        graph = TaskGraph()
+        graph.add("plan", sleeping(0.05))
+        graph.add("set", sleeping(0.2))
+        graph.add("tests", sleeping(0.1))
+        graph.add("set.add", sleeping(0.05), depends_on=["set", "tests"])
+        graph.add("plan.add", sleeping(0.01), depends_on=["plan", "set.add"])
+
+        graph.run()
+        critical_path = graph.critical_path()
+
+        assert_that([name for name, _ in critical_path]).is_equal_to(["set", "set.add", "plan.add"])
+        assert_that(critical_path[0][1]).is_greater_than_or_equal_to(0.2)
+
+    def test_failure_stops_dependents_and_is_raised(self):
+        executed = []
+        lock = Lock()
+
+        def record(name):
+            def task(*_):
+                with lock:
+                    executed.append(name)
+
+            return task
+
+        def fail():
+            raise RuntimeError("sin permisos")
+
+        graph = TaskGraph()
+        graph.add("set", fail)
+        graph.add("tests", sleeping(0.05))
+        graph.add("set.add", record("set.add"), depends_on=["set", "tests"])
+        graph.add("other", record("other"), depends_on=["tests"])
+
+        assert_that(graph.run).raises(RuntimeError).when_called_with()
+        assert_that(executed).is_empty()
+        assert_that(graph.timings()).contains_key("tests")
+
+    def test_invalid_graphs_are_rejected(self):
+        graph = TaskGraph()
+        graph.add("a", lambda b: b, depends_on=["b"])
+        graph.add("b", lambda a: a, depends_on=["a"])
+
+        assert_that(graph.run).raises(ValueError).when_called_with()
+        assert_that(TaskGraph().add("a", lambda x: x, depends_on=["x"]).run).raises(ValueError).when_called_with()
+        assert_that(TaskGraph().add("a", lambda: 1).add).raises(ValueError).when_called_with("a", lambda: 2)
@@ -0,0 +1,102 @@
+import json
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.streaming import JSONArrayStream
+from pyjx.api.factories.issue_factory import IssueFactory
+from pyjx.errors import ClientError
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+def chunks_of(document: str, size: int, encode: bool = True) -> list:
+    data = document.encode("utf-8") if encode else document
+    return [data[index:index + size] for index in range(0, len(data), size)]
+
+
+class TestJSONArrayStream(TestCase):
+    items = [
+        {"id": 10001, "key": "PJX-1", "rank": 1},
+        {"id": 10002, "key": "PJX-2", "summary": "Corchetes ] y [ , llaves } y \"comillas\""},
+        {"id": 10003, "key": "PJX-3", "summary": "Acentos: sesión, añadir, ✓"},
+        [1, 2.5, -3e2, None, True, False],
+        12345
+    ]
+
+    def test_items_are_decoded_across_any_chunk_boundary(self):
+        document = json.dumps(self.items)
+
+        for size in (1, 2, 3, 7, 64, len(document)):
+            assert_that(list(JSONArrayStream(chunks_of(document, size)))).is_equal_to(self.items)
+
+    def test_array_under_a_key_of_the_root_object(self):
+        document = json.dumps({"total": 3, "meta": {"tests": ["no"]}, "tests": self.items, "after": [1]})
+
+        assert_that(list(JSONArrayStream(chunks_of(document, 5), item_path="tests"))).is_equal_to(self.items)
+
+    def test_items_are_yielded_before_the_document_ends(self):
+        def chunks():
+            yield '[{"key": "PJX-1"}, '
+            raise AssertionError("se leyó más de lo necesario")
+
+        assert_that(next(iter(JSONArrayStream(chunks())))).is_equal_to({"key": "PJX-1"})
+
+    def test_empty_and_whitespace_documents(self):
+        assert_that(list(JSONArrayStream([" [ ] "]))).is_empty()
+        assert_that(list(JSONArrayStream(['{"tests": []}'], item_path="tests"))).is_empty()
+
+    def test_invalid_documents_raise_value_error(self):
+        assert_that(lambda: list(JSONArrayStream(['{"key": 1}']))).raises(ValueError).when_called_with()
+        assert_that(lambda: list(JSONArrayStream(['[{"key": 1} {"key": 2}]']))).raises(ValueError).when_called_with()
+        assert_that(lambda: list(JSONArrayStream(['[{"key": 1},']))).raises(ValueError).when_called_with()
+        assert_that(lambda: list(JSONArrayStream(['{"total": 0}'], item_path="tests"))).raises(ValueError).when_called_with()
+
+
+class TestClientStream(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+
+    def tearDown(self):
+        Client.close()
+        self.server.stop()
+
+    def test_stream_yields_every_item_of_a_large_response(self):
+        tests = [{"id": 10000 + number, "key": f"PJX-{number}", "rank": number} for number in range(20000)]
+        self.server.route("GET", r"rest/raven/1.0/api/testplan/PJX-1/test", body=tests)
+
+        streamed = list(Client.stream("rest/raven/1.0/api/testplan/PJX-1/test"))
+
+        assert_that(streamed).is_equal_to(tests)
+
+    def test_connection_is_reused_after_stream(self):
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-1/test", body=[{"key": "PJX-2"}])
+
+        list(Client.stream("rest/raven/1.0/api/testset/PJX-1/test"))
+        list(Client.stream("rest/raven/1.0/api/testset/PJX-1/test"))
+
+        assert_that(self.server.connections).is_equal_to(1)
+
+    def test_stream_raises_status_errors(self):
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-9/test", status=404, body={"errorMessages": ["Not found"]})
+
+        assert_that(lambda: list(Client.stream("rest/raven/1.0/api/testset/PJX-9/test"))).raises(ClientError).when_called_with()
+
+    def test_models_and_test_repository_use_streaming(self):
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", issuetype="Test Set"))
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-1/test", body=[{"id": 10002, "key": "PJX-2"}])
+        self.server.route("GET", r"rest/raven/1.0/api/testrepository/PJX/folders/7/tests", body={
+            "total": 2,
+            "tests": [{"id": 10003, "key": "PJX-3"}, {"id": 10004, "key": "PJX-4"}]
+        })
+        factory = IssueFactory()
+
+        assert_that(factory.get("PJX-1").test_keys()).is_equal_to(["PJX-2"])
+        assert_that([test.key() for test in factory.get_tests_from_test_repository(7)]).is_equal_to(["PJX-3", "PJX-4"])
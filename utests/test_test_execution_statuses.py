@@ -0,0 +1,163 @@
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.retry import RetryPolicy
+from pyjx.api.factories.issue_factory import IssueFactory
+from pyjx.models.test_execution import TestExecution as XrayTestExecution
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+class TestSetTestStatuses(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", issuetype="Test Execution"))
+        self.server.route("GET", r"rest/raven/1.0/api/testexec/PJX-1/test", body=[{"id": 10002, "key": "PJX-2"}])
+        self.server.route("POST", r"rest/raven/1.0/import/execution", body={"testExecIssue": {"id": "10001", "key": "PJX-1"}})
+        self.server.route("PUT", r"rest/raven/1.0/api/testrun/\d+/status", status=200, body="")
+        self.server.route("GET", r"rest/raven/1.0/api/testrun", handler=lambda request: (
+            200, {"id": 500 + int(request.query["testIssueKey"][0].split("-")[1]), "status": "TODO"}, {}
+        ))
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+        Client.configure_retry(RetryPolicy(max_retries=0))
+
+    def tearDown(self):
+        Client.configure_retry(RetryPolicy())
+        Client.close()
+        self.server.stop()
+
+    def test_factory_builds_test_executions(self):
+        assert_that(IssueFactory().get("PJX-1")).is_instance_of(XrayTestExecution)
+
+    def test_statuses_are_imported_in_batches(self):
+        factory = IssueFactory()
+        test_execution = factory.get("PJX-1")
+        test = factory.build(issue_payload("PJX-2"))
+        statuses = {test: "pass", **{f"PJX-{number}": "FAIL" for number in range(3, 8)}}
+
+        outcomes = test_execution.set_test_statuses(statuses, batch_size=4)
+
+        imports = self.server.requests_to("POST", r"rest/raven/1.0/import/execution")
+        assert_that([len(request.json()["tests"]) for request in imports]).is_equal_to([4, 2])
+        assert_that(imports[0].json()["testExecutionKey"]).is_equal_to("PJX-1")
+        assert_that(imports[0].json()["tests"][0]).is_equal_to({"testKey": "PJX-2", "status": "PASS"})
+        assert_that(list(outcomes)).is_equal_to([f"PJX-{number}" for number in range(2, 8)])
+        assert_that(outcomes["PJX-3"]).is_equal_to({"status": "FAIL", "updated": True, "via": "import", "error": None})
+        assert_that(test.test_run_status()).is_equal_to("PASS")
+        assert_that(self.server.requests_to("PUT", r".*")).is_empty()
+
+    def test_imported_tests_join_the_membership(self):
+        test_execution = IssueFactory().get("PJX-1")
+        test_execution.tests()
+
+        test_execution.set_test_statuses({"PJX-2": "PASS", "PJX-3": "FAIL"})
+
+        assert_that(test_execution.test_keys()).is_equal_to(["PJX-2", "PJX-3"])
+        assert_that(self.server.requests_to("GET", r"rest/raven/1.0/api/testexec/PJX-1/test")).is_length(1)
+
+    def test_failed_batch_falls_back_to_test_runs(self):
+        self.server.route("POST", r"rest/raven/1.0/import/execution", status=400, body={"error": "Import not allowed"})
+        factory = IssueFactory()
+        test_execution = factory.get("PJX-1")
+        test = factory.build(issue_payload("PJX-2"))
+        test.set_test_run_id(900)
+
+        outcomes = test_execution.set_test_statuses({test: "PASS", "PJX-3": "FAIL", "PJX-4": "TODO"})
+
+        puts = sorted(request.path for request in self.server.requests_to("PUT", r".*"))
+        assert_that(puts).is_equal_to([
+            "rest/raven/1.0/api/testrun/503/status",
+            "rest/raven/1.0/api/testrun/504/status",
+            "rest/raven/1.0/api/testrun/900/status"
+        ])
+        assert_that(self.server.requests_to("GET", r"rest/raven/1.0/api/testrun$")).is_length(2)
+        assert_that(outcomes["PJX-3"]).is_equal_to({"status": "FAIL", "updated": True, "via": "testrun", "error": None})
+        assert_that(test_execution.test_runs()["PJX-2"]).is_equal_to({"id": 900, "status": "PASS"})
+        assert_that(test.test_run_status()).is_equal_to("PASS")
+
+    def test_set_test_status_updates_the_test(self):
+        factory = IssueFactory()
+        test = factory.build(issue_payload("PJX-3"))
+
+        factory.get("PJX-1").set_test_status(test, "fail")
+
+        assert_that(test.test_run_status()).is_equal_to("FAIL")
+        assert_that([request.path for request in self.server.requests_to("PUT", r".*")]).is_equal_to(["rest/raven/1.0/api/testrun/503/status"])
+
+    def test_fallback_reports_errors_per_test(self):
+        self.server.route("POST", r"rest/raven/1.0/import/execution", status=500, body={"error": "Internal"})
+        self.server.route("PUT", r"rest/raven/1.0/api/testrun/504/status", status=400, body={"error": "Invalid status"})
+
+        outcomes = IssueFactory().get("PJX-1").set_test_statuses({"PJX-3": "PASS", "PJX-4": "UNKNOWN"})
+
+        assert_that(outcomes["PJX-3"]["updated"]).is_true()
+        assert_that(outcomes["PJX-4"]["updated"]).is_false()
+        assert_that(outcomes["PJX-4"]["error"]).contains("Invalid status")
+
+
+class TestTestRuns(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", issuetype="Test Execution"))
+        self.server.route("GET", r"rest/raven/1.0/api/testexec/PJX-1/test", handler=self.page_of_test_runs)
+        self.server.route("POST", r"rest/raven/1.0/import/execution", status=400, body={"error": "Import not allowed"})
+        self.server.route("PUT", r"rest/raven/1.0/api/testrun/\d+/status", status=200, body="")
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+
+    def tearDown(self):
+        Client.close()
+        self.server.stop()
+
+    @staticmethod
+    def page_of_test_runs(request):
+        limit = int(request.query["limit"][0])
+        page = int(request.query["page"][0])
+        runs = [{"id": 500 + number, "key": f"PJX-{number}", "status": "TODO", "rank": number} for number in range(2, 452)]
+
+        return 200, runs[(page - 1) * limit:page * limit], {}
+
+    def test_runs_are_resolved_in_one_paged_call(self):
+        test_runs = IssueFactory().get("PJX-1").test_runs()
+
+        assert_that(test_runs).is_length(450)
+        assert_that(test_runs["PJX-451"]).is_equal_to({"id": 951, "status": "TODO"})
+        assert_that(self.server.requests_to("GET", r"rest/raven/1.0/api/testexec/PJX-1/test")).is_length(3)
+        assert_that(self.server.requests_to("GET", r"rest/api/2/.*")).is_length(1)
+
+    def test_fallback_uses_resolved_test_runs(self):
+        test_execution = IssueFactory().get("PJX-1")
+
+        outcomes = test_execution.set_test_statuses({"PJX-2": "PASS", "PJX-3": "FAIL"})
+
+        assert_that([outcome["updated"] for outcome in outcomes.values()]).is_equal_to([True, True])
+        assert_that(self.server.requests_to("GET", r"rest/raven/1.0/api/testrun")).is_empty()
+        assert_that(sorted(request.path for request in self.server.requests_to("PUT", r".*"))).is_equal_to([
+            "rest/raven/1.0/api/testrun/502/status",
+            "rest/raven/1.0/api/testrun/503/status"
+        ])
+        assert_that(test_execution.test_runs()["PJX-3"]).is_equal_to({"id": 503, "status": "FAIL"})
+
+    def test_runs_belong_to_their_test_execution(self):
+        self.server.route("GET", r"rest/api/2/issue/PJX-900", body=issue_payload("PJX-900", issuetype="Test Execution"))
+        self.server.route("GET", r"rest/raven/1.0/api/testexec/PJX-900/test", body=[{"id": 222, "key": "PJX-2", "status": "FAIL"}])
+        self.server.route("GET", r"rest/api/2/issue/PJX-2", body=issue_payload("PJX-2"))
+        factory = IssueFactory()
+        factory.get("PJX-2")
+        test_execution = factory.get("PJX-1")
+        other_test_execution = factory.get("PJX-900")
+
+        assert_that(test_execution.tests()[0]).is_same_as(other_test_execution.tests()[0])
+
+        test_execution.set_test_statuses({"PJX-2": "PASS"})
+
+        assert_that(test_execution.test_runs()["PJX-2"]).is_equal_to({"id": 502, "status": "PASS"})
+        assert_that(other_test_execution.test_runs()["PJX-2"]).is_equal_to({"id": 222, "status": "FAIL"})
+        assert_that([request.path for request in self.server.requests_to("PUT", r".*")]).is_equal_to(["rest/raven/1.0/api/testrun/502/status"])
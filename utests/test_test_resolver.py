@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.api.factories.issue_factory import IssueFactory
+from pyjx.workflows.env.test_resolver import TestResolver as Resolver
+from pyjx.workflows.env.strategies.add_strategy import TestAdditionStrategy as AdditionStrategy
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+class TestTestResolver(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        self.server.route_search_by_keys()
+        self.server.route("GET", r"rest/api/2/issue/PJX-5", body=issue_payload("PJX-5", issuetype="Test Set"))
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-5/test", body=[{"id": 10006, "key": "PJX-6"}, {"id": 10008, "key": "PJX-8"}])
+        self.server.route("GET", r"rest/raven/1.0/api/testrepository/PJX/folders/3/tests", body={"total": 1, "tests": [{"id": 10008, "key": "PJX-8"}]})
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+
+    def tearDown(self):
+        Client.close()
+        self.server.stop()
+
+    def searched_keys(self) -> list[str]:
+        return [
+            key
+            for request in self.server.requests_to("GET", r"rest/api/2/search")
+            for key in request.query["jql"][0].split("(")[1].rstrip(")").split(",")
+        ]
+
+    def test_overlapping_sources_are_resolved_once(self):
+        resolver = Resolver(IssueFactory())
+
+        first = resolver.resolve({"set": "PJX-5", "path": 3, "keys": ["PJX-6", "PJX-7", "PJX-7"]})
+        second = resolver.resolve({"set": "PJX-5", "keys": ["PJX-7", "PJX-8"]})
+
+        assert_that([test.key() for test in first]).is_equal_to(["PJX-6", "PJX-8", "PJX-7"])
+        assert_that([test.key() for test in second]).is_equal_to(["PJX-6", "PJX-8", "PJX-7"])
+        assert_that(self.server.requests_to("GET", r"rest/raven/1.0/api/testset/PJX-5/test")).is_length(1)
+        assert_that(self.server.requests_to("GET", r"rest/api/2/issue/PJX-5")).is_length(1)
+        assert_that(self.searched_keys()).is_equal_to(["PJX-7"])
+        assert_that(resolver.stats()).is_equal_to({"sources": 2, "tests": 3, "references": 10})
+
+    def test_concurrent_strategies_share_the_resolver(self):
+        factory = IssueFactory()
+        resolver = Resolver(factory)
+        fields = {"set": "PJX-5", "keys": ["PJX-9"]}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: AdditionStrategy().tests(fields, factory, resolver), range(4)))
+
+        assert_that({tuple(test.key() for test in tests) for tests in results}).is_equal_to({("PJX-6", "PJX-8", "PJX-9")})
+        assert_that(self.server.requests_to("GET", r"rest/raven/1.0/api/testset/PJX-5/test")).is_length(1)
+        assert_that(self.searched_keys()).is_equal_to(["PJX-9"])
+
+    def test_missing_keys_are_skipped(self):
+        self.server.route("GET", r"rest/api/2/search", body={"startAt": 0, "total": 0, "issues": []})
+
+        assert_that(Resolver(IssueFactory()).resolve({"keys": ["PJX-404"]})).is_empty()
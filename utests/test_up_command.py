@@ -0,0 +1,98 @@
+import json
+import tempfile
+from argparse import Namespace
+from unittest import TestCase
+from requests.auth import HTTPBasicAuth
+from jsonschema.exceptions import ValidationError
+from assertpy import assert_that
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from pyjx.api.client import Client
+from pyjx.workflows.up.up_command import UpCommand
+from stub_jira_server import StubJiraServer, issue_payload
+
+
+class TestUpCommand(TestCase):
+    def setUp(self):
+        self.server = StubJiraServer().start()
+        self.server.route_search_by_keys()
+        self.server.route("GET", r"rest/api/2/issue/PJX-1", body=issue_payload("PJX-1", issuetype="Test Execution"))
+        self.server.route("GET", r"rest/api/2/issue/PJX-50", body=issue_payload("PJX-50", issuetype="Test Set"))
+        self.server.route("GET", r"rest/raven/1.0/api/testset/PJX-50/test", body=[{"id": 10003, "key": "PJX-3"}, {"id": 10004, "key": "PJX-4"}])
+        self.server.route("GET", r"rest/raven/1.0/api/testexec/PJX-1/test", body=[
+            {"id": 502, "key": "PJX-2", "status": "TODO"},
+            {"id": 503, "key": "PJX-3", "status": "FAIL"},
+            {"id": 504, "key": "PJX-4", "status": "TODO"},
+            {"id": 505, "key": "PJX-5", "status": "ABORTED"},
+            {"id": 506, "key": "PJX-6", "status": "TODO"}
+        ])
+        self.server.route("POST", r"rest/raven/1.0/import/execution", body={"testExecIssue": {"key": "PJX-1"}})
+        Client.configure(self.server.url, HTTPBasicAuth("user", "password"))
+        Client.configure_pool()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        Client.close()
+        self.server.stop()
+        self.directory.cleanup()
+
+    def command(self, content: dict, schema_version: int = 1) -> UpCommand:
+        path = os.path.join(self.directory.name, "pyjx.up.json")
+
+        with open(path, mode="w", encoding="utf-8") as json_file:
+            json.dump({"auth": {"username": "user", "password": "password"}, **content}, json_file)
+
+        args = Namespace(path=None, txt_reporter=False, no_console_reporter=True, schema_version=schema_version, namespace="pyjx.up.json")
+
+        return UpCommand(args, self.directory.name)
+
+    def imported(self) -> dict:
+        return {
+            test["testKey"]: test["status"]
+            for request in self.server.requests_to("POST", r"rest/raven/1.0/import/execution")
+            for test in request.json()["tests"]
+        }
+
+    def test_only_status_changes_are_pushed(self):
+        outcomes = self.command({
+            "execution": "PJX-1",
+            "status": [
+                {"value": "PASS", "keys": ["PJX-2", "PJX-9"]},
+                {"value": "FAIL", "set": "PJX-50"},
+                {"value": "PASS", "filter": "id in (PJX-5,PJX-6)"}
+            ],
+            "exclude": {"status": ["ABORTED"]}
+        }).execute()
+
+        assert_that(self.imported()).is_equal_to({"PJX-2": "PASS", "PJX-4": "FAIL", "PJX-6": "PASS"})
+        assert_that(outcomes).is_length(3)
+        assert_that(outcomes["PJX-4"]["updated"]).is_true()
+
+    def test_first_rule_wins_and_excluded_keys_are_skipped(self):
+        self.command({
+            "execution": "PJX-1",
+            "status": [
+                {"value": "PASS", "keys": ["PJX-2", "PJX-6"]},
+                {"value": "FAIL", "keys": ["PJX-2", "PJX-4"]}
+            ],
+            "exclude": {"keys": ["PJX-6"]}
+        }).execute()
+
+        assert_that(self.imported()).is_equal_to({"PJX-2": "PASS", "PJX-4": "FAIL"})
+
+    def test_invalid_file_is_rejected_before_any_request(self):
+        assert_that(self.command).raises(ValidationError).when_called_with({
+            "execution": "PJX-1",
+            "status": [{"value": "PASSED", "keys": ["PJX-2"]}]
+        })
+        assert_that(self.server.requests).is_empty()
+
+    def test_schema_version_selects_the_schema(self):
+        content = {"execution": "PJX-1", "status": [{"value": "PASS", "keys": ["PJX-2"]}]}
+
+        assert_that(self.command).raises(FileNotFoundError).when_called_with(content, schema_version=99)
+        assert_that(self.command(content, schema_version=1)).is_instance_of(UpCommand)